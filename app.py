@@ -9,7 +9,7 @@ from datetime import datetime
 import io
 import base64
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import random
 import time
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
@@ -17,6 +17,22 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score
 import warnings
+from utils.adp import pick_distributions
+from utils.ai_strategies import POSITIONS, STRATEGY_MIXES, SlotScriptStrategy, assign_strategies, build_strategies, position_codes
+from utils.bye_weeks import bye_week_planner
+from utils.data_version import data_version
+from utils.draft_board import DraftBoard
+from utils.draft_grading import grade_league, grade_percentile
+from utils.figure_cache import figure_cache
+from utils.filter_engine import filter_engine
+from utils.lookahead import LookaheadRecommender
+from utils.replacement import ReplacementEngine
+from utils.result_store import simulation_store
+from utils.rng import DEFAULT_SEED, FANTASY_DRAFT_STREAM, LOOKAHEAD_STREAM, SEASON_STREAM, STRATEGY_STREAM, generator, seed_sequence, spawn_generators
+from utils.search_index import search_index
+from utils.season import REGULAR_SEASON_WEEKS, SeasonSimulator
+from utils.similarity import similarity_index
+from utils.trades import trade_evaluator
 warnings.filterwarnings('ignore')
 
 # Page configuration
@@ -502,7 +518,8 @@ st.markdown("""
 class AdvancedFantasyAnalyzer:
     """Advanced Fantasy Football analyzer with VBD-based scoring and AI insights."""
 
-    def __init__(self):
+    def __init__(self, seed: int = DEFAULT_SEED):
+        self.seed = seed
         self.position_sheets = ['QB', 'RBs', 'WR', 'TE', 'K', 'DEF']
         self.sheet_variations = {
             'QB': ['QB', 'Quarterbacks', 'Quarterback', 'QBS'],
@@ -689,8 +706,8 @@ class AdvancedFantasyAnalyzer:
         if bye_week_col:
             df['Bye_Week'] = pd.to_numeric(df[bye_week_col], errors='coerce').fillna(0).astype(int)
         else:
-            # Assign random bye weeks if not found
-            df['Bye_Week'] = np.random.choice([4, 5, 6, 7, 9, 10, 11, 12, 13, 14], size=len(df))
+            # Unknown bye weeks stay 0, which the bye-week planner and player cards treat as unknown
+            df['Bye_Week'] = 0
 
         # Extract Points column if available
         points_col = self.find_points_column(df)
@@ -705,6 +722,11 @@ class AdvancedFantasyAnalyzer:
         else:
             df['News'] = 'No recent news'
 
+        # Extract market ADP and its spread if available (AI opponents can draft from these)
+        adp_col, adp_std_col = self.find_adp_columns(df)
+        df['ADP'] = pd.to_numeric(df[adp_col], errors='coerce') if adp_col else np.nan
+        df['ADP_Std'] = pd.to_numeric(df[adp_std_col], errors='coerce') if adp_std_col else np.nan
+
         return df
 
     def find_points_column(self, df: pd.DataFrame) -> Optional[str]:
@@ -715,6 +737,19 @@ class AdvancedFantasyAnalyzer:
                 return col
         return None
 
+    def find_adp_columns(self, df: pd.DataFrame) -> Tuple[Optional[str], Optional[str]]:
+        """Find the ADP and ADP standard deviation columns in the dataframe."""
+        adp_col = None
+        adp_std_col = None
+        for col in df.columns:
+            col_lower = str(col).lower()
+            if any(keyword in col_lower for keyword in ['adp', 'average draft', 'avg pick']):
+                if re.search(r'std|dev|sigma|spread|(^|[^a-z])sd([^a-z]|$)', col_lower):
+                    adp_std_col = adp_std_col or col
+                else:
+                    adp_col = adp_col or col
+        return adp_col, adp_std_col
+
     def calculate_advanced_rankings(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate advanced rankings using VBD values and AI insights."""
         # Clean and prepare data
@@ -1086,38 +1121,64 @@ class AdvancedFantasyAnalyzer:
             player_rank = player_data.get('Position_Rank', 0)
 
             # VBD distribution plot
-            fig = go.Figure()
-
-            fig.add_trace(go.Histogram(
-                x=position_data['VBD_Value'],
-                nbinsx=20,
-                name=f'All {position} Players',
-                opacity=0.7,
-                marker_color='rgba(102, 126, 234, 0.7)'
-            ))
-
-            fig.add_vline(
-                x=player_vbd,
-                line_dash="dash",
-                line_color="#FFD700",
-                line_width=3,
-                annotation_text=f"{player_data['Player_Name']}: {player_vbd:.1f} VBD",
-                annotation_position="top"
-            )
-
-            fig.update_layout(
-                title=f"{position} VBD Distribution",
-                xaxis_title="VBD Score",
-                yaxis_title="Number of Players",
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white'),
-                showlegend=False,
-                height=400
-            )
-
+            def build_fig():
+                fig = go.Figure()
+                
+                fig.add_trace(go.Histogram(
+                    x=position_data['VBD_Value'],
+                    nbinsx=20,
+                    name=f'All {position} Players',
+                    opacity=0.7,
+                    marker_color='rgba(102, 126, 234, 0.7)'
+                ))
+                
+                fig.add_vline(
+                    x=player_vbd,
+                    line_dash="dash",
+                    line_color="#FFD700",
+                    line_width=3,
+                    annotation_text=f"{player_data['Player_Name']}: {player_vbd:.1f} VBD",
+                    annotation_position="top"
+                )
+                
+                fig.update_layout(
+                    title=f"{position} VBD Distribution",
+                    xaxis_title="VBD Score",
+                    yaxis_title="Number of Players",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white'),
+                    showlegend=False,
+                    height=400
+                )
+                return fig
+            
+            version = st.session_state.players_data_version
+            fig = figure_cache.figure('vbd_distribution', version, (player_data['Player_Name'], position, player_vbd), build_fig)
             st.plotly_chart(fig, use_container_width=True)
 
+            # Nearest neighbors by VBD profile and points
+            st.markdown("#### 🔍 Most Similar Players")
+            points_col = self.find_points_column(all_data)
+            features = tuple(col for col in ['VBD_Value', points_col, 'Adjusted_VBD', 'Predicted_VBD'] if col)
+            index = similarity_index(all_data, version, features, 'Position')
+            
+            # The query row comes from the player's index label, since names can repeat
+            if player_data.name in all_data.index and index.features:
+                neighbor_rows, distances = index.neighbors(all_data.index.get_loc(player_data.name), k=5)
+                similar_players = all_data.iloc[neighbor_rows]
+                similar_table = pd.DataFrame({
+                    'Player': similar_players['Player_Name'].to_numpy(),
+                    'Team': similar_players['Team'].to_numpy() if 'Team' in similar_players else 'UNK',
+                    'Position Rank': similar_players['Position_Rank'].to_numpy(),
+                    'VBD': similar_players['VBD_Value'].round(1).to_numpy(),
+                    'Similarity': [f"{score:.0f}%" for score in index.similarity(distances)]
+                })
+                if points_col:
+                    similar_table.insert(4, 'Points', similar_players[points_col].round(1).to_numpy())
+                st.dataframe(similar_table, use_container_width=True, hide_index=True)
+                st.caption(f"Closest {position} profiles by {', '.join(index.features)} (standardized within position).")
+            
             # Enhanced Positional Ranking Analysis
             st.markdown("#### 🏆 Positional Ranking Analysis")
             
@@ -1164,67 +1225,6 @@ class AdvancedFantasyAnalyzer:
                 st.markdown(f"<div style='text-align: center; color: {tier_color}; font-weight: bold; margin-top: 0.5rem;'>{tier}</div>", 
                            unsafe_allow_html=True)
             
-            # Positional comparison table with nearby players
-            st.markdown("#### 📋 Position Rankings Comparison")
-            
-            # Get players around this player's rank (±3 positions)
-            rank_window = 3
-            min_rank = max(1, player_rank - rank_window)
-            max_rank = min(total_position_players, player_rank + rank_window)
-            
-            nearby_players = position_data[
-                (position_data['Position_Rank'] >= min_rank) & 
-                (position_data['Position_Rank'] <= max_rank)
-            ].sort_values('Position_Rank')
-            
-            # Create comparison table
-            if len(nearby_players) > 1:
-                comparison_cols = st.columns([1, 3, 1, 1, 1])
-                
-                # Table headers
-                with comparison_cols[0]:
-                    st.markdown("**Rank**")
-                with comparison_cols[1]:
-                    st.markdown("**Player**")
-                with comparison_cols[2]:
-                    st.markdown("**Team**")
-                with comparison_cols[3]:
-                    st.markdown("**VBD**")
-                with comparison_cols[4]:
-                    st.markdown("**Draft Round**")
-                
-                st.markdown("---")
-                
-                # Player rows
-                for _, comp_player in nearby_players.iterrows():
-                    comp_cols = st.columns([1, 3, 1, 1, 1])
-                    
-                    # Highlight the current player
-                    is_current_player = comp_player['Player_Name'] == player_data['Player_Name']
-                    name_style = "**🎯 " if is_current_player else "**"
-                    name_end = "** ← YOU" if is_current_player else "**"
-                    
-                    with comp_cols[0]:
-                        rank_display = f"#{int(comp_player['Position_Rank'])}"
-                        if is_current_player:
-                            st.markdown(f"**🎯 {rank_display}**")
-                        else:
-                            st.markdown(rank_display)
-                    
-                    with comp_cols[1]:
-                        st.markdown(f"{name_style}{comp_player['Player_Name']}{name_end}")
-                    
-                    with comp_cols[2]:
-                        st.markdown(comp_player.get('Team', 'UNK'))
-                    
-                    with comp_cols[3]:
-                        vbd_val = comp_player.get('VBD_Value', 0)
-                        st.markdown(f"{vbd_val:.1f}")
-                    
-                    with comp_cols[4]:
-                        draft_round = comp_player.get('Draft_Round', 'TBD')
-                        st.markdown(f"{draft_round}")
-            
             # Additional insights
             st.markdown("#### 💡 Positional Insights")
             
@@ -1262,11 +1262,21 @@ class AdvancedFantasyAnalyzer:
 class DraftSimulator:
     """Fantasy draft simulator with AI logic and real-time features."""
 
-    def __init__(self, players_data: pd.DataFrame):
+    def __init__(self, players_data: pd.DataFrame, seed: int = DEFAULT_SEED, strategy_mix: str = STRATEGY_MIXES[0]):
         self.players_data = players_data
+        self.seed = seed
+        self.team_rngs = spawn_generators(seed, 9, FANTASY_DRAFT_STREAM)  # one stream per AI team
+        self.data_version = data_version(players_data)
+        self.search_index = search_index(players_data, self.data_version, 'Player_Name')
         self.drafted_players = []
         self.user_team = []
         self.ai_teams = [[] for _ in range(9)]  # 9 AI teams
+        self.ai_team_vbd = [{pos: 0.0 for pos in ['QB', 'RB', 'WR', 'TE', 'K', 'DEF']} for _ in range(9)]
+        self.ai_team_counts = [{pos: 0 for pos in ['QB', 'RB', 'WR', 'TE', 'K', 'DEF']} for _ in range(9)]
+        
+        # Per-position candidate lists in the same order as the available players board
+        board_players = players_data.sort_values('Overall_Rank')
+        self.draft_board = DraftBoard(board_players)
         self.current_pick = 1
         self.snake_draft = True
         self.draft_active = False
@@ -1289,6 +1299,24 @@ class DraftSimulator:
         self.position_draft_order = [
             'QB', 'WR', 'WR', 'RB', 'RB', 'TE', 'FLEX', 'K', 'DEF', 'BENCH', 'BENCH', 'BENCH'
         ]
+        
+        # Live replacement levels for the 10-team league, updated after every pick
+        self.replacement_engine = ReplacementEngine(
+            players_data,
+            n_teams=10,
+            starters={pos: count for pos, count in self.roster_requirements.items() if pos not in ['FLEX', 'BENCH']},
+            flex_slots=self.roster_requirements['FLEX']
+        )
+        
+        # Opponent strategies (the classic slot script by default), scored over the board's arrays
+        self.ai_strategy_names = assign_strategies(strategy_mix, 9, generator(seed, STRATEGY_STREAM))
+        self.ai_strategies = build_strategies(
+            self.ai_strategy_names,
+            position_codes(board_players['Position']),
+            pd.to_numeric(board_players['VBD_Value'], errors='coerce').fillna(0).to_numpy(),
+            self.position_draft_order,
+            *pick_distributions(board_players)
+        )
 
     def get_pick_order(self, pick_number: int) -> int:
         """Get the team index for snake draft."""
@@ -1300,6 +1328,14 @@ class DraftSimulator:
         else:  # Even rounds go 10-1
             return 10 - pick_in_round
 
+    def ai_team_rosters(self) -> List[Tuple[str, List[dict]]]:
+        """Pair each drafted AI roster with its draft-board label (same slot mapping as handle_ai_pick)."""
+        ai_teams_mapping = [i for i in range(10) if i != st.session_state.user_draft_position - 1]
+        return [
+            (f'AI Team {team_index + 1}', team)
+            for team_index, team in zip(ai_teams_mapping, self.ai_teams) if team
+        ]
+
     def get_roster_slot_for_pick(self, pick_num: int, team_index: int) -> str:
         """Get the roster slot being filled for this pick."""
         team_pick_num = ((pick_num - 1) // 10) * 10 + (team_index + 1)
@@ -1310,20 +1346,16 @@ class DraftSimulator:
         else:
             return 'BENCH'
     
-    def ai_draft_pick(self, team_index: int, available_players: pd.DataFrame, pick_num: int = None) -> dict:
-        """AI logic for drafting players."""
+    def ai_draft_pick(self, team_index: int, pick_num: int = None) -> dict:
+        """AI logic for drafting players from the pre-sorted draft board (callers mark picks off with draft_board.draft)."""
         # Ensure team_index is within valid range for AI teams (0-8)
         if team_index < 0 or team_index >= 9:
             team_index = 0
         
         team_roster = self.ai_teams[team_index]
+        if self.ai_strategy_names[team_index] != SlotScriptStrategy.name:
+            return self.strategy_draft_pick(team_index, pick_num)
         
-        # Count positions on roster
-        position_counts = {}
-        for player in team_roster:
-            pos = player.get('Position', 'UNKNOWN')
-            position_counts[pos] = position_counts.get(pos, 0) + 1
-
         # Get the current roster slot being filled
         team_picks = len(team_roster)
         current_round = team_picks + 1
@@ -1332,98 +1364,69 @@ class DraftSimulator:
             target_slot = self.position_draft_order[current_round - 1]
         else:
             target_slot = 'BENCH'
-
+        
+        board = self.draft_board
+        top_n = 5
+        flex_positions = ['WR', 'RB', 'TE']
+        
         # AI draft strategy based on roster slot and team construction
-        if target_slot == 'QB':
-            # Round 1: Must draft QB
-            candidates = available_players[available_players['Position'] == 'QB']
-            if len(candidates) == 0:
-                candidates = available_players  # Fallback
-                
-        elif target_slot == 'WR':
-            # Rounds 2-3: Draft WRs
-            candidates = available_players[available_players['Position'] == 'WR']
-            if len(candidates) == 0:
-                candidates = available_players[available_players['Position'].isin(['WR', 'RB', 'TE'])]
-                
-        elif target_slot == 'RB':
-            # Rounds 4-5: Draft RBs
-            candidates = available_players[available_players['Position'] == 'RB']
-            if len(candidates) == 0:
-                candidates = available_players[available_players['Position'].isin(['RB', 'WR', 'TE'])]
-                
-        elif target_slot == 'TE':
-            # Round 6: Draft TE
-            candidates = available_players[available_players['Position'] == 'TE']
-            if len(candidates) == 0:
-                candidates = available_players[available_players['Position'].isin(['TE', 'WR', 'RB'])]
-                
+        if target_slot in ['QB', 'K', 'DEF']:
+            # Rounds 1, 8, 9: Draft QB / Kicker / Defense, falling back to best available
+            candidates = board.top([target_slot], top_n) or board.top(None, top_n)
+        
+        elif target_slot in flex_positions:
+            # Rounds 2-6: Draft WR, RB, TE, falling back to any skill position
+            candidates = board.top([target_slot], top_n) or board.top(
+                [target_slot] + [pos for pos in flex_positions if pos != target_slot], top_n
+            )
+        
         elif target_slot == 'FLEX':
-            # Round 7: FLEX position (WR/RB/TE)
-            flex_positions = ['WR', 'RB', 'TE']
-            candidates = available_players[available_players['Position'].isin(flex_positions)]
-            
-            # AI strategy for FLEX: prefer position with lowest current total on roster
-            flex_values = {}
-            for pos in flex_positions:
-                pos_total = sum(p.get('VBD_Value', 0) for p in team_roster if p.get('Position') == pos)
-                flex_values[pos] = pos_total
-            
-            # Prefer position with lowest current value (needs strengthening)
+            # Round 7: FLEX position (WR/RB/TE), preferring the position with lowest current total on roster
+            flex_values = {pos: self.ai_team_vbd[team_index][pos] for pos in flex_positions}
             weakest_flex_pos = min(flex_values.items(), key=lambda x: x[1])[0]
-            preferred_candidates = candidates[candidates['Position'] == weakest_flex_pos]
-            
-            if len(preferred_candidates) > 0:
-                candidates = preferred_candidates
-                
-        elif target_slot == 'K':
-            # Round 8: Draft Kicker
-            candidates = available_players[available_players['Position'] == 'K']
-            if len(candidates) == 0:
-                candidates = available_players  # Fallback
-                
-        elif target_slot == 'DEF':
-            # Round 9: Draft Defense
-            candidates = available_players[available_players['Position'] == 'DEF']
-            if len(candidates) == 0:
-                candidates = available_players  # Fallback
-                
+            candidates = board.top([weakest_flex_pos], top_n) or board.top(flex_positions, top_n)
+        
         else:  # BENCH rounds (10-12)
-            # Bench strategy: Best available or fill weaknesses
-            # Calculate position strength
-            position_strength = {}
-            for pos in ['QB', 'RB', 'WR', 'TE']:
-                pos_players = [p for p in team_roster if p.get('Position') == pos]
-                avg_vbd = sum(p.get('VBD_Value', 0) for p in pos_players) / max(len(pos_players), 1)
-                position_strength[pos] = avg_vbd
-            
-            # Target weakest position for bench depth
-            if position_strength:
-                weakest_pos = min(position_strength.items(), key=lambda x: x[1])[0]
-                candidates = available_players[available_players['Position'] == weakest_pos]
-                
-                # If no players available in weakest position, go best available
-                if len(candidates) == 0:
-                    candidates = available_players[available_players['Position'].isin(['RB', 'WR', 'TE', 'QB'])]
-            else:
-                candidates = available_players
-
+            # Target the position with the weakest average VBD for bench depth
+            position_strength = {
+                pos: self.ai_team_vbd[team_index][pos] / max(self.ai_team_counts[team_index][pos], 1)
+                for pos in ['QB', 'RB', 'WR', 'TE']
+            }
+            weakest_pos = min(position_strength.items(), key=lambda x: x[1])[0]
+            candidates = board.top([weakest_pos], top_n) or board.top(['RB', 'WR', 'TE', 'QB'], top_n)
+        
         # Add some randomness to make it realistic (top 3-5 players in filtered list)
-        top_candidates = candidates.head(min(5, len(candidates)))
-        if len(top_candidates) == 0:
+        if len(candidates) == 0:
             return None
-
+        
         # Weight selection towards higher ranked players
-        weights = [1.0 / (i + 1) for i in range(len(top_candidates))]
+        weights = [1.0 / (i + 1) for i in range(len(candidates))]
         weights = [w / sum(weights) for w in weights]
-
-        selected_idx = np.random.choice(len(top_candidates), p=weights)
-        return top_candidates.iloc[selected_idx].to_dict()
+        
+        selected_idx = self.team_rngs[team_index].choice(len(candidates), p=weights)
+        return board.record(candidates[selected_idx])
+    
+    def strategy_draft_pick(self, team_index: int, pick_num: int = None) -> dict:
+        """Draft for an AI team from its strategy's scores over the whole board at overall pick pick_num."""
+        counts = np.array([[self.ai_team_counts[team_index][pos] for pos in POSITIONS]])
+        totals = np.array([[self.ai_team_vbd[team_index][pos] for pos in POSITIONS]], dtype=float)
+        row = self.ai_strategies[self.ai_strategy_names[team_index]].pick(
+            ~self.draft_board.drafted[None, :], counts, totals, len(self.ai_teams[team_index]), self.team_rngs[team_index],
+            pick_num or 1
+        )[0]
+        return self.draft_board.record(row) if row >= 0 else None
+    
+    def add_to_ai_team(self, team_index: int, player: dict):
+        """Add a drafted player to an AI roster and its running per-position VBD totals."""
+        self.ai_teams[team_index].append(player)
+        position = player.get('Position')
+        if position in self.ai_team_vbd[team_index]:
+            self.ai_team_vbd[team_index][position] += player.get('VBD_Value', 0)
+            self.ai_team_counts[team_index][position] += 1
 
     def simulate_draft(self, user_picks: List[int]) -> List[dict]:
         """Simulate a full 12-round draft."""
         draft_results = []
-        available_players = self.players_data.copy().sort_values('Overall_Rank')
 
         for pick_num in range(1, 121):  # 12 rounds, 10 teams
             team_index = self.get_pick_order(pick_num)
@@ -1433,10 +1436,10 @@ class DraftSimulator:
                 continue
             else:
                 # AI pick
-                if len(available_players) > 0:
+                if self.draft_board.remaining > 0:
                     # Correctly map team_index to AI teams (team 0 is user, teams 1-9 map to ai_teams 0-8)
                     ai_team_index = team_index - 1 if team_index > 0 else 8
-                    ai_pick = self.ai_draft_pick(ai_team_index, available_players, pick_num)
+                    ai_pick = self.ai_draft_pick(ai_team_index, pick_num)
                     if ai_pick:
                         draft_results.append({
                             'pick': pick_num,
@@ -1450,10 +1453,9 @@ class DraftSimulator:
                             'roster_slot': self.get_roster_slot_for_pick(pick_num, team_index)
                         })
 
-                        # Remove drafted player
-                        available_players = available_players[
-                            available_players['Player_Name'] != ai_pick['Player_Name']
-                        ]
+                        # Mark the drafted player off the board
+                        self.replacement_engine.draft(ai_pick['Player_Name'], draft_results[-1]['team'])
+                        self.draft_board.draft(ai_pick['Player_Name'])
 
                         # Add to team roster
                         if team_index == 0:
@@ -1462,7 +1464,7 @@ class DraftSimulator:
                             # Use the same AI team index mapping
                             ai_team_index = team_index - 1 if team_index > 0 else 8
                             if ai_team_index < 9:  # Safety check
-                                self.ai_teams[ai_team_index].append(ai_pick)
+                                self.add_to_ai_team(ai_team_index, ai_pick)
 
         return draft_results
 
@@ -1574,13 +1576,15 @@ class DraftSimulator:
     def render_ai_draft_interface(self, team_index, current_pick):
         """Render interface during AI turns."""
         team_name = f"AI Team {team_index + 1}"
+        ai_teams_mapping = [i for i in range(10) if i != st.session_state.user_draft_position - 1]
+        strategy = self.ai_strategy_names[ai_teams_mapping.index(team_index)] if team_index in ai_teams_mapping else "Slot Script"
         
         st.markdown(f"""
         <div class="ai-turn-banner" style="text-align: center; padding: 1.5rem; margin: 1rem 0; background: linear-gradient(135deg, rgba(255,255,255,0.1) 0%, rgba(255,255,255,0.05) 100%); border-radius: 15px;">
             <h2 style="margin: 0;">🤖 {team_name} is selecting...</h2>
             <div style="margin-top: 1rem;">
                 <div class="thinking-dots">Analyzing available players</div>
-                <div style="margin-top: 0.5rem; font-size: 0.9rem; color: rgba(255,255,255,0.7);">Pick #{current_pick} | AI making strategic choice</div>
+                <div style="margin-top: 0.5rem; font-size: 0.9rem; color: rgba(255,255,255,0.7);">Pick #{current_pick} | Strategy: {strategy}</div>
             </div>
         </div>
         """, unsafe_allow_html=True)
@@ -1615,6 +1619,9 @@ class DraftSimulator:
             user_picks = [pick for pick in st.session_state.draft_results if pick['team'] == 'Your Team']
             st.markdown(f"**Round {current_round} Analysis** | Picks Made: {len(user_picks)} | Available Players: {len(st.session_state.available_players)}")
             
+            levels = self.replacement_engine.replacement_levels()
+            st.caption("Live replacement VBD: " + " · ".join(f"{pos} {level:.1f}" for pos, level in levels.items()))
+            
             if suggestions:
                 st.markdown("---")
                 st.markdown("**🎯 Strategic Recommendations:**")
@@ -1651,14 +1658,17 @@ class DraftSimulator:
                             st.markdown(f"<div style='color: rgba(255,255,255,0.9); font-size: 0.9rem; margin-left: 1.7rem;'>{reason}</div>", unsafe_allow_html=True)
                             
                             # Player stats
-                            stats_cols = st.columns([1, 1, 1, 1])
+                            stats_cols = st.columns([1, 1, 1, 1, 1])
                             with stats_cols[0]:
                                 st.markdown(f"<small>**Rank:** #{int(player['Overall_Rank'])}</small>", unsafe_allow_html=True)
                             with stats_cols[1]:
                                 st.markdown(f"<small>**VBD:** {player['VBD_Value']:.1f}</small>", unsafe_allow_html=True)
                             with stats_cols[2]:
-                                st.markdown(f"<small>**Pos Rank:** #{int(player['Position_Rank'])}</small>", unsafe_allow_html=True)
+                                live_vor = player.get('Live_VOR', np.nan)
+                                st.markdown(f"<small>**Live VOR:** {live_vor:+.1f}</small>" if pd.notna(live_vor) else "<small>**Live VOR:** -</small>", unsafe_allow_html=True)
                             with stats_cols[3]:
+                                st.markdown(f"<small>**Pos Rank:** #{int(player['Position_Rank'])}</small>", unsafe_allow_html=True)
+                            with stats_cols[4]:
                                 st.markdown(f"<small>**Team:** {player.get('Team', 'UNK')}</small>", unsafe_allow_html=True)
                         
                         with sug_cols[1]:
@@ -1669,6 +1679,24 @@ class DraftSimulator:
                     if i < len(suggestions) - 1:
                         st.markdown("<hr style='margin: 0.8rem 0; border: 1px solid rgba(255,255,255,0.1);'>", unsafe_allow_html=True)
                 
+                # Expected-value lookahead over simulated AI picks
+                st.markdown("---")
+                st.markdown("**🔮 Lookahead: Expected Lineup Value**")
+                lookahead = self.get_lookahead_recommendations()
+                if not lookahead.empty:
+                    for rank, row in lookahead.head(3).iterrows():
+                        st.markdown(
+                            f"{rank + 1}. **{row['Player_Name']}** ({row['Position']}) · EV {row['Expected_Lineup_Value']:.1f} "
+                            f"· {row['Available_Next_Pick']:.0%} chance still there next pick"
+                        )
+                    st.caption(f"{lookahead.attrs['rollouts']} of {lookahead.attrs['requested']} rollouts of the AI teams in "
+                               f"{lookahead.attrs['elapsed'] * 1000:.0f} ms"
+                               + (" (converged)" if lookahead.attrs['converged'] else " (stopped early)" if lookahead.attrs['stopped_early'] else ""))
+                    
+                    if st.button("📝 DRAFT TOP EV PICK", key="lookahead_pick", use_container_width=True):
+                        self.make_user_pick(st.session_state.available_players.iloc[int(lookahead.loc[0, 'board_row'])])
+                        st.rerun()
+                
                 # Additional draft insights
                 st.markdown("---")
                 st.markdown("**💡 Draft Insights:**")
@@ -1695,13 +1723,13 @@ class DraftSimulator:
                 search_term = st.text_input("🔍 Search Players", placeholder="Player name...", key="board_search")
         
         # Filter players
-        filtered_players = st.session_state.available_players.copy()
+        filtered_players = st.session_state.available_players
         if selected_pos != 'ALL':
             filtered_players = filtered_players[filtered_players['Position'] == selected_pos]
         if search_term:
-            filtered_players = filtered_players[
-                filtered_players['Player_Name'].str.contains(search_term, case=False, na=False)
-            ]
+            # Search the full player pool's index, then keep players still available
+            matches = self.players_data.index[self.search_index.search(search_term)]
+            filtered_players = filtered_players[filtered_players.index.isin(matches)]
         
         # Sort by overall rank and limit results for performance
         filtered_players = filtered_players.sort_values('Overall_Rank').head(20)  # Reduced from 30 to 20 for better performance
@@ -1924,6 +1952,9 @@ class DraftSimulator:
         user_picks = [pick for pick in st.session_state.draft_results if pick['team'] == 'Your Team']
         available = st.session_state.available_players.copy()
         
+        # Value over the live replacement level (reflects every pick made so far)
+        available['Live_VOR'] = self.replacement_engine.vor(available['Player_Name'])
+        
         # Analyze user's current roster
         user_positions = {}
         user_vbd_total = 0
@@ -1942,12 +1973,14 @@ class DraftSimulator:
         has_elite_qb = any(pick.get('vbd', 0) > 15 for pick in user_picks if pick['position'] == 'QB')
         has_elite_te = any(pick.get('vbd', 0) > 12 for pick in user_picks if pick['position'] == 'TE')
         
-        # Best Player Available with context
+        # Best Player Available by live value over replacement
         if len(available) > 0:
-            bpa = available.iloc[0]
+            bpa = available.loc[available['Live_VOR'].idxmax()] if available['Live_VOR'].notna().any() else available.iloc[0]
             bpa_reason = f"Elite tier player (#{int(bpa['Overall_Rank'])}) - significant value drop after this pick"
             if bpa['VBD_Value'] > 20:
                 bpa_reason = f"Premium player with {bpa['VBD_Value']:.1f} VBD - rare elite talent"
+            if pd.notna(bpa['Live_VOR']):
+                bpa_reason += f" ({bpa['Live_VOR']:+.1f} over the current {bpa['Position']} replacement)"
             suggestions.append({
                 **bpa.to_dict(),
                 'suggestion_type': 'BPA',
@@ -2010,7 +2043,7 @@ class DraftSimulator:
             for pos in ['RB', 'WR', 'TE', 'QB']:
                 pos_players = available[available['Position'] == pos]
                 if len(pos_players) > 0:
-                    top_pos = pos_players.head(3)
+                    top_pos = pos_players.nlargest(3, 'Live_VOR')
                     for _, player in top_pos.iterrows():
                         if len(suggestions) < 8:
                             vbd_val = player['VBD_Value']
@@ -2060,6 +2093,47 @@ class DraftSimulator:
         
         return unique_suggestions[:5]
 
+    def get_lookahead_recommendations(self) -> pd.DataFrame:
+        """Rank candidate picks by expected lineup value from rollouts of the AI teams to the user's next pick."""
+        current_pick = st.session_state.current_pick_number
+        cache = st.session_state.get('lookahead_cache')
+        tolerance = st.session_state.get('lookahead_tolerance')
+        if cache and cache[0] == (id(self), current_pick, tolerance):
+            return cache[1]
+        
+        # AI teams picking between now and the user's next turn (same mapping as handle_ai_pick)
+        user_slot = st.session_state.user_draft_position - 1
+        ai_teams_mapping = [i for i in range(10) if i != user_slot]
+        schedule = []
+        next_pick = None
+        for pick in range(current_pick + 1, st.session_state.draft_rounds * 10 + 1):
+            team_index = self.get_pick_order(pick)
+            if team_index == user_slot:
+                next_pick = pick
+                break
+            schedule.append(ai_teams_mapping.index(team_index))
+        
+        available = st.session_state.available_players.copy()
+        available['Live_VOR'] = self.replacement_engine.vor(available['Player_Name'])
+        recommender = LookaheadRecommender(
+            available,
+            starters={pos: count for pos, count in self.roster_requirements.items() if pos not in ['FLEX', 'BENCH']},
+            flex_slots=self.roster_requirements['FLEX'],
+            slot_order=self.position_draft_order
+        )
+        result = recommender.recommend(
+            self.user_team, self.ai_teams, schedule,
+            user_has_next_pick=next_pick is not None,
+            candidate_col='Live_VOR',
+            tolerance=tolerance or None,
+            seed=seed_sequence(self.seed, LOOKAHEAD_STREAM, current_pick),
+            opponent_strategies=dict(enumerate(self.ai_strategy_names)),
+            first_pick=current_pick + 1
+        )
+        
+        st.session_state.lookahead_cache = ((id(self), current_pick, tolerance), result)
+        return result
+
     def handle_user_pick(self):
         """Handle when it's the user's turn to pick."""
         # Initialize timer if not started
@@ -2116,6 +2190,8 @@ class DraftSimulator:
         # Add to user team
         if st.session_state.draft_simulator:
             st.session_state.draft_simulator.user_team.append(player_dict)
+            st.session_state.draft_simulator.replacement_engine.draft(player_name, 'Your Team')
+            st.session_state.draft_simulator.draft_board.draft(player_name)
         
         # Move to next pick and reset timer
         st.session_state.current_pick_number += 1
@@ -2159,7 +2235,7 @@ class DraftSimulator:
                 else:
                     ai_team_index = 0
                 
-                ai_pick = simulator.ai_draft_pick(ai_team_index, st.session_state.available_players)
+                ai_pick = simulator.ai_draft_pick(ai_team_index, st.session_state.current_pick_number)
                 
                 if ai_pick:
                     pick_info = {
@@ -2182,7 +2258,9 @@ class DraftSimulator:
                     
                     # Add to correct AI team
                     if ai_team_index < 9:
-                        simulator.ai_teams[ai_team_index].append(ai_pick)
+                        simulator.add_to_ai_team(ai_team_index, ai_pick)
+                    simulator.replacement_engine.draft(ai_pick.get('Player_Name'), pick_info['team'])
+                    simulator.draft_board.draft(ai_pick.get('Player_Name'))
                     
                     # Move to next pick
                     st.session_state.current_pick_number += 1
@@ -2215,6 +2293,7 @@ class DraftSimulator:
         # AI Draft Grade
         user_team = st.session_state.draft_simulator.user_team if st.session_state.draft_simulator else []
         draft_grade = self.calculate_draft_grade(user_team)
+        league_grades = self.calculate_league_grades()
         
         # Prominent draft grade display
         st.markdown(f"""
@@ -2238,9 +2317,11 @@ class DraftSimulator:
 
         with tab2:
             self.display_draft_grade_breakdown(draft_grade)
+            self.display_league_grade_distribution(draft_grade, league_grades)
 
         with tab3:
             self.display_advanced_analytics(user_team)
+            self.display_season_outlook()
 
         with tab4:
             self.display_future_suggestions(user_team, draft_grade)
@@ -2249,167 +2330,29 @@ class DraftSimulator:
             self.display_full_draft_board()
 
     def calculate_draft_grade(self, user_team: List[dict]) -> dict:
-        """Calculate comprehensive AI draft grade for 12-player roster."""
-        if not user_team or len(user_team) != 12:
+        """Calculate comprehensive AI draft grade for the user's roster."""
+        if not user_team:
             return {
                 'score': 0,
                 'letter_grade': 'F',
-                'summary': 'Incomplete draft - 12 players required',
+                'summary': 'Incomplete draft - no players drafted',
                 'breakdown': {}
             }
 
-        # Calculate various grading metrics
-        total_vbd = sum(player.get('VBD_Value', 0) for player in user_team)
-        avg_vbd = total_vbd / len(user_team) if user_team else 0
-        
-        # Position analysis with 12-player roster requirements
-        position_counts = {}
-        position_vbd = {}
-        starter_vbd = 0  # VBD from starting lineup (first 9 picks)
-        bench_vbd = 0    # VBD from bench (last 3 picks)
-        
-        for idx, player in enumerate(user_team):
-            pos = player.get('Position', 'UNKNOWN')
-            position_counts[pos] = position_counts.get(pos, 0) + 1
-            position_vbd[pos] = position_vbd.get(pos, 0) + player.get('VBD_Value', 0)
-            
-            # Separate starter vs bench value
-            if idx < 9:  # First 9 picks are starters
-                starter_vbd += player.get('VBD_Value', 0)
-            else:  # Last 3 picks are bench
-                bench_vbd += player.get('VBD_Value', 0)
+        return grade_league([user_team])[0]
 
-        # Enhanced scoring components for 12-player format
-        
-        # 1. VBD Score (30 points max) - prioritize starter value
-        starter_vbd_score = min(25, (starter_vbd / 120) * 25)  # Starters worth more
-        bench_vbd_score = min(5, (bench_vbd / 30) * 5)        # Bench depth bonus
-        vbd_score = starter_vbd_score + bench_vbd_score
-        
-        # 2. Roster Construction Score (25 points max)
-        required_positions = {'QB': 1, 'WR': 2, 'RB': 2, 'TE': 1, 'K': 1, 'DEF': 1}
-        construction_score = 0
-        
-        for pos, required in required_positions.items():
-            actual = position_counts.get(pos, 0)
-            if actual >= required:
-                construction_score += (25 / len(required_positions))
-            else:
-                construction_score += (actual / required) * (25 / len(required_positions))
-        
-        # Bonus for FLEX diversity (having different position types)
-        flex_players = user_team[6:7] if len(user_team) > 6 else []  # 7th pick is FLEX
-        flex_positions = set()
-        for player in flex_players:
-            pos = player.get('Position', 'UNKNOWN')
-            if pos in ['WR', 'RB', 'TE']:
-                flex_positions.add(pos)
-        
-        if len(flex_positions) > 0:
-            construction_score += 2  # Bonus for proper FLEX usage
-        
-        # 3. Value and Strategy Score (25 points max)
-        value_picks = sum(1 for player in user_team if player.get('Value_Pick', False))
-        early_value_picks = sum(1 for i, player in enumerate(user_team[:6]) if player.get('Value_Pick', False))
-        
-        value_strategy_score = min(15, (value_picks / 12) * 30)  # Overall value identification
-        early_strategy_score = min(10, (early_value_picks / 6) * 20)  # Early round value
-        strategy_score = value_strategy_score + early_strategy_score
-        
-        # 4. Draft Order Execution Score (20 points max)
-        execution_score = 20
-        
-        # Check if positions were drafted in reasonable order
-        position_order_check = {
-            0: 'QB',     # Round 1: QB
-            1: 'WR',     # Round 2: WR1  
-            2: 'WR',     # Round 3: WR2
-            3: 'RB',     # Round 4: RB1
-            4: 'RB',     # Round 5: RB2
-            5: 'TE',     # Round 6: TE
-            6: ['WR', 'RB', 'TE'],  # Round 7: FLEX
-            7: 'K',      # Round 8: K
-            8: 'DEF'     # Round 9: DEF
-        }
-        
-        for pick_idx, expected_pos in position_order_check.items():
-            if pick_idx < len(user_team):
-                actual_pos = user_team[pick_idx].get('Position', 'UNKNOWN')
-                
-                if isinstance(expected_pos, list):
-                    if actual_pos not in expected_pos:
-                        execution_score -= 2  # Penalty for wrong FLEX position
-                else:
-                    if actual_pos != expected_pos:
-                        execution_score -= 3  # Penalty for wrong position
-        
-        # Penalty for drafting K/DEF too early
-        for idx in range(7):  # First 7 picks shouldn't be K/DEF
-            if idx < len(user_team):
-                pos = user_team[idx].get('Position', 'UNKNOWN')
-                if pos in ['K', 'DEF']:
-                    execution_score -= 5
-        
-        execution_score = max(0, execution_score)
-
-        # Calculate final score
-        final_score = vbd_score + construction_score + strategy_score + execution_score
-
-        # Letter grade
-        if final_score >= 90:
-            letter_grade = 'A+'
-        elif final_score >= 85:
-            letter_grade = 'A'
-        elif final_score >= 80:
-            letter_grade = 'A-'
-        elif final_score >= 75:
-            letter_grade = 'B+'
-        elif final_score >= 70:
-            letter_grade = 'B'
-        elif final_score >= 65:
-            letter_grade = 'B-'
-        elif final_score >= 60:
-            letter_grade = 'C+'
-        elif final_score >= 55:
-            letter_grade = 'C'
-        elif final_score >= 50:
-            letter_grade = 'C-'
-        elif final_score >= 45:
-            letter_grade = 'D+'
-        elif final_score >= 40:
-            letter_grade = 'D'
-        else:
-            letter_grade = 'F'
-
-        # Generate summary
-        if final_score >= 85:
-            summary = "🔥 Excellent draft! Outstanding value and team construction."
-        elif final_score >= 75:
-            summary = "⭐ Very good draft with solid players and good strategy."
-        elif final_score >= 65:
-            summary = "👍 Good draft with room for improvement in some areas."
-        elif final_score >= 55:
-            summary = "📊 Average draft, consider improving draft strategy."
-        else:
-            summary = "⚠️ Below average draft, significant improvements needed."
-
-        return {
-            'score': final_score,
-            'letter_grade': letter_grade,
-            'summary': summary,
-            'breakdown': {
-                'vbd_score': vbd_score,
-                'construction_score': construction_score,
-                'strategy_score': strategy_score,
-                'execution_score': execution_score,
-                'total_vbd': total_vbd,
-                'starter_vbd': starter_vbd,
-                'bench_vbd': bench_vbd,
-                'avg_vbd': avg_vbd,
-                'value_picks': value_picks,
-                'early_value_picks': early_value_picks
-            }
-        }
+    def calculate_league_grades(self) -> List[dict]:
+        """Grade the user's roster and every AI roster in one vectorized pass."""
+        simulator = st.session_state.draft_simulator
+        if not simulator or not simulator.user_team:
+            return []
+
+        ai_rosters = simulator.ai_team_rosters()
+        grades = grade_league([simulator.user_team] + [team for _, team in ai_rosters])
+        team_names = ['Your Team'] + [name for name, _ in ai_rosters]
+        for grade, team_name in zip(grades, team_names):
+            grade['team'] = team_name
+        return grades
 
     def display_user_team_analysis(self, user_team: List[dict], draft_grade: dict):
         """Display detailed user team analysis for 12-player roster."""
@@ -2541,30 +2484,33 @@ class DraftSimulator:
             ]
             max_scores = [30, 25, 25, 20]
             
-            fig_breakdown = go.Figure()
-            
-            fig_breakdown.add_trace(go.Bar(
-                name='Your Score',
-                x=components,
-                y=scores,
-                marker_color='#667eea'
-            ))
-            
-            fig_breakdown.add_trace(go.Bar(
-                name='Max Possible',
-                x=components,
-                y=max_scores,
-                marker_color='rgba(255,255,255,0.3)'
-            ))
-            
-            fig_breakdown.update_layout(
-                title="Draft Grade Components",
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white'),
-                barmode='overlay'
-            )
+            def build_fig_breakdown():
+                fig_breakdown = go.Figure()
+                
+                fig_breakdown.add_trace(go.Bar(
+                    name='Your Score',
+                    x=components,
+                    y=scores,
+                    marker_color='#667eea'
+                ))
+                
+                fig_breakdown.add_trace(go.Bar(
+                    name='Max Possible',
+                    x=components,
+                    y=max_scores,
+                    marker_color='rgba(255,255,255,0.3)'
+                ))
+                
+                fig_breakdown.update_layout(
+                    title="Draft Grade Components",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white'),
+                    barmode='overlay'
+                )
+                return fig_breakdown
             
+            fig_breakdown = figure_cache.figure('draft_grade_breakdown', '', tuple(scores), build_fig_breakdown)
             st.plotly_chart(fig_breakdown, use_container_width=True)
 
         with col2:
@@ -2583,6 +2529,58 @@ class DraftSimulator:
             st.metric("Value Picks", f"{breakdown['value_picks']}/12")
             st.metric("Early Value Picks", f"{breakdown['early_value_picks']}/6")
 
+    def display_league_grade_distribution(self, draft_grade: dict, league_grades: List[dict]):
+        """Display how the user's draft grade ranks against every roster in the league."""
+        if len(league_grades) < 2:
+            return
+
+        st.markdown("### 🏟️ League-Wide Draft Grades")
+
+        scores = np.array([grade['score'] for grade in league_grades])
+        user_score = draft_grade['score']
+        league_rank = int((scores > user_score).sum()) + 1
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("League Rank", f"#{league_rank} of {len(scores)}")
+        with col2:
+            st.metric("Grade Percentile", f"{grade_percentile(user_score, scores):.0f}%",
+                      help="Share of league rosters graded below yours")
+        with col3:
+            st.metric("League Average", f"{scores.mean():.1f}", delta=f"{user_score - scores.mean():+.1f}")
+
+        league_df = pd.DataFrame({
+            'Team': [grade['team'] for grade in league_grades],
+            'Grade': [grade['letter_grade'] for grade in league_grades],
+            'Score': scores.round(1),
+            'Total VBD': [round(grade['breakdown']['total_vbd'], 1) for grade in league_grades],
+            'Value Picks': [grade['breakdown']['value_picks'] for grade in league_grades]
+        }).sort_values('Score', ascending=False)
+
+        def build_fig_league():
+            fig_league = go.Figure(go.Bar(
+                x=league_df['Team'],
+                y=league_df['Score'],
+                text=league_df['Grade'],
+                textposition='outside',
+                marker_color=['#FFD700' if team == 'Your Team' else '#667eea' for team in league_df['Team']]
+            ))
+
+            fig_league.update_layout(
+                title="Draft Grades Across the League",
+                yaxis_title="Draft Score",
+                yaxis_range=[0, 105],
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='white'),
+                showlegend=False
+            )
+            return fig_league
+
+        fig_league = figure_cache.figure('league_draft_grades', '', tuple(zip(league_df['Team'], league_df['Score'])), build_fig_league)
+        st.plotly_chart(fig_league, use_container_width=True)
+        st.dataframe(league_df, use_container_width=True, hide_index=True)
+
     def display_advanced_analytics(self, user_team: List[dict]):
         """Display advanced analytics for user's team."""
         st.markdown("### 📈 Advanced Team Analytics")
@@ -2591,29 +2589,35 @@ class DraftSimulator:
             st.info("No team data available for analysis.")
             return
 
+        # Charts are cached per drafted roster, keyed on its picks in draft order
+        team_picks = tuple((p.get('Player_Name'), p.get('Position'), p.get('VBD_Value', 0)) for p in user_team)
+
         col1, col2 = st.columns(2)
         
         with col1:
             # Position VBD breakdown
-            position_vbd = {}
-            for player in user_team:
-                pos = player.get('Position', 'UNKNOWN')
-                position_vbd[pos] = position_vbd.get(pos, 0) + player.get('VBD_Value', 0)
-
-            fig_pos_vbd = px.bar(
-                x=list(position_vbd.keys()),
-                y=list(position_vbd.values()),
-                title="VBD Score by Position",
-                color=list(position_vbd.values()),
-                color_continuous_scale='Viridis'
-            )
-            
-            fig_pos_vbd.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white')
-            )
+            def build_fig_pos_vbd():
+                position_vbd = {}
+                for player in user_team:
+                    pos = player.get('Position', 'UNKNOWN')
+                    position_vbd[pos] = position_vbd.get(pos, 0) + player.get('VBD_Value', 0)
+
+                fig_pos_vbd = px.bar(
+                    x=list(position_vbd.keys()),
+                    y=list(position_vbd.values()),
+                    title="VBD Score by Position",
+                    color=list(position_vbd.values()),
+                    color_continuous_scale='Viridis'
+                )
+                
+                fig_pos_vbd.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white')
+                )
+                return fig_pos_vbd
             
+            fig_pos_vbd = figure_cache.figure('draft_position_vbd', '', team_picks, build_fig_pos_vbd)
             st.plotly_chart(fig_pos_vbd, use_container_width=True)
 
         with col2:
@@ -2627,21 +2631,24 @@ class DraftSimulator:
                 round_vbd[round_num] = round_vbd.get(round_num, 0) + player.get('VBD_Value', 0)
 
             if round_vbd:
-                fig_round_eff = px.line(
-                    x=list(round_vbd.keys()),
-                    y=[round_vbd[r]/round_picks[r] for r in round_vbd.keys()],
-                    title="Average VBD by Draft Round",
-                    markers=True
-                )
-                
-                fig_round_eff.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white'),
-                    xaxis_title="Round",
-                    yaxis_title="Average VBD"
-                )
+                def build_fig_round_eff():
+                    fig_round_eff = px.line(
+                        x=list(round_vbd.keys()),
+                        y=[round_vbd[r]/round_picks[r] for r in round_vbd.keys()],
+                        title="Average VBD by Draft Round",
+                        markers=True
+                    )
+                    
+                    fig_round_eff.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white'),
+                        xaxis_title="Round",
+                        yaxis_title="Average VBD"
+                    )
+                    return fig_round_eff
                 
+                fig_round_eff = figure_cache.figure('draft_round_efficiency', '', team_picks, build_fig_round_eff)
                 st.plotly_chart(fig_round_eff, use_container_width=True)
 
         # Team strengths and weaknesses
@@ -2667,6 +2674,60 @@ class DraftSimulator:
             for insight in insights:
                 st.markdown(f"• {insight}")
 
+    def display_season_outlook(self):
+        """Simulate full seasons for every drafted roster and show playoff odds."""
+        st.markdown("#### 🏟️ Season Outlook")
+        
+        simulator = st.session_state.draft_simulator
+        if not simulator or not simulator.user_team:
+            return
+        
+        ai_rosters = simulator.ai_team_rosters()
+        rosters = [simulator.user_team] + [team for _, team in ai_rosters]
+        team_names = ['Your Team'] + [name for name, _ in ai_rosters]
+        num_seasons = st.select_slider("Simulated Seasons", options=[500, 1000, 2000, 5000], value=2000, key='season_sim_count')
+        
+        # Identical rosters, season count and seed reproduce identical seasons, so reuse stored outputs
+        league = pd.DataFrame([dict(player, Fantasy_Team=name) for name, roster in zip(team_names, rosters) for player in roster])
+        key = simulation_store.key(data_version(league), {'kind': 'season', 'seasons': num_seasons}, self.seed)
+        results = simulation_store.get(key)
+        if results is None:
+            with st.spinner(f"Simulating {num_seasons:,} seasons..."):
+                standings = SeasonSimulator(rosters, team_names).simulate(
+                    num_seasons, seed=seed_sequence(self.seed, SEASON_STREAM)
+                )
+            results = {'standings': standings}
+            simulation_store.put(key, results)
+        standings = results['standings']
+        
+        user_row = standings[standings['Team'] == 'Your Team'].iloc[0]
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Playoff Odds", f"{user_row['Playoff %']:.1f}%")
+        with col2:
+            st.metric("Title Odds", f"{user_row['Title %']:.1f}%")
+        with col3:
+            st.metric("Projected Record", f"{user_row['Avg Wins']:.1f}-{REGULAR_SEASON_WEEKS - user_row['Avg Wins']:.1f}")
+        with col4:
+            st.metric("Weekly Points", f"{user_row['Avg Weekly Points']:.1f}")
+        
+        fig_playoffs = go.Figure(go.Bar(
+            x=standings['Team'],
+            y=standings['Playoff %'],
+            marker_color=['#f093fb' if team == 'Your Team' else '#667eea' for team in standings['Team']],
+            hovertemplate='%{x}: %{y:.1f}% playoff odds<extra></extra>'
+        ))
+        fig_playoffs.update_layout(
+            title=f"Playoff Odds over {num_seasons:,} Simulated Seasons",
+            yaxis_title="Playoff %",
+            height=350,
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white')
+        )
+        st.plotly_chart(fig_playoffs, use_container_width=True)
+        st.dataframe(standings.round(2), use_container_width=True, hide_index=True)
+
     def analyze_team_strengths(self, user_team: List[dict]) -> List[str]:
         """Analyze team strengths."""
         strengths = []
@@ -2854,72 +2915,86 @@ class DraftSimulator:
                 best_bench = max(bench_players, key=lambda p: p.get('VBD_Value', 0))
                 st.markdown(f"💎 Best Bench Asset: {best_bench['Player_Name']} ({best_bench.get('VBD_Value', 0):.1f} VBD)")
             
-            # Bye week analysis
+            # Bye week analysis: weekly optimal lineups over the whole roster, not just the first nine picks
             st.markdown("**📅 Bye Week Management:**")
-            bye_weeks = {}
-            for player in user_team[:9]:  # Only starters matter for bye weeks
-                bye = player.get('Bye_Week', 0)
-                if bye > 0:
-                    if bye not in bye_weeks:
-                        bye_weeks[bye] = []
-                    bye_weeks[bye].append(f"{player['Player_Name']} ({player['Position']})")
+            weekly_strength, weekly_unfilled = bye_week_planner.weekly_profile(user_team)
+            full_strength = max(weekly_strength.max(), 1e-9)
             
             # Identify problematic bye weeks
-            for week, players in bye_weeks.items():
-                if len(players) >= 3:
-                    st.markdown(f"🚨 Week {week}: {len(players)} starters on bye")
-                elif len(players) == 2:
-                    st.markdown(f"⚠️ Week {week}: {len(players)} starters on bye")
-        
-        # Enhanced trade analysis
+            for week in np.flatnonzero(weekly_unfilled > 0) + 1:
+                st.markdown(f"🚨 Week {week}: {weekly_unfilled[week - 1]} starting slot(s) unfilled")
+            for week in np.flatnonzero((weekly_unfilled == 0) & (weekly_strength < 0.85 * full_strength)) + 1:
+                st.markdown(f"⚠️ Week {week}: lineup at {weekly_strength[week - 1] / full_strength:.0%} strength")
+            if not weekly_unfilled.any():
+                st.markdown("✅ Every starting slot is covered through bye weeks")
+        
+        # Bench pickups that cover the weeks the roster cannot field a full lineup
+        st.markdown("#### 📅 Bye-Week Coverage Plan")
+        
+        bye_col1, bye_col2 = st.columns(2)
+        
+        with bye_col1:
+            fig_weekly = go.Figure(go.Bar(
+                x=[f"W{week}" for week in range(1, len(weekly_strength) + 1)],
+                y=weekly_strength,
+                marker_color=['#ff4444' if unfilled else '#667eea' for unfilled in weekly_unfilled],
+                hovertemplate='%{x}: %{y:.1f} starter VBD<extra></extra>'
+            ))
+            fig_weekly.update_layout(
+                title="Weekly Starter Strength",
+                height=300,
+                margin=dict(l=20, r=20, t=40, b=20),
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font_color='white'
+            )
+            st.plotly_chart(fig_weekly, use_container_width=True)
+        
+        with bye_col2:
+            plan = bye_week_planner.optimize(user_team, undrafted, max_pickups=self.roster_requirements['BENCH'])
+            if not plan['problem_weeks']:
+                st.markdown("✅ No bye-week holes - no pickups needed")
+            elif plan['pickups'].empty:
+                st.markdown("⚠️ No available player closes the bye-week holes")
+            else:
+                st.markdown(
+                    f"**🩹 Pickups:** {len(plan['problem_weeks'])} → {len(plan['open_weeks'])} weeks with unfilled starters"
+                )
+                for _, player in plan['pickups'].iterrows():
+                    st.markdown(
+                        f"• {player['Player_Name']} ({player['Position']}, bye W{int(player.get('Bye_Week', 0))}) "
+                        f"- VBD {player['VBD_Value']:.1f}"
+                    )
+                if plan['open_weeks']:
+                    st.markdown(f"⚠️ Still short in week(s) {', '.join(str(week) for week in plan['open_weeks'])}")
+        
+        # Enhanced trade analysis: every 1-for-1 and 2-for-1 deal with each AI roster, scored on both lineups
         st.markdown("#### 💱 Advanced Trade Opportunities")
         
-        trade_col1, trade_col2 = st.columns(2)
+        simulator = st.session_state.get('draft_simulator')
+        partners = dict(simulator.ai_team_rosters()) if simulator else {}
+        trades = trade_evaluator.mutual_trades(user_team, partners)
         
-        with trade_col1:
-            st.markdown("**📈 Roster Strengths to Trade From:**")
-            
-            # Identify position strengths (above average VBD)
-            avg_vbd_by_pos = {
-                'QB': 12, 'RB': 9, 'WR': 8, 'TE': 7, 'K': 3, 'DEF': 4  # Rough benchmarks
-            }
-            
-            trade_assets = []
-            for pos, threshold in avg_vbd_by_pos.items():
-                pos_vbd = position_vbd.get(pos, 0)
-                pos_count = position_counts.get(pos, 0)
-                if pos_count > 0:
-                    avg_pos_vbd = pos_vbd / pos_count
-                    if avg_pos_vbd > threshold and pos_count > 1:
-                        surplus = pos_count - self.roster_requirements.get(pos, 1)
-                        if surplus > 0:
-                            trade_assets.append(f"Strong {pos} depth - consider trading for upgrades")
-            
-            for asset in trade_assets:
-                st.markdown(f"• {asset}")
-            
-            if not trade_assets:
-                st.markdown("• No obvious trade assets - hold current roster")
-        
-        with trade_col2:
-            st.markdown("**📉 Areas to Target in Trades:**")
-            
-            upgrade_targets = []
-            
-            # Identify weak positions
-            for pos, threshold in avg_vbd_by_pos.items():
-                pos_vbd = position_vbd.get(pos, 0)
-                pos_count = position_counts.get(pos, 0)
-                if pos_count > 0:
-                    avg_pos_vbd = pos_vbd / pos_count
-                    if avg_pos_vbd < threshold * 0.8:  # Below 80% of benchmark
-                        upgrade_targets.append(f"Upgrade {pos} - current VBD below optimal")
+        if trades.empty:
+            st.markdown("• No trade improves both starting lineups - hold current roster")
+        else:
+            trade_col1, trade_col2 = st.columns(2)
             
-            for target in upgrade_targets:
-                st.markdown(f"• {target}")
+            with trade_col1:
+                st.markdown("**🤝 Best Mutually Beneficial Deals:**")
+                for _, trade in trades.head(3).iterrows():
+                    st.markdown(f"""
+                    <div style="padding: 0.6rem; margin: 0.3rem 0; background: rgba(102,126,234,0.1); border-left: 3px solid #667eea; border-radius: 6px;">
+                        <div style="font-weight: 600; font-size: 0.9rem;">{trade['Partner']}: {trade['You Give']} → {trade['You Get']}</div>
+                        <div style="font-size: 0.8rem; color: rgba(255,255,255,0.8);">
+                            Your lineup: +{trade['Your Gain']:.1f} VBD | Their lineup: +{trade['Their Gain']:.1f} VBD
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
             
-            if not upgrade_targets:
-                st.markdown("• Roster well-balanced - focus on depth")
+            with trade_col2:
+                st.markdown("**📋 All Ranked Offers:**")
+                st.dataframe(trades.round(1), use_container_width=True, hide_index=True)
 
         # Season-long strategy based on roster construction
         st.markdown("#### 📊 Season-Long Strategy Recommendations")
@@ -3058,6 +3133,8 @@ if 'data_loaded' not in st.session_state:
     st.session_state.data_loaded = False
 if 'players_data' not in st.session_state:
     st.session_state.players_data = pd.DataFrame()
+if 'players_data_version' not in st.session_state:
+    st.session_state.players_data_version = ''
 if 'current_page' not in st.session_state:
     st.session_state.current_page = 'Rankings'
 
@@ -3105,6 +3182,7 @@ if st.session_state.current_page == 'Rankings':
 
                     if not players_data.empty:
                         st.session_state.players_data = players_data
+                        st.session_state.players_data_version = data_version(players_data)
                         st.session_state.data_loaded = True
                         st.balloons()
                         st.success(f"✅ Successfully processed {len(players_data)} players with VBD rankings!")
@@ -3153,24 +3231,28 @@ if st.session_state.current_page == 'Rankings':
 
         st.markdown('</div>', unsafe_allow_html=True)
 
-        # Apply filters
-        filtered_data = data.copy()
-
-        if selected_position != 'All Positions':
-            filtered_data = filtered_data[filtered_data['Position'] == selected_position]
-
-        filtered_data = filtered_data[filtered_data['VBD_Value'] >= min_vbd]
+        # Apply filters on precomputed indexes, sorted by overall rank (VBD-based)
+        engine = filter_engine(
+            data,
+            st.session_state.players_data_version,
+            ('Position',),
+            ('VBD_Value',),
+            order_by='Overall_Rank'
+        )
 
+        search_mask = None
         if search_term:
-            filtered_data = filtered_data[
-                filtered_data['Player_Name'].str.contains(search_term, case=False, na=False)
-            ]
+            # Prebuilt trigram/prefix index (typo tolerant) instead of scanning every name
+            search_mask = search_index(data, st.session_state.players_data_version, 'Player_Name').mask(search_term)
 
-        # Sort by overall rank (VBD-based)
-        filtered_data = filtered_data.sort_values('Overall_Rank', ascending=True)
+        bitmap = engine.match(
+            equals={'Position': selected_position if selected_position != 'All Positions' else None},
+            ranges={'VBD_Value': (min_vbd, np.inf)},
+            mask=search_mask
+        )
 
-        if top_n != "All":
-            filtered_data = filtered_data.head(top_n)
+        # Only the visible rows are materialized
+        filtered_data = engine.rows(engine.positions(bitmap), size=None if top_n == "All" else top_n)
 
         if filtered_data.empty:
             st.warning("⚠️ No players match the selected filters.")
@@ -3481,6 +3563,18 @@ elif st.session_state.current_page == 'Draft':
                 
                 with draft_col3:
                     league_type = st.selectbox("League Type", ["Standard", "PPR", "Half-PPR"], index=1)
+                    market_adp = int(data['ADP'].notna().sum()) if 'ADP' in data.columns else 0
+                    strategy_mix = st.selectbox("AI Opponent Strategies", STRATEGY_MIXES,
+                                                index=STRATEGY_MIXES.index('Market ADP') if market_adp else 0,
+                                                help="Mixed Strategies assigns each AI team a random strategy from the draft seed")
+                    if market_adp:
+                        st.caption(f"📈 Market ADP loaded for {market_adp} players")
+                    draft_seed = int(st.number_input("Draft Seed", 0, 2**31 - 1, DEFAULT_SEED, 1,
+                                                     help="The same seed replays the same AI picks"))
+                    st.session_state.lookahead_tolerance = st.number_input(
+                        "Lookahead Tolerance (EV pts)", 0.0, 20.0, 2.0, 0.5,
+                        help="Stop lookahead rollouts once every candidate's expected value is known within ± this many points (0 = always run the full budget)"
+                    )
 
             with col2:
                 st.markdown("### ⏱️ 12-Player Draft Features")
@@ -3499,7 +3593,7 @@ elif st.session_state.current_page == 'Draft':
 
             if st.button("🚀 Start Real-Time Draft", type="primary", use_container_width=True):
                 # Initialize draft
-                st.session_state.draft_simulator = DraftSimulator(data)
+                st.session_state.draft_simulator = DraftSimulator(data, seed=draft_seed, strategy_mix=strategy_mix)
                 st.session_state.draft_in_progress = True
                 st.session_state.draft_results = []
                 st.session_state.current_pick_number = 1
@@ -3525,6 +3619,10 @@ if st.session_state.get('draft_in_progress', False) and not st.session_state.get
         # Auto-refresh every 1 second during AI turns
         st.rerun()
 
+# Chart cache metrics for this session
+with st.sidebar.expander("⚡ Chart Cache"):
+    figure_cache.render_metrics()
+
 # Enhanced footer
 st.markdown("---")
 st.markdown("""
@@ -4,7 +4,10 @@ import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
 from typing import List, Dict
-import random
+from utils.data_version import data_version
+from utils.result_store import simulation_store
+from utils.rng import DEFAULT_SEED, NFL_DRAFT_STREAM, NFL_RESERVOIR_STREAM, generator
+from utils.simulation import ADPAggregator, ConvergenceMonitor
 
 class DraftSimulator:
     """NFL Draft simulation component."""
@@ -69,7 +72,19 @@ class DraftSimulator:
             )
             
             # Number of simulations
-            num_sims = st.selectbox("Number of Simulations", [1, 5, 10, 25])
+            num_sims = st.selectbox("Number of Simulations", [1, 5, 10, 25, 50, 100, 250])
+            
+            # Adaptive stopping once ADP and draft probabilities are stable
+            tolerances = None
+            if num_sims > 1 and st.checkbox("Adaptive Stopping", value=False,
+                                            help="Run in batches and stop once every confidence interval is within tolerance"):
+                tolerances = {
+                    'adp': st.number_input("ADP Tolerance (picks)", 0.1, 10.0, 1.0, 0.1),
+                    'availability': st.number_input("Draft Probability Tolerance", 0.01, 0.5, 0.1, 0.01)
+                }
+            
+            # Same seed, same drafts
+            seed = int(st.number_input("Random Seed", 0, 2**31 - 1, DEFAULT_SEED, 1))
             
             # Position weights (if using positional needs)
             if sim_type in ["Positional Needs", "Mixed Strategy"]:
@@ -89,7 +104,7 @@ class DraftSimulator:
         
         with col1:
             if run_simulation:
-                self._run_draft_simulation(num_rounds, sim_type, num_sims, position_weights if sim_type != "Best Available" else None)
+                self._run_draft_simulation(num_rounds, sim_type, num_sims, position_weights if sim_type != "Best Available" else None, tolerances, seed)
             else:
                 self._show_simulation_overview()
     
@@ -185,35 +200,88 @@ class DraftSimulator:
                     hide_index=True
                 )
     
-    def _run_draft_simulation(self, num_rounds: int, sim_type: str, num_sims: int, position_weights: Dict = None):
+    def _run_draft_simulation(self, num_rounds: int, sim_type: str, num_sims: int, position_weights: Dict = None,
+                              tolerances: Dict = None, seed: int = DEFAULT_SEED):
         """Run the draft simulation."""
         st.markdown("### 🎯 Simulation Results")
         
-        # Prepare draft eligible players (top performers)
-        eligible_players = self.data.nlargest(min(len(self.data), 32 * num_rounds), 'grade').copy()
-        eligible_players = eligible_players.reset_index(drop=True)
-        
-        # Run multiple simulations
-        all_results = []
-        
-        for sim_num in range(num_sims):
-            simulation_result = self._simulate_single_draft(
-                eligible_players, num_rounds, sim_type, position_weights
-            )
-            simulation_result['simulation'] = sim_num + 1
-            all_results.append(simulation_result)
+        # Identical data, configuration and seed reproduce identical drafts, so reuse stored outputs
+        config = {
+            'num_rounds': num_rounds,
+            'sim_type': sim_type,
+            'num_sims': num_sims,
+            'position_weights': position_weights,
+            'tolerances': tolerances
+        }
+        key = simulation_store.key(data_version(self.data), config, seed)
+        results = simulation_store.get(key)
         
-        # Combine results
-        combined_results = pd.concat(all_results, ignore_index=True)
+        if results is None:
+            results = self._simulate_results(num_rounds, sim_type, num_sims, position_weights, tolerances, seed)
+            simulation_store.put(key, results)
+        else:
+            st.caption("⚡ Loaded from the simulation result store")
         
         # Display results
         if num_sims == 1:
-            self._display_single_simulation(combined_results)
+            self._display_single_simulation(results['draft'])
         else:
-            self._display_multiple_simulations(combined_results, num_sims)
+            report = results['metrics'].get('report')
+            if report is not None and pd.notna(report.iloc[0]):
+                st.info(f"🎯 {report.iloc[0]}")
+            self._display_multiple_simulations(results, 'position_group' in self.data.columns)
+    
+    def _simulate_results(self, num_rounds: int, sim_type: str, num_sims: int, position_weights: Dict = None,
+                          tolerances: Dict = None, seed: int = DEFAULT_SEED) -> Dict[str, pd.DataFrame]:
+        """Simulate the drafts and collect the displayed outputs as DataFrames."""
+        # Prepare draft eligible players (top performers)
+        eligible_players = self.data.nlargest(min(len(self.data), 32 * num_rounds), 'grade').copy()
+        eligible_players = eligible_players.reset_index(drop=True)
+        
+        if num_sims == 1:
+            return {'draft': self._simulate_single_draft(
+                eligible_players, num_rounds, sim_type, position_weights, generator(seed, NFL_DRAFT_STREAM, 0)
+            )}
+        
+        # Stream each simulation into running per-player statistics instead of keeping every draft
+        unique_players = eligible_players.drop_duplicates('name')
+        aggregator = ADPAggregator(
+            unique_players['name'], unique_players['grade'], num_rounds,
+            unique_players['position_group'] if 'position_group' in unique_players.columns else None,
+            rng=generator(seed, NFL_RESERVOIR_STREAM)
+        )
+        monitor = ConvergenceMonitor(num_sims, tolerances) if tolerances else None
+        progress = st.progress(0.0)
+        
+        while aggregator.simulations < num_sims:
+            batch = monitor.next_batch() if monitor else num_sims
+            if batch == 0:
+                break
+            
+            for _ in range(batch):
+                # Simulation i always draws from its own stream, whatever the batch layout
+                aggregator.add(self._simulate_single_draft(
+                    eligible_players, num_rounds, sim_type, position_weights,
+                    generator(seed, NFL_DRAFT_STREAM, aggregator.simulations)
+                ))
+                progress.progress(aggregator.simulations / num_sims)
+            
+            if monitor:
+                monitor.update(aggregator.simulations, {
+                    'adp': aggregator.adp_half_width(),
+                    'availability': aggregator.availability_half_width()
+                })
+        
+        progress.empty()
+        results = aggregator.summary()
+        if monitor:
+            results['metrics']['report'] = monitor.report()
+        return results
     
-    def _simulate_single_draft(self, players: pd.DataFrame, num_rounds: int, sim_type: str, position_weights: Dict = None) -> pd.DataFrame:
+    def _simulate_single_draft(self, players: pd.DataFrame, num_rounds: int, sim_type: str, position_weights: Dict = None,
+                               rng: np.random.Generator = None) -> pd.DataFrame:
         """Simulate a single draft."""
+        rng = rng if rng is not None else np.random.default_rng()
         available_players = players.copy()
         draft_results = []
         
@@ -229,12 +297,12 @@ class DraftSimulator:
                 if sim_type == "Best Available":
                     selected_player = self._select_best_available(available_players)
                 elif sim_type == "Positional Needs":
-                    selected_player = self._select_by_position_need(available_players, position_weights)
+                    selected_player = self._select_by_position_need(available_players, position_weights, rng)
                 else:  # Mixed Strategy
-                    if random.random() < 0.7:  # 70% best available, 30% positional need
+                    if rng.random() < 0.7:  # 70% best available, 30% positional need
                         selected_player = self._select_best_available(available_players)
                     else:
-                        selected_player = self._select_by_position_need(available_players, position_weights)
+                        selected_player = self._select_by_position_need(available_players, position_weights, rng)
                 
                 if selected_player is not None:
                     draft_results.append({
@@ -264,14 +332,14 @@ class DraftSimulator:
         best_player = players.iloc[0]  # Players should already be sorted by grade
         return best_player.to_dict()
     
-    def _select_by_position_need(self, players: pd.DataFrame, position_weights: Dict) -> Dict:
+    def _select_by_position_need(self, players: pd.DataFrame, position_weights: Dict, rng: np.random.Generator = None) -> Dict:
         """Select player based on positional needs."""
         if len(players) == 0 or not position_weights:
             return self._select_best_available(players)
         
         # Calculate weighted scores
         players_copy = players.copy()
-        players_copy['weighted_score'] = 0
+        players_copy['weighted_score'] = 0.0
         
         for pos_group, weight in position_weights.items():
             if 'position_group' in players_copy.columns:
@@ -282,7 +350,8 @@ class DraftSimulator:
                 players_copy['weighted_score'] = players_copy['grade']
         
         # Add some randomness to avoid always picking the same player
-        randomness = np.random.normal(0, 0.1, len(players_copy))
+        rng = rng if rng is not None else np.random.default_rng()
+        randomness = rng.normal(0, 0.1, len(players_copy))
         players_copy['final_score'] = players_copy['weighted_score'] + randomness
         
         best_player = players_copy.loc[players_copy['final_score'].idxmax()]
@@ -382,35 +451,33 @@ class DraftSimulator:
                 round_display = round_data[['pick', 'team', 'player', 'position', 'grade']].copy()
                 st.dataframe(round_display.round(2), width='stretch', hide_index=True)
     
-    def _display_multiple_simulations(self, results: pd.DataFrame, num_sims: int):
+    def _display_multiple_simulations(self, results: Dict[str, pd.DataFrame], has_position_groups: bool = True):
         """Display results of multiple simulations."""
+        metrics = results['metrics'].iloc[0]
+        num_sims = int(metrics['simulations'])
         st.markdown(f"#### 📊 Analysis of {num_sims} Simulations")
         
         # Overall statistics
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            total_picks = len(results)
-            st.metric("Total Picks", total_picks)
+            st.metric("Total Picks", int(metrics['total_picks']))
         
         with col2:
-            avg_grade = results['grade'].mean()
-            st.metric("Avg Grade", f"{avg_grade:.2f}")
+            st.metric("Avg Grade", f"{metrics['avg_grade']:.2f}")
         
         with col3:
-            unique_players = results['player'].nunique()
-            st.metric("Unique Players Drafted", unique_players)
+            st.metric("Unique Players Drafted", int(metrics['unique_players']))
         
         with col4:
-            if 'position_group' in results.columns:
-                position_diversity = results['position_group'].nunique()
-                st.metric("Position Groups", position_diversity)
+            if has_position_groups:
+                st.metric("Position Groups", len(results['position_mix']))
         
         # Draft frequency analysis
         st.markdown("#### 📈 Draft Frequency Analysis")
         
         # Most frequently drafted players
-        player_frequency = results['player'].value_counts().head(20)
+        player_frequency = results['frequency']['Times Drafted']
         
         col_a, col_b = st.columns(2)
         
@@ -436,8 +503,8 @@ class DraftSimulator:
         
         with col_b:
             # Position frequency
-            if 'position_group' in results.columns:
-                pos_frequency = results['position_group'].value_counts()
+            if has_position_groups:
+                pos_frequency = results['position_mix']['count']
                 
                 fig_pos_freq = px.pie(
                     values=pos_frequency.values,
@@ -457,21 +524,14 @@ class DraftSimulator:
         # Average draft position
         st.markdown("#### 📍 Average Draft Position")
         
-        avg_draft_pos = results.groupby('player').agg({
-            'overall': ['mean', 'std', 'count'],
-            'grade': 'first'
-        }).round(2)
-        
-        avg_draft_pos.columns = ['Avg Pick', 'Std Dev', 'Times Drafted', 'Grade']
-        avg_draft_pos = avg_draft_pos[avg_draft_pos['Times Drafted'] >= max(1, num_sims * 0.2)]  # Show players drafted in at least 20% of sims
-        avg_draft_pos = avg_draft_pos.sort_values('Avg Pick').head(30)
+        avg_draft_pos = results['adp']  # Players drafted in at least 20% of sims
         
         st.dataframe(avg_draft_pos, width='stretch')
         
         # Round analysis
         st.markdown("#### 🔄 Round-by-Round Simulation Analysis")
         
-        round_analysis = results.groupby(['round', 'simulation'])['grade'].mean().reset_index()
+        round_analysis = results['round_grades']
         
         fig_round_trends = px.box(
             round_analysis,
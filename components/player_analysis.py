@@ -4,12 +4,21 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+from typing import Optional
+from utils.data_version import data_version
+from utils.percentiles import percentile_table
+from utils.search_index import search_index
+from utils.similarity import similarity_index
+
+SIMILARITY_FEATURES = ('grade', 'forty_time', 'bench_press', 'vertical', 'broad_jump', 'three_cone',
+                       'shuttle', 'height_inches', 'weight')
 
 class PlayerAnalysis:
     """Individual player analysis component."""
     
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, version: Optional[str] = None):
         self.data = data
+        self.data_version = version or data_version(data)
         self.colors = {
             'primary': '#FF6B35',
             'secondary': '#4ECDC4',
@@ -34,11 +43,9 @@ class PlayerAnalysis:
             # Search and filter
             search_term = st.text_input("🔍 Search Player", placeholder="Enter player name...")
             
-            # Filter data based on search
+            # Filter data based on search (trigram/prefix index, typo tolerant)
             if search_term:
-                filtered_data = self.data[
-                    self.data['name'].str.contains(search_term, case=False, na=False)
-                ]
+                filtered_data = self.data.iloc[search_index(self.data, self.data_version, 'name').search(search_term)]
             else:
                 filtered_data = self.data
             
@@ -232,18 +239,22 @@ class PlayerAnalysis:
         
         all_metrics = metrics + [m for m in combine_metrics + physical_metrics if m in self.data.columns]
         
+        # Percentile lookups against the cached per-position table
+        table = percentile_table(self.data, self.data_version, 'position')
+        position = player_data['position']
+        
         percentile_data = []
         for metric in all_metrics:
-            if metric in player_data and not pd.isna(player_data[metric]):
+            if metric in table.metrics and not pd.isna(player_data[metric]):
                 player_value = player_data[metric]
-                position_values = position_data[metric].dropna()
+                position_stats = table.stats(metric, position)
                 
-                if len(position_values) > 1:
-                    percentile = (position_values < player_value).mean() * 100
+                if position_stats['count'] > 1:
+                    percentile = table.percentile_of(metric, player_value, position)
                     percentile_data.append({
                         'Metric': metric.replace('_', ' ').title(),
                         'Player Value': f"{player_value:.2f}",
-                        'Position Avg': f"{position_values.mean():.2f}",
+                        'Position Avg': f"{position_stats['mean']:.2f}",
                         'Percentile': f"{percentile:.1f}%",
                         'Raw_Percentile': percentile
                     })
@@ -326,11 +337,21 @@ class PlayerAnalysis:
             st.warning(f"No other {player_data['position']} players found for comparison.")
             return
         
+        # Default to the nearest same-position players by combine profile
+        index = similarity_index(self.data, self.data_version, SIMILARITY_FEATURES, 'position')
+        default_players = position_players['name'].tolist()[:3]
+        # Find the player's row by its index label; names can be missing or repeated
+        player_rows = np.flatnonzero(self.data.index == player_data.name)
+        if index.features and len(player_rows):
+            neighbor_rows, _ = index.neighbors(int(player_rows[0]), k=3)
+            options = set(position_players['name'])
+            default_players = [name for name in self.data['name'].iloc[neighbor_rows] if name in options] or default_players
+        
         # Select comparison players
         comparison_players = st.multiselect(
             "Select Players for Comparison",
             position_players['name'].tolist(),
-            default=position_players['name'].tolist()[:3]
+            default=default_players
         )
         
         if not comparison_players:
@@ -372,32 +393,37 @@ class PlayerAnalysis:
             hide_index=True
         )
         
-        # Radar chart comparison
-        if len(available_metrics) >= 3:
+        # Radar chart comparison, over the metrics the position table can normalize
+        table = percentile_table(self.data, self.data_version, 'position')
+        radar_metrics = [m for m in available_metrics if m in table.metrics]
+        if len(radar_metrics) >= 3:
             st.markdown("##### 📊 Multi-Metric Comparison")
             
-            # Normalize metrics for radar chart
-            normalized_data = comparison_data[available_metrics].copy()
-            for col in available_metrics:
-                col_min = normalized_data[col].min()
-                col_max = normalized_data[col].max()
-                if col_max > col_min:
-                    normalized_data[col] = (normalized_data[col] - col_min) / (col_max - col_min)
-                else:
-                    normalized_data[col] = 0.5
+            scale_method = st.radio(
+                "Radar Scale",
+                ["Position Min-Max", "Position Percentile"],
+                horizontal=True,
+                help="Scaled against every player at the position, so values do not depend on the selection"
+            )
+            
+            # Normalize against the position's full distribution with one table lookup
+            normalized_values = table.normalize(
+                radar_metrics,
+                comparison_data[radar_metrics].to_numpy(dtype=float),
+                player_data['position'],
+                'percentile' if scale_method == "Position Percentile" else 'minmax'
+            )
             
             fig_radar_comp = go.Figure()
             
             colors = [self.colors['primary'], self.colors['secondary'], 
                      self.colors['accent'], self.colors['success'], self.colors['warning']]
+            theta = [m.replace('_', ' ').title() for m in radar_metrics]
             
-            for i, (_, row) in enumerate(comparison_data.iterrows()):
-                player_name = row['name']
-                norm_values = normalized_data.iloc[i]
-                
+            for i, (player_name, norm_values) in enumerate(zip(comparison_data['name'], normalized_values)):
                 fig_radar_comp.add_trace(go.Scatterpolar(
-                    r=norm_values.tolist() + [norm_values.iloc[0]],
-                    theta=[m.replace('_', ' ').title() for m in available_metrics] + [available_metrics[0].replace('_', ' ').title()],
+                    r=np.append(norm_values, norm_values[0]),
+                    theta=theta + theta[:1],
                     fill='toself' if player_name == player_data['name'] else None,
                     name=player_name,
                     line_color=colors[i % len(colors)]
@@ -409,7 +435,7 @@ class PlayerAnalysis:
                         visible=True,
                         range=[0, 1]
                     )),
-                title="Player Comparison (Normalized Metrics)",
+                title=f"Player Comparison (Normalized Within {player_data['position']})",
                 plot_bgcolor='rgba(0,0,0,0)',
                 paper_bgcolor='rgba(0,0,0,0)',
                 font=dict(color='white')
@@ -4,13 +4,28 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional
+from utils.data_version import data_version
+from utils.filter_engine import filter_engine
+from utils.tiers import TIER_METHODS, prospect_tiers
 
 class PlayerRanking:
     """Comprehensive player ranking component with advanced filtering and modern UI."""
     
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, version: Optional[str] = None):
         self.data = data
+        
+        # Callers pass the version computed at upload, so reruns skip re-hashing the frame
+        self.data_version = version or data_version(data)
+        self.tiers = None
+        self.filter_engine = filter_engine(
+            data,
+            self.data_version,
+            ('position_group', 'position', 'college'),
+            ('grade',),
+            order_by='grade' if 'grade' in data.columns else None,
+            ascending=False
+        )
         self.colors = {
             'primary': '#FF6B35',
             'secondary': '#4ECDC4',
@@ -85,19 +100,30 @@ class PlayerRanking:
             
             # Number of players to show
             num_players = st.selectbox("📋 Players to Display", [25, 50, 100, 200, 500, "All"])
+            
+            # Tier boundaries (computed once per data version and method)
+            tier_method = st.selectbox(
+                "💎 Tier Boundaries",
+                TIER_METHODS,
+                help="Fixed grade thresholds, or breaks fitted to this class's grade distribution"
+            )
         
-        # Apply filters
-        filtered_data = self._apply_filters(
+        self.tiers = prospect_tiers(self.data, self.data_version, tier_method)
+        
+        # Apply filters (bitmap indexes; rows are materialized only when a view needs them)
+        positions = self._apply_filters(
             selected_position, 
             selected_specific_position if 'position' in self.data.columns else None,
             grade_range if 'grade' in self.data.columns else None,
             selected_college if 'college' in self.data.columns else None
         )
         
-        if filtered_data.empty:
+        if len(positions) == 0:
             st.warning("No players match the selected filters.")
             return
         
+        ranking_page = self.filter_engine.rows(positions, size=None if num_players == "All" else num_players)
+        
         # Main content tabs
         tab1, tab2, tab3, tab4, tab5 = st.tabs([
             "🏆 Player Rankings", 
@@ -108,65 +134,45 @@ class PlayerRanking:
         ])
         
         with tab1:
-            self._render_player_rankings(filtered_data, num_players)
+            self._render_player_rankings(ranking_page, num_players)
         
         with tab2:
-            self._render_statistical_overview(filtered_data)
+            self._render_statistical_overview(positions)
         
         with tab3:
-            self._render_position_breakdown(filtered_data)
+            self._render_position_breakdown(positions)
         
         with tab4:
-            self._render_performance_analysis(filtered_data)
+            self._render_performance_analysis(positions)
         
         with tab5:
-            self._render_prospect_tiers(filtered_data)
+            self._render_prospect_tiers(positions)
     
-    def _apply_filters(self, position_group, specific_position, grade_range, college):
-        """Apply all selected filters to the data."""
-        filtered_data = self.data.copy()
-        
-        # Position group filter
-        if position_group != 'All Positions' and 'position_group' in filtered_data.columns:
-            filtered_data = filtered_data[filtered_data['position_group'] == position_group]
-        
-        # Specific position filter
-        if specific_position and specific_position != 'All' and 'position' in filtered_data.columns:
-            filtered_data = filtered_data[filtered_data['position'] == specific_position]
-        
-        # Grade range filter
-        if grade_range and 'grade' in filtered_data.columns:
-            filtered_data = filtered_data[
-                (filtered_data['grade'] >= grade_range[0]) & 
-                (filtered_data['grade'] <= grade_range[1])
-            ]
-        
-        # College filter
-        if college and college != 'All Colleges' and 'college' in filtered_data.columns:
-            filtered_data = filtered_data[filtered_data['college'] == college]
-        
-        return filtered_data
+    def _apply_filters(self, position_group, specific_position, grade_range, college) -> np.ndarray:
+        """Apply all selected filters and return matching row positions, best grade first."""
+        bitmap = self.filter_engine.match(
+            equals={
+                'position_group': position_group if position_group != 'All Positions' else None,
+                'position': specific_position if specific_position and specific_position != 'All' else None,
+                'college': college if college and college != 'All Colleges' else None
+            },
+            ranges={'grade': grade_range} if grade_range else None
+        )
+        return self.filter_engine.positions(bitmap)
     
     def _get_grade_badge_class(self, grade):
-        """Get CSS class for grade badge based on grade value."""
-        if pd.isna(grade):
-            return 'low'
-        elif grade >= 8.5:
-            return 'elite'
-        elif grade >= 7.5:
-            return 'high'
-        elif grade >= 6.5:
-            return 'medium'
-        else:
-            return 'low'
+        """Get CSS class for grade badge from the tier boundaries."""
+        if self.tiers is None:
+            self.tiers = prospect_tiers(self.data, self.data_version)
+        return self.tiers.badge_classes([grade])[0]
     
-    def _render_grade_badge(self, grade, player_name):
+    def _render_grade_badge(self, grade, player_name, badge_class=None):
         """Render a colorful grade badge."""
         if pd.isna(grade):
             badge_class = 'low'
             grade_text = 'N/A'
         else:
-            badge_class = self._get_grade_badge_class(grade)
+            badge_class = badge_class or self._get_grade_badge_class(grade)
             grade_text = f"{grade:.1f}"
         
         badge_color = self.colors[badge_class]
@@ -254,16 +260,17 @@ class PlayerRanking:
         # Enhanced rankings table
         st.markdown("#### 📋 Rankings Table")
         
-        # Create enhanced display data
+        # Create enhanced display data (badge classes looked up for the whole page at once)
+        badge_classes = self.tiers.badge_classes(sorted_data['grade']) if self.tiers else [None] * len(sorted_data)
         display_data = []
-        for idx, (_, player) in enumerate(sorted_data.iterrows(), 1):
+        for idx, ((_, player), badge_class) in enumerate(zip(sorted_data.iterrows(), badge_classes), 1):
             player_info = {
                 'Rank': f"#{idx}",
                 'Player': player.get('name', 'Unknown'),
                 'Position': player.get('position', 'Unknown'),
                 'College': player.get('college', 'Unknown'),
                 'Grade': player.get('grade', 0),
-                'Grade_Badge': self._render_grade_badge(player.get('grade'), player.get('name', '')),
+                'Grade_Badge': self._render_grade_badge(player.get('grade'), player.get('name', ''), badge_class),
                 'Position_Badge': self._render_position_badge(player.get('position_group', ''))
             }
             
@@ -328,28 +335,31 @@ class PlayerRanking:
                 mime="text/csv"
             )
     
-    def _render_statistical_overview(self, data):
+    def _render_statistical_overview(self, positions):
         """Render statistical overview with advanced charts."""
         st.markdown("### 📊 Statistical Overview")
         
-        if 'grade' not in data.columns:
+        if 'grade' not in self.data.columns:
             st.warning("Grade data required for statistical analysis.")
             return
         
+        # Only the grade column is needed for the distribution charts
+        grades = self.filter_engine.values('grade', positions)
+        
         # Grade distribution
         col1, col2 = st.columns(2)
         
         with col1:
             fig_hist = px.histogram(
-                data,
-                x='grade',
+                x=grades,
+                labels={'x': 'grade'},
                 nbins=25,
                 title="Grade Distribution",
                 color_discrete_sequence=[self.colors['primary']]
             )
             
             # Add mean line
-            mean_grade = data['grade'].mean()
+            mean_grade = np.nanmean(grades)
             fig_hist.add_vline(
                 x=mean_grade,
                 line_dash="dash",
@@ -366,35 +376,26 @@ class PlayerRanking:
             st.plotly_chart(fig_hist, width='stretch')
         
         with col2:
-            # Grade tiers pie chart
-            grade_tiers = []
-            for _, row in data.iterrows():
-                grade = row.get('grade', 0)
-                if pd.isna(grade):
-                    tier = 'Ungraded'
-                elif grade >= 8.5:
-                    tier = 'Elite (8.5+)'
-                elif grade >= 7.5:
-                    tier = 'High (7.5-8.4)'
-                elif grade >= 6.5:
-                    tier = 'Medium (6.5-7.4)'
-                else:
-                    tier = 'Low (<6.5)'
-                grade_tiers.append(tier)
+            # Grade tiers pie chart, counted from the cached tier codes of the selected boundary method
+            codes = self.tiers.codes[positions]
+            tier_counts = np.bincount(codes[codes >= 0], minlength=len(self.tiers.labels))[::-1]
+            tier_names = self.tiers.labels[::-1]
+            tier_colors = [self.colors[name] for name in ['elite', 'high', 'medium', 'low', 'danger']]
+            color_map = dict(zip(tier_names, tier_colors), Ungraded='#666666')
             
-            tier_counts = pd.Series(grade_tiers).value_counts()
+            present = tier_counts > 0
+            names = [name for name, keep in zip(tier_names, present) if keep]
+            values = tier_counts[present].tolist()
+            if (codes < 0).any():
+                names.append('Ungraded')
+                values.append(int((codes < 0).sum()))
             
             fig_pie = px.pie(
-                values=tier_counts.values,
-                names=tier_counts.index,
+                values=values,
+                names=names,
                 title="Player Distribution by Grade Tier",
-                color_discrete_sequence=[
-                    self.colors['elite'],
-                    self.colors['high'],
-                    self.colors['medium'],
-                    self.colors['low'],
-                    '#666666'
-                ]
+                color=names,
+                color_discrete_map=color_map
             )
             
             fig_pie.update_layout(
@@ -406,11 +407,11 @@ class PlayerRanking:
             st.plotly_chart(fig_pie, width='stretch')
         
         # Position vs Grade analysis
-        if 'position_group' in data.columns:
+        if 'position_group' in self.data.columns:
             st.markdown("#### 📈 Grade Analysis by Position")
             
             fig_box = px.box(
-                data,
+                self.filter_engine.rows(positions, columns=['position_group', 'grade']),
                 x='position_group',
                 y='grade',
                 title="Grade Distribution by Position Group",
@@ -428,22 +429,17 @@ class PlayerRanking:
             
             st.plotly_chart(fig_box, width='stretch')
     
-    def _render_position_breakdown(self, data):
+    def _render_position_breakdown(self, positions):
         """Render detailed position breakdown."""
         st.markdown("### 🎯 Position Breakdown")
         
-        if 'position_group' not in data.columns:
+        if 'position_group' not in self.data.columns:
             st.warning("Position group data required for breakdown analysis.")
             return
         
-        # Position summary table
-        position_stats = data.groupby('position_group').agg({
-            'grade': ['count', 'mean', 'std', 'max', 'min'],
-            'name': 'count'
-        }).round(2)
-        
-        position_stats.columns = ['Count', 'Avg Grade', 'Std Dev', 'Max Grade', 'Min Grade', 'Total']
-        position_stats = position_stats[['Count', 'Avg Grade', 'Std Dev', 'Max Grade', 'Min Grade']]
+        # Position summary table, aggregated from the filter engine's cached group codes
+        position_stats = self.filter_engine.group_stats('position_group', 'grade', positions).round(2)
+        position_stats.columns = ['Count', 'Avg Grade', 'Std Dev', 'Max Grade', 'Min Grade']
         position_stats = position_stats.sort_values('Avg Grade', ascending=False)
         
         st.dataframe(position_stats, width='stretch')
@@ -490,15 +486,19 @@ class PlayerRanking:
             
             st.plotly_chart(fig_avg, width='stretch')
     
-    def _render_performance_analysis(self, data):
+    def _render_performance_analysis(self, positions):
         """Render performance analysis with combine metrics."""
         st.markdown("### 📈 Performance Analysis")
         
         # Combine metrics analysis
         combine_metrics = ['forty_time', 'bench_press', 'vertical', 'broad_jump', 'three_cone', 'shuttle']
-        available_metrics = [col for col in combine_metrics if col in data.columns]
+        available_metrics = [col for col in combine_metrics if col in self.data.columns]
         
         if available_metrics:
+            # Materialize only the columns the charts use
+            label_columns = [col for col in ['name', 'position_group'] if col in self.data.columns]
+            data = self.filter_engine.rows(positions, columns=available_metrics + ['grade'] + label_columns)
+            
             st.markdown("#### 🏃‍♂️ Combine Performance")
             
             # Create correlation matrix
@@ -544,62 +544,54 @@ class PlayerRanking:
                 
                 st.plotly_chart(fig_scatter, width='stretch')
     
-    def _render_prospect_tiers(self, data):
+    def _render_prospect_tiers(self, positions):
         """Render prospect tier analysis."""
         st.markdown("### 💎 Prospect Tiers")
         
-        if 'grade' not in data.columns:
+        if 'grade' not in self.data.columns:
             st.warning("Grade data required for tier analysis.")
             return
         
-        # Define tiers
-        tiers = {
-            'Elite Prospects (8.5+)': data[data['grade'] >= 8.5],
-            'High-Quality Prospects (7.5-8.4)': data[(data['grade'] >= 7.5) & (data['grade'] < 8.5)],
-            'Solid Prospects (6.5-7.4)': data[(data['grade'] >= 6.5) & (data['grade'] < 7.5)],
-            'Developmental Prospects (5.5-6.4)': data[(data['grade'] >= 5.5) & (data['grade'] < 6.5)],
-            'Late Round/UDFA (<5.5)': data[data['grade'] < 5.5]
-        }
+        # Tier column and summaries are precomputed; filters only select rows
+        summary = self.tiers.summary if len(positions) == len(self.data) else self.tiers.summarize(positions)
+        top_players = self.tiers.top_players(positions)
         
         # Tier analysis
-        for tier_name, tier_data in tiers.items():
-            if not tier_data.empty:
-                with st.expander(f"{tier_name} ({len(tier_data)} players)"):
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        st.metric("Players", len(tier_data))
-                        if 'position_group' in tier_data.columns:
-                            most_common_pos = tier_data['position_group'].value_counts().index[0]
-                            st.metric("Top Position", most_common_pos)
-                    
-                    with col2:
-                        avg_grade = tier_data['grade'].mean()
-                        st.metric("Avg Grade", f"{avg_grade:.2f}")
-                        if 'college' in tier_data.columns:
-                            most_common_college = tier_data['college'].value_counts().index[0]
-                            st.metric("Top College", most_common_college)
-                    
-                    with col3:
-                        grade_range = f"{tier_data['grade'].min():.1f} - {tier_data['grade'].max():.1f}"
-                        st.metric("Grade Range", grade_range)
+        for tier_name, tier_stats in summary.iterrows():
+            with st.expander(f"{tier_name} ({int(tier_stats['count'])} players)"):
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.metric("Players", int(tier_stats['count']))
+                    if pd.notna(tier_stats.get('top_position')):
+                        st.metric("Top Position", tier_stats['top_position'])
+                
+                with col2:
+                    st.metric("Avg Grade", f"{tier_stats['mean']:.2f}")
+                    if pd.notna(tier_stats.get('top_college')):
+                        st.metric("Top College", tier_stats['top_college'])
+                
+                with col3:
+                    grade_range = f"{tier_stats['min']:.1f} - {tier_stats['max']:.1f}"
+                    st.metric("Grade Range", grade_range)
+                
+                # Top players in tier
+                tier_data = top_players.get(tier_name)
+                if tier_data is not None and len(tier_data) > 0:
+                    st.markdown("**Top Players:**")
+                    badge_classes = self.tiers.badge_classes(tier_data['grade'])
                     
-                    # Top players in tier
-                    if len(tier_data) > 0:
-                        st.markdown("**Top Players:**")
-                        top_tier_players = tier_data.nlargest(min(10, len(tier_data)), 'grade')
+                    for (_, player), badge_class in zip(tier_data.iterrows(), badge_classes):
+                        col_a, col_b, col_c, col_d = st.columns([3, 2, 1, 1])
+                        
+                        with col_a:
+                            st.markdown(f"**{player.get('name', 'Unknown')}**")
+                        
+                        with col_b:
+                            st.markdown(self._render_position_badge(player.get('position_group', '')), unsafe_allow_html=True)
+                        
+                        with col_c:
+                            st.markdown(self._render_grade_badge(player.get('grade'), player.get('name', ''), badge_class), unsafe_allow_html=True)
                         
-                        for _, player in top_tier_players.iterrows():
-                            col_a, col_b, col_c, col_d = st.columns([3, 2, 1, 1])
-                            
-                            with col_a:
-                                st.markdown(f"**{player.get('name', 'Unknown')}**")
-                            
-                            with col_b:
-                                st.markdown(self._render_position_badge(player.get('position_group', '')), unsafe_allow_html=True)
-                            
-                            with col_c:
-                                st.markdown(self._render_grade_badge(player.get('grade'), player.get('name', '')), unsafe_allow_html=True)
-                            
-                            with col_d:
-                                st.markdown(f"*{player.get('college', 'Unknown')}*")
\ No newline at end of file
+                        with col_d:
+                            st.markdown(f"*{player.get('college', 'Unknown')}*")
\ No newline at end of file
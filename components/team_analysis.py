@@ -4,13 +4,18 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional
+import time
+from scipy.optimize import linear_sum_assignment
+from utils.data_version import data_version
+from utils.figure_cache import figure_cache
 
 class TeamAnalysis:
     """Team analysis component for NFL Draft evaluation."""
     
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, version: Optional[str] = None):
         self.data = data
+        self.data_version = version or data_version(data)
         self.colors = {
             'primary': '#FF6B35',
             'secondary': '#4ECDC4',
@@ -63,6 +68,57 @@ class TeamAnalysis:
             'Skill Position': ['Running Back', 'Tight End'],
             'Specialist': ['Special Teams']
         }
+        
+        # Dense team x position group need matrices, built once from nfl_teams
+        self._build_need_matrices()
+    
+    def _build_need_matrices(self):
+        """Build team x position group need-level (2/1/0) and need-multiplier matrices."""
+        self.team_names = list(self.nfl_teams.keys())
+        
+        # Data position groups first (heatmap columns), then any need groups missing from the data
+        data_groups = []
+        if 'position_group' in self.data.columns:
+            data_groups = [group for group in self.data['position_group'].unique() if pd.notna(group)]
+        need_groups = sorted({group for needs in self.nfl_teams.values() for group in needs['primary_needs'] + needs['secondary_needs']})
+        self.position_groups = data_groups + [group for group in need_groups if group not in data_groups]
+        self.data_group_count = len(data_groups)
+        group_index = {group: i for i, group in enumerate(self.position_groups)}
+        
+        # Extra last column holds players whose position group no team lists
+        self.need_levels = np.zeros((len(self.team_names), len(self.position_groups) + 1), dtype=np.int8)
+        for team_idx, needs in enumerate(self.nfl_teams.values()):
+            self.need_levels[team_idx, [group_index[need] for need in needs['primary_needs']]] = 2
+            self.need_levels[team_idx, [group_index[need] for need in needs['secondary_needs']]] = 1
+        
+        self.need_multipliers = np.array([1.0, 1.5, 2.0])[self.need_levels]
+        
+        # League-wide demand per position group
+        self.primary_demand = (self.need_levels[:, :-1] == 2).sum(axis=0)
+        self.secondary_demand = (self.need_levels[:, :-1] == 1).sum(axis=0)
+    
+    def _player_group_codes(self, data: pd.DataFrame) -> np.ndarray:
+        """Map each player's position group to its need-matrix column."""
+        codes = pd.Categorical(data['position_group'], categories=self.position_groups).codes
+        return np.where(codes < 0, len(self.position_groups), codes)
+    
+    def _team_fit_matrix(self, data: pd.DataFrame) -> np.ndarray:
+        """Calculate every team's fit score for every player in one broadcast (teams x players)."""
+        grades = data['grade'].to_numpy(dtype=float)
+        return self.need_multipliers[:, self._player_group_codes(data)] * grades[np.newaxis, :]
+    
+    def _top_k_per_team(self, fit_matrix: np.ndarray, k: int) -> np.ndarray:
+        """Get column indices of each team's k best fits, best first."""
+        k = min(k, fit_matrix.shape[1])
+        scores = np.where(np.isnan(fit_matrix), -np.inf, fit_matrix)
+        
+        if k < scores.shape[1]:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.tile(np.arange(scores.shape[1]), (scores.shape[0], 1))
+        
+        order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1, kind='stable')
+        return np.take_along_axis(top, order, axis=1)
     
     def render(self):
         """Render the team analysis interface."""
@@ -73,12 +129,13 @@ class TeamAnalysis:
             return
         
         # Main analysis tabs
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
+        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
             "🎯 Team Fit Analysis", 
             "📊 Positional Value", 
             "🔄 Team Needs Matrix", 
             "💎 Value Opportunities",
-            "📈 Draft Strategy"
+            "📈 Draft Strategy",
+            "🧮 Draft Allocation"
         ])
         
         with tab1:
@@ -95,6 +152,9 @@ class TeamAnalysis:
         
         with tab5:
             self._render_draft_strategy()
+        
+        with tab6:
+            self._render_draft_allocation()
     
     def _render_team_fit_analysis(self):
         """Render team fit analysis."""
@@ -134,8 +194,8 @@ class TeamAnalysis:
         primary_needs = team_needs['primary_needs']
         secondary_needs = team_needs['secondary_needs']
         
-        # Team fit scoring
-        fit_scores = self._calculate_team_fit_scores(analysis_data, primary_needs, secondary_needs)
+        # Team fit scoring (top 20 only)
+        fit_scores = self._calculate_team_fit_scores(analysis_data, selected_team, top_k=20)
         
         # Display team needs
         st.markdown("#### 📋 Team Needs Assessment")
@@ -159,26 +219,29 @@ class TeamAnalysis:
             top_fits = fit_scores.head(20)
             
             # Fit score visualization
-            fig_fit = px.bar(
-                top_fits,
-                x='team_fit_score',
-                y='name',
-                orientation='h',
-                title=f"Top 20 Player Fits for {selected_team}",
-                color='team_fit_score',
-                color_continuous_scale='RdYlGn',
-                hover_data=['position_group', 'grade', 'need_priority']
-            )
-            
-            fig_fit.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white'),
-                xaxis_title="Team Fit Score",
-                yaxis_title="Player",
-                height=600
-            )
+            def build_fig_fit():
+                fig_fit = px.bar(
+                    top_fits,
+                    x='team_fit_score',
+                    y='name',
+                    orientation='h',
+                    title=f"Top 20 Player Fits for {selected_team}",
+                    color='team_fit_score',
+                    color_continuous_scale='RdYlGn',
+                    hover_data=['position_group', 'grade', 'need_priority']
+                )
+                
+                fig_fit.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white'),
+                    xaxis_title="Team Fit Score",
+                    yaxis_title="Player",
+                    height=600
+                )
+                return fig_fit
             
+            fig_fit = figure_cache.figure('team_fit_top20', self.data_version, (selected_team, analysis_depth), build_fig_fit)
             st.plotly_chart(fig_fit, width='stretch')
             
             # Detailed fit table
@@ -215,53 +278,51 @@ class TeamAnalysis:
             needs_df = pd.DataFrame(needs_analysis)
             
             # Needs summary chart
-            fig_needs = px.bar(
-                needs_df,
-                x='Position Group',
-                y='Available Players',
-                color='Priority',
-                title="Available Players by Team Need Priority",
-                color_discrete_map={'Primary': self.colors['danger'], 'Secondary': self.colors['warning']}
-            )
-            
-            fig_needs.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white')
-            )
+            def build_fig_needs():
+                fig_needs = px.bar(
+                    needs_df,
+                    x='Position Group',
+                    y='Available Players',
+                    color='Priority',
+                    title="Available Players by Team Need Priority",
+                    color_discrete_map={'Primary': self.colors['danger'], 'Secondary': self.colors['warning']}
+                )
+                
+                fig_needs.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white')
+                )
+                return fig_needs
             
+            fig_needs = figure_cache.figure('team_fit_needs', self.data_version, (selected_team, analysis_depth), build_fig_needs)
             st.plotly_chart(fig_needs, width='stretch')
             
             st.dataframe(needs_df.round(2), width='stretch', hide_index=True)
     
-    def _calculate_team_fit_scores(self, data: pd.DataFrame, primary_needs: List, secondary_needs: List) -> pd.DataFrame:
-        """Calculate team fit scores for players."""
-        scored_data = data.copy()
-        
-        # Initialize scores
-        scored_data['need_priority'] = 'Not a Need'
-        scored_data['need_multiplier'] = 1.0
-        scored_data['team_fit_score'] = 0.0
-        scored_data['value_score'] = 0.0
-        
-        # Assign need priorities and multipliers
-        primary_mask = scored_data['position_group'].isin(primary_needs)
-        secondary_mask = scored_data['position_group'].isin(secondary_needs)
+    def _calculate_team_fit_scores(self, data: pd.DataFrame, team: str, top_k: int = None) -> pd.DataFrame:
+        """Calculate team fit scores for players from the team's row of the fit matrix."""
+        team_idx = self.team_names.index(team)
+        fit_matrix = self._team_fit_matrix(data)
         
-        scored_data.loc[primary_mask, 'need_priority'] = 'Primary Need'
-        scored_data.loc[primary_mask, 'need_multiplier'] = 2.0
+        if top_k is not None:
+            rows = self._top_k_per_team(fit_matrix[[team_idx]], top_k)[0]
+        else:
+            rows = np.argsort(-np.where(np.isnan(fit_matrix[team_idx]), -np.inf, fit_matrix[team_idx]), kind='stable')
         
-        scored_data.loc[secondary_mask, 'need_priority'] = 'Secondary Need'
-        scored_data.loc[secondary_mask, 'need_multiplier'] = 1.5
+        scored_data = data.iloc[rows].copy()
+        group_codes = self._player_group_codes(data)[rows]
         
-        # Calculate team fit score (grade * need multiplier)
-        scored_data['team_fit_score'] = scored_data['grade'] * scored_data['need_multiplier']
+        # Need priority and multiplier come straight from the need matrices
+        scored_data['need_priority'] = np.array(['Not a Need', 'Secondary Need', 'Primary Need'])[self.need_levels[team_idx, group_codes]]
+        scored_data['need_multiplier'] = self.need_multipliers[team_idx, group_codes]
+        scored_data['team_fit_score'] = fit_matrix[team_idx, rows]
         
         # Calculate value score (considering both grade and need)
-        max_grade = scored_data['grade'].max()
+        max_grade = data['grade'].max()
         scored_data['value_score'] = (scored_data['grade'] / max_grade) * scored_data['need_multiplier'] * 100
         
-        return scored_data.sort_values('team_fit_score', ascending=False)
+        return scored_data
     
     def _render_positional_value(self):
         """Render positional value analysis."""
@@ -273,74 +334,80 @@ class TeamAnalysis:
         with col1:
             # Average grade by position
             if 'position_group' in self.data.columns:
-                pos_value = self.data.groupby('position_group').agg({
-                    'grade': ['count', 'mean', 'std', 'max'],
-                    'name': 'count'
-                }).round(2)
+                def build_fig_pos_value():
+                    pos_value = self.data.groupby('position_group').agg({
+                        'grade': ['count', 'mean', 'std', 'max'],
+                        'name': 'count'
+                    }).round(2)
+                    
+                    pos_value.columns = ['Player Count', 'Avg Grade', 'Grade Std Dev', 'Max Grade', 'Total Players']
+                    pos_value = pos_value[['Player Count', 'Avg Grade', 'Grade Std Dev', 'Max Grade']]
+                    pos_value = pos_value.sort_values('Avg Grade', ascending=False)
+                    
+                    fig_pos_value = px.bar(
+                        x=pos_value.index,
+                        y=pos_value['Avg Grade'],
+                        title="Average Grade by Position Group",
+                        color=pos_value['Avg Grade'],
+                        color_continuous_scale='Viridis'
+                    )
+                    
+                    fig_pos_value.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white'),
+                        xaxis_title="Position Group",
+                        yaxis_title="Average Grade"
+                    )
+                    return fig_pos_value
                 
-                pos_value.columns = ['Player Count', 'Avg Grade', 'Grade Std Dev', 'Max Grade', 'Total Players']
-                pos_value = pos_value[['Player Count', 'Avg Grade', 'Grade Std Dev', 'Max Grade']]
-                pos_value = pos_value.sort_values('Avg Grade', ascending=False)
+                fig_pos_value = figure_cache.figure('positional_value_avg_grade', self.data_version, None, build_fig_pos_value)
+                st.plotly_chart(fig_pos_value, width='stretch')
+        
+        with col2:
+            # Position depth analysis
+            def build_fig_depth():
+                depth_analysis = []
                 
-                fig_pos_value = px.bar(
-                    x=pos_value.index,
-                    y=pos_value['Avg Grade'],
-                    title="Average Grade by Position Group",
-                    color=pos_value['Avg Grade'],
-                    color_continuous_scale='Viridis'
+                for pos_group in self.data['position_group'].unique():
+                    if pd.notna(pos_group):
+                        pos_data = self.data[self.data['position_group'] == pos_group]
+                        
+                        # Calculate depth metrics
+                        top_tier = len(pos_data[pos_data['grade'] >= pos_data['grade'].quantile(0.8)])
+                        mid_tier = len(pos_data[(pos_data['grade'] >= pos_data['grade'].quantile(0.4)) & 
+                                               (pos_data['grade'] < pos_data['grade'].quantile(0.8))])
+                        low_tier = len(pos_data[pos_data['grade'] < pos_data['grade'].quantile(0.4)])
+                        
+                        depth_analysis.append({
+                            'Position': pos_group,
+                            'Top Tier': top_tier,
+                            'Mid Tier': mid_tier,
+                            'Low Tier': low_tier,
+                            'Total': len(pos_data),
+                            'Depth Score': (top_tier * 3 + mid_tier * 2 + low_tier) / len(pos_data)
+                        })
+                
+                depth_df = pd.DataFrame(depth_analysis).sort_values('Depth Score', ascending=False)
+                
+                fig_depth = px.bar(
+                    depth_df,
+                    x='Position',
+                    y=['Top Tier', 'Mid Tier', 'Low Tier'],
+                    title="Position Depth Analysis",
+                    color_discrete_sequence=[self.colors['success'], self.colors['warning'], self.colors['danger']]
                 )
                 
-                fig_pos_value.update_layout(
+                fig_depth.update_layout(
                     plot_bgcolor='rgba(0,0,0,0)',
                     paper_bgcolor='rgba(0,0,0,0)',
                     font=dict(color='white'),
                     xaxis_title="Position Group",
-                    yaxis_title="Average Grade"
+                    yaxis_title="Number of Players"
                 )
-                
-                st.plotly_chart(fig_pos_value, width='stretch')
-        
-        with col2:
-            # Position depth analysis
-            depth_analysis = []
-            
-            for pos_group in self.data['position_group'].unique():
-                if pd.notna(pos_group):
-                    pos_data = self.data[self.data['position_group'] == pos_group]
-                    
-                    # Calculate depth metrics
-                    top_tier = len(pos_data[pos_data['grade'] >= pos_data['grade'].quantile(0.8)])
-                    mid_tier = len(pos_data[(pos_data['grade'] >= pos_data['grade'].quantile(0.4)) & 
-                                           (pos_data['grade'] < pos_data['grade'].quantile(0.8))])
-                    low_tier = len(pos_data[pos_data['grade'] < pos_data['grade'].quantile(0.4)])
-                    
-                    depth_analysis.append({
-                        'Position': pos_group,
-                        'Top Tier': top_tier,
-                        'Mid Tier': mid_tier,
-                        'Low Tier': low_tier,
-                        'Total': len(pos_data),
-                        'Depth Score': (top_tier * 3 + mid_tier * 2 + low_tier) / len(pos_data)
-                    })
-            
-            depth_df = pd.DataFrame(depth_analysis).sort_values('Depth Score', ascending=False)
-            
-            fig_depth = px.bar(
-                depth_df,
-                x='Position',
-                y=['Top Tier', 'Mid Tier', 'Low Tier'],
-                title="Position Depth Analysis",
-                color_discrete_sequence=[self.colors['success'], self.colors['warning'], self.colors['danger']]
-            )
-            
-            fig_depth.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white'),
-                xaxis_title="Position Group",
-                yaxis_title="Number of Players"
-            )
+                return fig_depth
             
+            fig_depth = figure_cache.figure('positional_value_depth', self.data_version, None, build_fig_depth)
             st.plotly_chart(fig_depth, width='stretch')
         
         # Position value tables
@@ -407,183 +474,291 @@ class TeamAnalysis:
         """Render team needs matrix analysis."""
         st.markdown("### 🔄 Team Needs Matrix")
         
-        # Create needs matrix
-        needs_matrix = []
+        # Needs matrix straight from the precomputed need levels
+        needs_df = pd.DataFrame(
+            self.need_levels[:, :self.data_group_count],
+            index=pd.Index(self.team_names, name='Team'),
+            columns=self.position_groups[:self.data_group_count]
+        )
         
-        for team, needs_info in self.nfl_teams.items():
-            team_row = {'Team': team}
+        # Heatmap of team needs
+        def build_fig_heatmap():
+            fig_heatmap = px.imshow(
+                needs_df.values,
+                x=needs_df.columns,
+                y=needs_df.index,
+                color_continuous_scale='RdYlGn',
+                title="Team Needs Matrix (2=Primary, 1=Secondary, 0=No Need)",
+                aspect='auto'
+            )
             
-            # Initialize all positions as 0
-            for pos_group in self.data['position_group'].unique():
-                if pd.notna(pos_group):
-                    team_row[pos_group] = 0
+            fig_heatmap.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='white'),
+                height=800
+            )
+            return fig_heatmap
+        
+        fig_heatmap = figure_cache.figure('team_needs_matrix', self.data_version, None, build_fig_heatmap)
+        st.plotly_chart(fig_heatmap, width='stretch')
+        
+        # Position demand analysis
+        st.markdown("#### 📈 Position Demand Across League")
+        
+        primary_demand = self.primary_demand[:self.data_group_count]
+        secondary_demand = self.secondary_demand[:self.data_group_count]
+        demand_df = pd.DataFrame({
+            'Primary Needs': primary_demand,
+            'Secondary Needs': secondary_demand,
+            'Total Demand Score': primary_demand * 2 + secondary_demand,
+            'Available Players': self.data['position_group'].value_counts().reindex(needs_df.columns, fill_value=0).values
+        }, index=needs_df.columns).sort_values('Total Demand Score', ascending=False)
+        
+        # Demand vs supply chart
+        def build_fig_supply_demand():
+            fig_supply_demand = go.Figure()
+            
+            fig_supply_demand.add_trace(go.Bar(
+                name='Total Demand Score',
+                x=demand_df.index,
+                y=demand_df['Total Demand Score'],
+                yaxis='y',
+                marker_color=self.colors['primary']
+            ))
+            
+            fig_supply_demand.add_trace(go.Scatter(
+                name='Available Players',
+                x=demand_df.index,
+                y=demand_df['Available Players'],
+                yaxis='y2',
+                mode='lines+markers',
+                line=dict(color=self.colors['secondary'], width=3),
+                marker=dict(size=8)
+            ))
             
-            # Set primary needs as 2, secondary as 1
-            for need in needs_info['primary_needs']:
-                if need in team_row:
-                    team_row[need] = 2
+            fig_supply_demand.update_layout(
+                title='Position Demand vs Available Players',
+                xaxis_title='Position Group',
+                yaxis=dict(title='Demand Score', side='left'),
+                yaxis2=dict(title='Available Players', side='right', overlaying='y'),
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='white')
+            )
+            return fig_supply_demand
+        
+        fig_supply_demand = figure_cache.figure('team_needs_supply_demand', self.data_version, None, build_fig_supply_demand)
+        st.plotly_chart(fig_supply_demand, width='stretch')
+        
+        st.dataframe(demand_df.round(2), width='stretch')
+        
+        # Best fits for every team from one teams x players fit matrix
+        st.markdown("#### 🏆 Best Fits Across the League")
+        
+        if 'grade' in self.data.columns:
+            fit_matrix = self._team_fit_matrix(self.data)
+            top_fits = self._top_k_per_team(fit_matrix, 3)
+            names = self.data['name'].to_numpy() if 'name' in self.data.columns else self.data.index.to_numpy()
+            groups = self.data['position_group'].to_numpy()
             
-            for need in needs_info['secondary_needs']:
-                if need in team_row:
-                    team_row[need] = 1
+            league_fits = pd.DataFrame({'Team': self.team_names})
+            for rank in range(top_fits.shape[1]):
+                picks = top_fits[:, rank]
+                league_fits[f'Fit #{rank + 1}'] = [f"{name} ({group})" for name, group in zip(names[picks], groups[picks])]
+                league_fits[f'Score #{rank + 1}'] = fit_matrix[np.arange(len(self.team_names)), picks].round(2)
             
-            needs_matrix.append(team_row)
+            st.dataframe(league_fits, width='stretch', hide_index=True)
+    
+    def _render_draft_allocation(self):
+        """Render the league-wide draft allocation solver."""
+        st.markdown("### 🧮 League-Wide Draft Allocation")
         
-        needs_df = pd.DataFrame(needs_matrix).set_index('Team')
+        if 'grade' not in self.data.columns:
+            st.error("Grade column required for draft allocation.")
+            return
         
-        # Heatmap of team needs
-        fig_heatmap = px.imshow(
-            needs_df.values,
-            x=needs_df.columns,
-            y=needs_df.index,
-            color_continuous_scale='RdYlGn',
-            title="Team Needs Matrix (2=Primary, 1=Secondary, 0=No Need)",
-            aspect='auto'
-        )
+        col1, col2, col3 = st.columns(3)
         
-        fig_heatmap.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
-            height=800
-        )
+        with col1:
+            rounds = st.slider("Rounds to Allocate", 1, 7, 3)
         
-        st.plotly_chart(fig_heatmap, width='stretch')
+        with col2:
+            mode = st.selectbox("Solver", ["Greedy (Pick Order)", "Optimal per Round (Assignment)"])
         
-        # Position demand analysis
-        st.markdown("#### 📈 Position Demand Across League")
+        with col3:
+            order_type = st.selectbox("Draft Order", ["Alphabetical", "Most Primary Needs First"])
         
-        position_demand = {}
-        for pos in needs_df.columns:
-            primary_demand = (needs_df[pos] == 2).sum()
-            secondary_demand = (needs_df[pos] == 1).sum()
-            total_demand = primary_demand * 2 + secondary_demand
-            
-            position_demand[pos] = {
-                'Primary Needs': primary_demand,
-                'Secondary Needs': secondary_demand,
-                'Total Demand Score': total_demand,
-                'Available Players': len(self.data[self.data['position_group'] == pos])
-            }
+        # Draft order as team row indices into the need matrices
+        if order_type == "Alphabetical":
+            draft_order = np.argsort(self.team_names, kind='stable')
+        else:
+            draft_order = np.argsort(-(self.need_levels == 2).sum(axis=1), kind='stable')
         
-        demand_df = pd.DataFrame(position_demand).T.sort_values('Total Demand Score', ascending=False)
+        start_time = time.perf_counter()
+        allocation = self._solve_draft_allocation(self.data, draft_order, rounds, optimal=mode.startswith("Optimal"))
+        elapsed = time.perf_counter() - start_time
         
-        # Demand vs supply chart
-        fig_supply_demand = go.Figure()
-        
-        fig_supply_demand.add_trace(go.Bar(
-            name='Total Demand Score',
-            x=demand_df.index,
-            y=demand_df['Total Demand Score'],
-            yaxis='y',
-            marker_color=self.colors['primary']
-        ))
-        
-        fig_supply_demand.add_trace(go.Scatter(
-            name='Available Players',
-            x=demand_df.index,
-            y=demand_df['Available Players'],
-            yaxis='y2',
-            mode='lines+markers',
-            line=dict(color=self.colors['secondary'], width=3),
-            marker=dict(size=8)
-        ))
-        
-        fig_supply_demand.update_layout(
-            title='Position Demand vs Available Players',
-            xaxis_title='Position Group',
-            yaxis=dict(title='Demand Score', side='left'),
-            yaxis2=dict(title='Available Players', side='right', overlaying='y'),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white')
+        if allocation.empty:
+            st.info("Not enough graded players to allocate.")
+            return
+        
+        metric_col1, metric_col2, metric_col3 = st.columns(3)
+        
+        with metric_col1:
+            st.metric("Picks Allocated", len(allocation))
+        
+        with metric_col2:
+            st.metric("Total Fit Score", f"{allocation['Fit Score'].sum():.1f}")
+        
+        with metric_col3:
+            st.metric("Solve Time", f"{elapsed * 1000:.0f} ms")
+        
+        # Need coverage: share of picks that landed on a primary or secondary need
+        need_share = allocation['Need'].value_counts(normalize=True).reindex(
+            ['Primary Need', 'Secondary Need', 'Not a Need'], fill_value=0
         )
+        st.caption(" · ".join(f"{label}: {share:.0%}" for label, share in need_share.items()))
         
-        st.plotly_chart(fig_supply_demand, width='stretch')
+        selected_round = st.selectbox("Show Round", ["All"] + list(range(1, rounds + 1)))
+        display_allocation = allocation if selected_round == "All" else allocation[allocation['Round'] == selected_round]
         
-        st.dataframe(demand_df.round(2), width='stretch')
+        st.dataframe(display_allocation.round(2), width='stretch', hide_index=True)
+    
+    def _solve_draft_allocation(self, data: pd.DataFrame, draft_order: np.ndarray, rounds: int, optimal: bool = False) -> pd.DataFrame:
+        """Allocate players to teams round by round, greedily by pick order or by optimal assignment."""
+        graded = data[data['grade'].notna()]
+        if graded.empty:
+            return pd.DataFrame()
+        
+        grades = graded['grade'].to_numpy(dtype=float)
+        group_codes = self._player_group_codes(graded)
+        multipliers = self.need_multipliers.copy()
+        levels = self.need_levels.copy()
+        available = np.ones(len(graded), dtype=bool)
+        
+        picks = []
+        for round_num in range(1, rounds + 1):
+            if available.sum() == 0:
+                break
+            
+            # Fit of every team for every player under the current (partly filled) needs
+            fit_matrix = np.where(available, multipliers[:, group_codes] * grades, -np.inf)
+            round_teams = draft_order[:available.sum()]
+            
+            if optimal:
+                round_picks = self._assign_round(fit_matrix[round_teams], len(round_teams))
+            else:
+                round_picks = []
+                taken = np.zeros(len(graded), dtype=bool)
+                for team_idx in round_teams:
+                    player_idx = int(np.argmax(np.where(taken, -np.inf, fit_matrix[team_idx])))
+                    taken[player_idx] = True
+                    round_picks.append(player_idx)
+            
+            for pick_in_round, (team_idx, player_idx) in enumerate(zip(round_teams, round_picks), start=1):
+                group = group_codes[player_idx]
+                picks.append({
+                    'Round': round_num,
+                    'Pick': (round_num - 1) * len(draft_order) + pick_in_round,
+                    'Team': self.team_names[team_idx],
+                    'Player': graded['name'].iloc[player_idx] if 'name' in graded.columns else graded.index[player_idx],
+                    'Position Group': graded['position_group'].iloc[player_idx],
+                    'Grade': grades[player_idx],
+                    'Need': ['Not a Need', 'Secondary Need', 'Primary Need'][levels[team_idx, group]],
+                    'Fit Score': fit_matrix[team_idx, player_idx]
+                })
+                
+                # A drafted position group is no longer a need for that team
+                available[player_idx] = False
+                multipliers[team_idx, group] = 1.0
+                levels[team_idx, group] = 0
+        
+        return pd.DataFrame(picks)
+    
+    def _assign_round(self, round_fit: np.ndarray, n_picks: int) -> List[int]:
+        """Solve one round as a maximum-fit assignment of teams (rows) to distinct players."""
+        # Only each team's top candidates can appear in an optimal assignment
+        candidates = np.unique(self._top_k_per_team(round_fit, n_picks))
+        candidate_fit = round_fit[:, candidates]
+        
+        team_rows, player_cols = linear_sum_assignment(np.where(np.isfinite(candidate_fit), -candidate_fit, 1e9))
+        assigned = dict(zip(team_rows, candidates[player_cols]))
+        return [int(assigned[row]) for row in range(len(round_fit))]
     
     def _render_value_opportunities(self):
         """Render value opportunities analysis."""
         st.markdown("### 💎 Value Opportunities")
         
         # Calculate value opportunities based on supply/demand
-        opportunities = []
-        
-        for pos_group in self.data['position_group'].unique():
-            if pd.notna(pos_group):
-                pos_data = self.data[self.data['position_group'] == pos_group]
-                
-                if len(pos_data) > 0:
-                    # Calculate demand score
-                    primary_needs = sum(1 for team_data in self.nfl_teams.values() 
-                                      if pos_group in team_data['primary_needs'])
-                    secondary_needs = sum(1 for team_data in self.nfl_teams.values() 
-                                        if pos_group in team_data['secondary_needs'])
-                    demand_score = primary_needs * 2 + secondary_needs
-                    
-                    # Calculate supply metrics
-                    supply_count = len(pos_data)
-                    avg_grade = pos_data['grade'].mean()
-                    top_grade = pos_data['grade'].max()
-                    
-                    # Value opportunity score (high demand, limited quality supply = high opportunity)
-                    if supply_count > 0:
-                        opportunity_score = (demand_score * avg_grade) / supply_count
-                    else:
-                        opportunity_score = 0
-                    
-                    opportunities.append({
-                        'Position Group': pos_group,
-                        'Demand Score': demand_score,
-                        'Available Players': supply_count,
-                        'Avg Grade': avg_grade,
-                        'Top Grade': top_grade,
-                        'Opportunity Score': opportunity_score,
-                        'Value Rating': self._get_value_rating(demand_score, supply_count, avg_grade)
-                    })
-        
-        opp_df = pd.DataFrame(opportunities).sort_values('Opportunity Score', ascending=False)
+        supply = self.data.groupby('position_group')['grade'].agg(['count', 'mean', 'max'])
+        supply = supply[supply['count'] > 0]
+        
+        # Demand per group from the need matrix columns
+        group_index = {group: i for i, group in enumerate(self.position_groups)}
+        columns = [group_index[group] for group in supply.index]
+        demand_scores = self.primary_demand[columns] * 2 + self.secondary_demand[columns]
+        
+        # Value opportunity score (high demand, limited quality supply = high opportunity)
+        opp_df = pd.DataFrame({
+            'Position Group': supply.index,
+            'Demand Score': demand_scores,
+            'Available Players': supply['count'].values,
+            'Avg Grade': supply['mean'].values,
+            'Top Grade': supply['max'].values,
+            'Opportunity Score': demand_scores * supply['mean'].values / supply['count'].values
+        })
+        opp_df['Value Rating'] = [
+            self._get_value_rating(demand, count, grade)
+            for demand, count, grade in zip(opp_df['Demand Score'], opp_df['Available Players'], opp_df['Avg Grade'])
+        ]
+        opp_df = opp_df.sort_values('Opportunity Score', ascending=False)
         
         # Opportunity visualization
         col1, col2 = st.columns(2)
         
         with col1:
             # Opportunity score chart
-            fig_opp = px.bar(
-                opp_df.head(10),
-                x='Position Group',
-                y='Opportunity Score',
-                title="Top Value Opportunities",
-                color='Opportunity Score',
-                color_continuous_scale='Plasma'
-            )
-            
-            fig_opp.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white')
-            )
+            def build_fig_opp():
+                fig_opp = px.bar(
+                    opp_df.head(10),
+                    x='Position Group',
+                    y='Opportunity Score',
+                    title="Top Value Opportunities",
+                    color='Opportunity Score',
+                    color_continuous_scale='Plasma'
+                )
+                
+                fig_opp.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white')
+                )
+                return fig_opp
             
+            fig_opp = figure_cache.figure('value_opportunities', self.data_version, None, build_fig_opp)
             st.plotly_chart(fig_opp, width='stretch')
         
         with col2:
             # Value rating distribution
             rating_counts = opp_df['Value Rating'].value_counts()
             
-            fig_rating = px.pie(
-                values=rating_counts.values,
-                names=rating_counts.index,
-                title="Value Rating Distribution",
-                color_discrete_sequence=px.colors.qualitative.Set3
-            )
-            
-            fig_rating.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white')
-            )
+            def build_fig_rating():
+                fig_rating = px.pie(
+                    values=rating_counts.values,
+                    names=rating_counts.index,
+                    title="Value Rating Distribution",
+                    color_discrete_sequence=px.colors.qualitative.Set3
+                )
+                
+                fig_rating.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white')
+                )
+                return fig_rating
             
+            fig_rating = figure_cache.figure('value_rating_distribution', self.data_version, None, build_fig_rating)
             st.plotly_chart(fig_rating, width='stretch')
         
         # Detailed opportunities table
@@ -802,8 +977,7 @@ class TeamAnalysis:
                     solid_players = len(pos_data[pos_data['grade'] >= 6.5])
                     
                     # Demand calculation
-                    primary_needs = sum(1 for team_data in self.nfl_teams.values() 
-                                      if pos_group in team_data['primary_needs'])
+                    primary_needs = self.primary_demand[self.position_groups.index(pos_group)]
                     
                     # Scarcity score
                     if total_players > 0:
@@ -825,21 +999,24 @@ class TeamAnalysis:
         scarcity_df = pd.DataFrame(scarcity_analysis).sort_values('Scarcity Score', ascending=False)
         
         # Scarcity visualization
-        fig_scarcity = px.bar(
-            scarcity_df.head(10),
-            x='Position Group',
-            y='Scarcity Score',
-            title="Position Scarcity Rankings",
-            color='Scarcity Score',
-            color_continuous_scale='Reds'
-        )
-        
-        fig_scarcity.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white')
-        )
+        def build_fig_scarcity():
+            fig_scarcity = px.bar(
+                scarcity_df.head(10),
+                x='Position Group',
+                y='Scarcity Score',
+                title="Position Scarcity Rankings",
+                color='Scarcity Score',
+                color_continuous_scale='Reds'
+            )
+            
+            fig_scarcity.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='white')
+            )
+            return fig_scarcity
         
+        fig_scarcity = figure_cache.figure('position_scarcity', self.data_version, None, build_fig_scarcity)
         st.plotly_chart(fig_scarcity, width='stretch')
         
         # Scarcity table
@@ -1,3 +1,5 @@
+import hashlib
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
 import streamlit as st
@@ -5,19 +7,27 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error, r2_score
+from sklearn.metrics import mean_squared_error, r2_score, silhouette_score
+from joblib import Parallel, delayed
 from scipy import stats
+from typing import Optional
+from utils.correlation import cached_correlation
+from utils.data_version import data_version
+from utils.figure_cache import figure_cache
 import warnings
 warnings.filterwarnings('ignore')
 
+CLUSTER_SWEEP_ENTRIES = 8  # feature selections whose sweeps stay cached per session
+
 class AIAnalytics:
     """Advanced AI analytics for NFL Draft analysis."""
     
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, version: Optional[str] = None):
         self.data = data
+        self.data_version = version or data_version(data)
         self.scaler = StandardScaler()
         self.features = self._get_numeric_features()
         
@@ -96,35 +106,38 @@ class AIAnalytics:
                 st.metric("Training Samples", len(X_train))
             
             # Prediction vs Actual plot
-            fig = go.Figure()
-            
-            fig.add_trace(go.Scatter(
-                x=y_test,
-                y=y_pred,
-                mode='markers',
-                name='Predictions',
-                marker=dict(color='#FF6B35', size=8, opacity=0.7)
-            ))
-            
-            # Perfect prediction line
-            min_val, max_val = min(y_test.min(), y_pred.min()), max(y_test.max(), y_pred.max())
-            fig.add_trace(go.Scatter(
-                x=[min_val, max_val],
-                y=[min_val, max_val],
-                mode='lines',
-                name='Perfect Prediction',
-                line=dict(color='white', dash='dash')
-            ))
-            
-            fig.update_layout(
-                title="Predicted vs Actual Performance",
-                xaxis_title=f"Actual {target_var.title()}",
-                yaxis_title=f"Predicted {target_var.title()}",
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white')
-            )
+            def build_fig():
+                fig = go.Figure()
+                
+                fig.add_trace(go.Scatter(
+                    x=y_test,
+                    y=y_pred,
+                    mode='markers',
+                    name='Predictions',
+                    marker=dict(color='#FF6B35', size=8, opacity=0.7)
+                ))
+                
+                # Perfect prediction line
+                min_val, max_val = min(y_test.min(), y_pred.min()), max(y_test.max(), y_pred.max())
+                fig.add_trace(go.Scatter(
+                    x=[min_val, max_val],
+                    y=[min_val, max_val],
+                    mode='lines',
+                    name='Perfect Prediction',
+                    line=dict(color='white', dash='dash')
+                ))
+                
+                fig.update_layout(
+                    title="Predicted vs Actual Performance",
+                    xaxis_title=f"Actual {target_var.title()}",
+                    yaxis_title=f"Predicted {target_var.title()}",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white')
+                )
+                return fig
             
+            fig = figure_cache.figure('prediction_vs_actual', self.data_version, (target_var, tuple(selected_features)), build_fig)
             st.plotly_chart(fig, width='stretch')
             
             # Feature importance
@@ -133,22 +146,25 @@ class AIAnalytics:
                 'importance': model.feature_importances_
             }).sort_values('importance', ascending=True)
             
-            fig_importance = px.bar(
-                feature_importance,
-                x='importance',
-                y='feature',
-                orientation='h',
-                title="Feature Importance in Prediction Model",
-                color='importance',
-                color_continuous_scale='Viridis'
-            )
-            
-            fig_importance.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white')
-            )
+            def build_fig_importance():
+                fig_importance = px.bar(
+                    feature_importance,
+                    x='importance',
+                    y='feature',
+                    orientation='h',
+                    title="Feature Importance in Prediction Model",
+                    color='importance',
+                    color_continuous_scale='Viridis'
+                )
+                
+                fig_importance.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white')
+                )
+                return fig_importance
             
+            fig_importance = figure_cache.figure('prediction_feature_importance', self.data_version, (target_var, tuple(selected_features)), build_fig_importance)
             st.plotly_chart(fig_importance, width='stretch')
     
     def render_risk_assessment(self):
@@ -180,69 +196,78 @@ class AIAnalytics:
         
         with col1:
             # Risk distribution
-            risk_counts = self.data['risk_category'].value_counts()
-            
-            fig_pie = px.pie(
-                values=risk_counts.values,
-                names=risk_counts.index,
-                title="Risk Distribution Across All Players",
-                color_discrete_map={
-                    'Low Risk': '#28a745',
-                    'Medium Risk': '#ffc107',
-                    'High Risk': '#fd7e14',
-                    'Very High Risk': '#dc3545',
-                    'Unknown': '#6c757d'
-                }
-            )
-            
-            fig_pie.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white')
-            )
-            
-            st.plotly_chart(fig_pie, width='stretch')
-        
-        with col2:
-            # Risk by position
-            if 'position_group' in self.data.columns:
-                risk_by_pos = pd.crosstab(
-                    self.data['position_group'],
-                    self.data['risk_category'],
-                    normalize='index'
-                ) * 100
+            def build_fig_pie():
+                risk_counts = self.data['risk_category'].value_counts()
                 
-                fig_heatmap = px.imshow(
-                    risk_by_pos.values,
-                    x=risk_by_pos.columns,
-                    y=risk_by_pos.index,
-                    title="Risk Distribution by Position Group (%)",
-                    color_continuous_scale='RdYlGn_r',
-                    aspect='auto'
+                fig_pie = px.pie(
+                    values=risk_counts.values,
+                    names=risk_counts.index,
+                    title="Risk Distribution Across All Players",
+                    color_discrete_map={
+                        'Low Risk': '#28a745',
+                        'Medium Risk': '#ffc107',
+                        'High Risk': '#fd7e14',
+                        'Very High Risk': '#dc3545',
+                        'Unknown': '#6c757d'
+                    }
                 )
                 
-                fig_heatmap.update_layout(
+                fig_pie.update_layout(
                     plot_bgcolor='rgba(0,0,0,0)',
                     paper_bgcolor='rgba(0,0,0,0)',
                     font=dict(color='white')
                 )
+                return fig_pie
+            
+            fig_pie = figure_cache.figure('risk_distribution', self.data_version, None, build_fig_pie)
+            st.plotly_chart(fig_pie, width='stretch')
+        
+        with col2:
+            # Risk by position
+            if 'position_group' in self.data.columns:
+                def build_fig_heatmap():
+                    risk_by_pos = pd.crosstab(
+                        self.data['position_group'],
+                        self.data['risk_category'],
+                        normalize='index'
+                    ) * 100
+                    
+                    fig_heatmap = px.imshow(
+                        risk_by_pos.values,
+                        x=risk_by_pos.columns,
+                        y=risk_by_pos.index,
+                        title="Risk Distribution by Position Group (%)",
+                        color_continuous_scale='RdYlGn_r',
+                        aspect='auto'
+                    )
+                    
+                    fig_heatmap.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white')
+                    )
+                    return fig_heatmap
                 
+                fig_heatmap = figure_cache.figure('risk_by_position', self.data_version, None, build_fig_heatmap)
                 st.plotly_chart(fig_heatmap, width='stretch')
         
         # Risk factors analysis
         st.markdown("#### 🔍 Risk Factors Analysis")
         
-        # Identify key risk factors using correlation with grade
-        risk_features = []
-        for feature in self.features:
-            if feature in self.data.columns:
-                correlation = self.data[feature].corr(self.data['grade'])
-                if not pd.isna(correlation):
-                    risk_features.append({
-                        'feature': feature,
-                        'correlation': correlation,
-                        'risk_impact': 'Positive' if correlation > 0 else 'Negative'
-                    })
+        # Identify key risk factors using correlation with grade (one cached matrix for all features)
+        risk_columns = [feature for feature in self.features if feature in self.data.columns and feature != 'grade']
+        correlation_data = cached_correlation(
+            self.data,
+            data_version(self.data[risk_columns + ['grade']]),
+            tuple(risk_columns + ['grade'])
+        )
+        grade_correlation = correlation_data['grade'].drop('grade').dropna()
+        
+        risk_features = pd.DataFrame({
+            'feature': grade_correlation.index,
+            'correlation': grade_correlation.values,
+            'risk_impact': np.where(grade_correlation.values > 0, 'Positive', 'Negative')
+        })
         
         risk_df = pd.DataFrame(risk_features).sort_values('correlation', key=abs, ascending=False)
         
@@ -250,22 +275,25 @@ class AIAnalytics:
             # Top risk factors chart
             top_risk = risk_df.head(10)
             
-            fig_risk = px.bar(
-                top_risk,
-                x='correlation',
-                y='feature',
-                orientation='h',
-                title="Top Risk Factors (Correlation with Grade)",
-                color='correlation',
-                color_continuous_scale='RdYlGn'
-            )
-            
-            fig_risk.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white')
-            )
+            def build_fig_risk():
+                fig_risk = px.bar(
+                    top_risk,
+                    x='correlation',
+                    y='feature',
+                    orientation='h',
+                    title="Top Risk Factors (Correlation with Grade)",
+                    color='correlation',
+                    color_continuous_scale='RdYlGn'
+                )
+                
+                fig_risk.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white')
+                )
+                return fig_risk
             
+            fig_risk = figure_cache.figure('risk_factors', self.data_version, None, build_fig_risk)
             st.plotly_chart(fig_risk, width='stretch')
     
     def render_clustering_analysis(self):
@@ -290,8 +318,16 @@ class AIAnalytics:
         with col2:
             st.markdown("#### Clustering Configuration")
             
-            # Number of clusters
-            n_clusters = st.slider("Number of Clusters", 2, 8, 4)
+            # Number of clusters: fixed by the user or picked from a k sweep
+            cluster_mode = st.radio("Cluster Count", ["Manual", "Auto (Elbow)"], horizontal=True)
+            max_k = max(3, min(12, len(cluster_data) - 1))
+            
+            if cluster_mode == "Manual":
+                n_clusters = st.slider("Number of Clusters", 2, min(8, max_k), min(4, max_k))
+                k_values = [n_clusters]
+            else:
+                k_range = st.slider("Cluster Range to Sweep", 2, max_k, (2, min(10, max_k)))
+                k_values = list(range(k_range[0], k_range[1] + 1))
             
             # Feature selection for clustering
             selected_cluster_features = st.multiselect(
@@ -303,17 +339,56 @@ class AIAnalytics:
             if len(selected_cluster_features) < 2:
                 st.warning("Please select at least 2 features for clustering.")
                 return
+            
+            if cluster_mode != "Manual" and len(k_values) < 3:
+                st.warning("Please sweep at least 3 cluster counts to locate the elbow.")
+                return
         
         with col1:
             # Perform clustering
-            cluster_subset = cluster_data[selected_cluster_features]
+            cluster_subset = cluster_data[selected_cluster_features].copy()
             
             # Scale features
             scaled_features = self.scaler.fit_transform(cluster_subset)
             
-            # K-means clustering
-            kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-            clusters = kmeans.fit_predict(scaled_features)
+            # Score every requested k (cached per feature selection)
+            sweep, sweep_results = self._sweep_cluster_counts(scaled_features, selected_cluster_features, k_values)
+            
+            if cluster_mode == "Manual":
+                n_clusters = k_values[0]
+            else:
+                n_clusters = _find_elbow(sweep['k'].values, sweep['inertia'].values)
+                st.success(f"Elbow detected at **{n_clusters} clusters** "
+                           f"(silhouette {sweep.loc[sweep['k'] == n_clusters, 'silhouette'].iloc[0]:.3f})")
+                
+                def build_fig_sweep():
+                    fig_sweep = make_subplots(specs=[[{"secondary_y": True}]])
+                    fig_sweep.add_trace(go.Scatter(
+                        x=sweep['k'], y=sweep['inertia'], mode='lines+markers', name='Inertia',
+                        line=dict(color='#FF6B35')
+                    ), secondary_y=False)
+                    fig_sweep.add_trace(go.Scatter(
+                        x=sweep['k'], y=sweep['silhouette'], mode='lines+markers', name='Silhouette',
+                        line=dict(color='#4ECDC4')
+                    ), secondary_y=True)
+                    fig_sweep.add_vline(x=n_clusters, line_dash="dash", line_color="white",
+                                        annotation_text=f"k = {n_clusters}")
+                    
+                    fig_sweep.update_layout(
+                        title="Cluster Count Sweep (MiniBatchKMeans)",
+                        xaxis_title="Number of Clusters",
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white')
+                    )
+                    fig_sweep.update_yaxes(title_text="Inertia", secondary_y=False)
+                    fig_sweep.update_yaxes(title_text="Silhouette", secondary_y=True)
+                    return fig_sweep
+                
+                fig_sweep = figure_cache.figure('cluster_sweep', self.data_version, (tuple(selected_cluster_features), tuple(k_values)), build_fig_sweep)
+                st.plotly_chart(fig_sweep, width='stretch')
+            
+            clusters = sweep_results[n_clusters]['labels']
             
             # Add clusters to data
             cluster_subset['cluster'] = clusters
@@ -323,77 +398,102 @@ class AIAnalytics:
                 feature_x = selected_cluster_features[0]
                 feature_y = selected_cluster_features[1]
                 
-                fig_scatter = px.scatter(
-                    cluster_subset,
-                    x=feature_x,
-                    y=feature_y,
-                    color='cluster',
-                    title=f"Player Clusters: {feature_x.title()} vs {feature_y.title()}",
-                    color_discrete_sequence=px.colors.qualitative.Set3
-                )
-                
-                fig_scatter.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white')
-                )
+                def build_fig_scatter():
+                    fig_scatter = px.scatter(
+                        cluster_subset,
+                        x=feature_x,
+                        y=feature_y,
+                        color=cluster_subset['cluster'].astype(str),
+                        title=f"Player Clusters: {feature_x.title()} vs {feature_y.title()}",
+                        color_discrete_sequence=px.colors.qualitative.Set3
+                    )
+                    
+                    fig_scatter.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white'),
+                        legend_title_text="Cluster"
+                    )
+                    return fig_scatter
                 
+                fig_scatter = figure_cache.figure('cluster_scatter', self.data_version, (tuple(selected_cluster_features), n_clusters), build_fig_scatter)
                 st.plotly_chart(fig_scatter, width='stretch')
             
             # Cluster analysis
             st.markdown("#### 📊 Cluster Analysis")
             
-            cluster_stats = []
-            for i in range(n_clusters):
-                cluster_mask = clusters == i
-                cluster_players = cluster_subset[cluster_mask]
-                
-                stats_dict = {
-                    'Cluster': f'Cluster {i+1}',
-                    'Players': len(cluster_players),
-                    'Percentage': f"{(len(cluster_players)/len(cluster_subset))*100:.1f}%"
-                }
-                
-                # Add mean values for each feature
-                for feature in selected_cluster_features:
-                    stats_dict[f'Avg {feature.title()}'] = f"{cluster_players[feature].mean():.2f}"
-                
-                cluster_stats.append(stats_dict)
+            # One groupby pass for counts and feature means of every cluster
+            cluster_means = cluster_subset.groupby('cluster')[selected_cluster_features].mean()
+            cluster_sizes = np.bincount(clusters, minlength=n_clusters)[cluster_means.index]
             
-            cluster_stats_df = pd.DataFrame(cluster_stats)
-            st.dataframe(cluster_stats_df, width='stretch')
+            cluster_stats_df = cluster_means.round(2).map(lambda v: f"{v:.2f}")
+            cluster_stats_df.columns = [f'Avg {feature.title()}' for feature in selected_cluster_features]
+            cluster_stats_df.insert(0, 'Percentage', [f"{(size / len(cluster_subset)) * 100:.1f}%" for size in cluster_sizes])
+            cluster_stats_df.insert(0, 'Players', cluster_sizes)
+            cluster_stats_df.insert(0, 'Cluster', [f'Cluster {i+1}' for i in cluster_means.index])
             
-            # Cluster characteristics
-            fig_radar = go.Figure()
+            st.dataframe(cluster_stats_df.reset_index(drop=True), width='stretch')
             
-            # Normalize features for radar chart
-            normalized_data = pd.DataFrame(scaled_features, columns=selected_cluster_features)
-            normalized_data['cluster'] = clusters
-            
-            for i in range(n_clusters):
-                cluster_means = normalized_data[normalized_data['cluster'] == i][selected_cluster_features].mean()
+            # Cluster characteristics
+            def build_fig_radar():
+                fig_radar = go.Figure()
                 
-                fig_radar.add_trace(go.Scatterpolar(
-                    r=cluster_means.values.tolist() + [cluster_means.values[0]],
-                    theta=cluster_means.index.tolist() + [cluster_means.index[0]],
-                    fill='toself',
-                    name=f'Cluster {i+1}'
-                ))
-            
-            fig_radar.update_layout(
-                polar=dict(
-                    radialaxis=dict(
-                        visible=True,
-                        range=[-2, 2]
-                    )),
-                title="Cluster Characteristics (Normalized)",
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white')
-            )
+                # Normalized cluster profiles straight from the scaled feature matrix
+                normalized_profiles = pd.DataFrame(scaled_features, columns=selected_cluster_features).groupby(clusters).mean()
+                theta = selected_cluster_features + [selected_cluster_features[0]]
+                
+                for cluster_id, profile in zip(normalized_profiles.index, normalized_profiles.values):
+                    fig_radar.add_trace(go.Scatterpolar(
+                        r=np.append(profile, profile[0]),
+                        theta=theta,
+                        fill='toself',
+                        name=f'Cluster {cluster_id+1}'
+                    ))
+                
+                fig_radar.update_layout(
+                    polar=dict(
+                        radialaxis=dict(
+                            visible=True,
+                            range=[-2, 2]
+                        )),
+                    title="Cluster Characteristics (Normalized)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white')
+                )
+                return fig_radar
             
+            fig_radar = figure_cache.figure('cluster_profiles', self.data_version, (tuple(selected_cluster_features), n_clusters), build_fig_radar)
             st.plotly_chart(fig_radar, width='stretch')
     
+    @property
+    def _cluster_sweep_cache(self) -> OrderedDict:
+        """Per-session LRU of clustering results keyed by feature selection (least recently used first)."""
+        return st.session_state.setdefault('cluster_sweep_cache', OrderedDict())
+    
+    def _sweep_cluster_counts(self, scaled_features: np.ndarray, features: list, k_values: list) -> tuple:
+        """Fit MiniBatchKMeans for each k in parallel, reusing cached scores per k."""
+        fingerprint = hashlib.sha1(np.ascontiguousarray(scaled_features).tobytes()).hexdigest()
+        store = self._cluster_sweep_cache
+        key = (tuple(features), fingerprint)
+        cached = store.setdefault(key, {})
+        store.move_to_end(key)
+        while len(store) > CLUSTER_SWEEP_ENTRIES:
+            store.popitem(last=False)
+        
+        missing = [k for k in k_values if k not in cached]
+        if missing:
+            results = Parallel(n_jobs=min(len(missing), 4), prefer='threads')(
+                delayed(_score_cluster_count)(scaled_features, k) for k in missing
+            )
+            cached.update(zip(missing, results))
+        
+        sweep = pd.DataFrame([
+            {'k': k, 'inertia': cached[k]['inertia'], 'silhouette': cached[k]['silhouette']}
+            for k in k_values
+        ])
+        return sweep, cached
+    
     def render_market_value_analysis(self):
         """Render market value analysis."""
         st.markdown("### 💰 Market Value Analysis")
@@ -425,45 +525,51 @@ class AIAnalytics:
         
         with col1:
             # Value distribution
-            value_counts = self.data['value_tier'].value_counts()
-            
-            fig_value = px.bar(
-                x=value_counts.index,
-                y=value_counts.values,
-                title="Market Value Distribution",
-                color=value_counts.values,
-                color_continuous_scale='Viridis'
-            )
-            
-            fig_value.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white'),
-                xaxis_title="Value Tier",
-                yaxis_title="Number of Players"
-            )
-            
-            st.plotly_chart(fig_value, width='stretch')
-        
-        with col2:
-            # Value by position
-            if 'position_group' in self.data.columns:
-                value_by_pos = self.data.groupby(['position_group', 'value_tier']).size().unstack(fill_value=0)
+            def build_fig_value():
+                value_counts = self.data['value_tier'].value_counts()
                 
-                fig_stack = px.bar(
-                    value_by_pos,
-                    title="Value Distribution by Position Group",
-                    color_discrete_sequence=px.colors.qualitative.Set3
+                fig_value = px.bar(
+                    x=value_counts.index,
+                    y=value_counts.values,
+                    title="Market Value Distribution",
+                    color=value_counts.values,
+                    color_continuous_scale='Viridis'
                 )
                 
-                fig_stack.update_layout(
+                fig_value.update_layout(
                     plot_bgcolor='rgba(0,0,0,0)',
                     paper_bgcolor='rgba(0,0,0,0)',
                     font=dict(color='white'),
-                    xaxis_title="Position Group",
+                    xaxis_title="Value Tier",
                     yaxis_title="Number of Players"
                 )
+                return fig_value
+            
+            fig_value = figure_cache.figure('market_value_distribution', self.data_version, None, build_fig_value)
+            st.plotly_chart(fig_value, width='stretch')
+        
+        with col2:
+            # Value by position
+            if 'position_group' in self.data.columns:
+                def build_fig_stack():
+                    value_by_pos = self.data.groupby(['position_group', 'value_tier']).size().unstack(fill_value=0)
+                    
+                    fig_stack = px.bar(
+                        value_by_pos,
+                        title="Value Distribution by Position Group",
+                        color_discrete_sequence=px.colors.qualitative.Set3
+                    )
+                    
+                    fig_stack.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white'),
+                        xaxis_title="Position Group",
+                        yaxis_title="Number of Players"
+                    )
+                    return fig_stack
                 
+                fig_stack = figure_cache.figure('market_value_by_position', self.data_version, None, build_fig_stack)
                 st.plotly_chart(fig_stack, width='stretch')
         
         # Value efficiency analysis
@@ -529,3 +635,40 @@ class AIAnalytics:
                     with col_b:
                         st.markdown("##### 📉 Most Overvalued")
                         st.dataframe(overvalued.round(2), width='stretch')
+
+
+def _score_cluster_count(scaled_features: np.ndarray, k: int) -> dict:
+    """Fit MiniBatchKMeans with k clusters and score the result."""
+    model = MiniBatchKMeans(
+        n_clusters=k,
+        random_state=42,
+        n_init=3,
+        batch_size=min(1024, len(scaled_features))
+    )
+    labels = model.fit_predict(scaled_features)
+    
+    # Silhouette is quadratic in rows, so score a sample on large datasets
+    if len(np.unique(labels)) > 1:
+        silhouette = silhouette_score(
+            scaled_features, labels,
+            sample_size=min(len(scaled_features), 2000),
+            random_state=42
+        )
+    else:
+        silhouette = 0.0
+    
+    return {'inertia': model.inertia_, 'silhouette': silhouette, 'labels': labels}
+
+
+def _find_elbow(k_values: np.ndarray, inertias: np.ndarray) -> int:
+    """Pick the k furthest below the chord joining the first and last sweep points."""
+    if len(k_values) < 3:
+        return int(k_values[0])
+    
+    x = (k_values - k_values[0]) / (k_values[-1] - k_values[0])
+    inertia_span = inertias[0] - inertias[-1]
+    y = (inertias - inertias[-1]) / inertia_span if inertia_span > 0 else np.zeros_like(inertias)
+    
+    # Distance of each normalized point below the straight line from (0, 1) to (1, 0)
+    distance = (1 - x) - y
+    return int(k_values[np.argmax(distance)])
@@ -0,0 +1,269 @@
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence
+from utils.adp import DEFAULT_STD_SLOPE, MIN_ADP_STD, sample_truncated_normal
+
+POSITIONS = ['QB', 'RB', 'WR', 'TE', 'K', 'DEF']
+FLEX_POSITIONS = ['WR', 'RB', 'TE']
+BENCH_POSITIONS = ['QB', 'RB', 'WR', 'TE']
+BENCH_FALLBACK = ['RB', 'WR', 'TE', 'QB']
+TOP_CANDIDATES = 5
+
+DEFAULT_SLOT_ORDER = ['QB', 'WR', 'WR', 'RB', 'RB', 'TE', 'FLEX', 'K', 'DEF', 'BENCH', 'BENCH', 'BENCH']
+STARTERS = np.array([1, 2, 2, 1, 1, 1])
+MAX_COUNTS = np.array([2, 6, 6, 2, 1, 1])
+KICKER_DEFENSE_FROM = 7  # earliest pick index (0-based) for K/DEF in value-based strategies
+
+QB, RB, WR, TE, K, DEF = range(len(POSITIONS))
+
+def _pick_cdf_table() -> np.ndarray:
+    """Build cumulative pick probabilities for the AI's 1/(i+1)-weighted choice among its top m candidates."""
+    weights = 1.0 / np.arange(1, TOP_CANDIDATES + 1)
+    table = np.ones((TOP_CANDIDATES + 1, TOP_CANDIDATES))
+    for m in range(1, TOP_CANDIDATES + 1):
+        table[m, :m - 1] = np.cumsum(weights[:m - 1]) / weights[:m].sum()
+    return table
+
+CDF_TABLE = _pick_cdf_table()
+
+def position_codes(positions: Sequence[str]) -> np.ndarray:
+    """Map position labels to codes (-1 for positions outside the roster format)."""
+    return np.array([POSITIONS.index(pos) if pos in POSITIONS else -1 for pos in positions], dtype=np.int64)
+
+def choose_top(scores: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Pick one player per row among its top five scores with 1/(i+1) weights (-1 when nothing scores)."""
+    n_rows, n_players = scores.shape
+    if n_players == 0:
+        return np.full(n_rows, -1)
+    
+    # Top candidates per row, best first (ties go to the earlier board position)
+    k_top = min(TOP_CANDIDATES, n_players)
+    top = np.argpartition(-scores, k_top - 1, axis=1)[:, :k_top]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.lexsort((top, -top_scores))
+    top = np.take_along_axis(top, order, axis=1)
+    n_candidates = np.isfinite(np.take_along_axis(top_scores, order, axis=1)).sum(axis=1)
+    
+    draws = rng.random(n_rows)
+    k = (draws[:, None] > CDF_TABLE[n_candidates]).sum(axis=1)
+    chosen = top[np.arange(n_rows), np.minimum(k, k_top - 1)]
+    return np.where(n_candidates > 0, chosen, -1)
+
+def choose_in_board_order(eligible: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """choose_top for board-order scores: take the k-th eligible player without sorting."""
+    n_rows = len(eligible)
+    rank = np.cumsum(eligible, axis=1)
+    n_candidates = np.minimum(rank[:, -1], TOP_CANDIDATES) if rank.shape[1] else np.zeros(n_rows, dtype=int)
+    draws = rng.random(n_rows)
+    k = (draws[:, None] > CDF_TABLE[n_candidates]).sum(axis=1) + 1
+    chosen = np.argmax(eligible & (rank == k[:, None]), axis=1)
+    return np.where(n_candidates > 0, chosen, -1)
+
+class DraftStrategy(ABC):
+    """AI opponent strategy scoring every player at once for a batch of draft states.
+    
+    Players are indexed in board order. States are arrays with one row per simulated draft: available
+    (rows, players) booleans and per-position roster counts and VBD totals (rows, positions); pick_index is the
+    team's 0-based pick number and overall_pick the draft's 1-based pick. Excluded players score -inf.
+    adp/adp_std describe each player's market draft slot (board order when the workbook has no ADP).
+    """
+    
+    name = 'Base'
+    
+    def __init__(self, codes: np.ndarray, values: np.ndarray, slot_order: Sequence[str] = DEFAULT_SLOT_ORDER,
+                 adp: Optional[np.ndarray] = None, adp_std: Optional[np.ndarray] = None):
+        self.codes = np.asarray(codes, dtype=np.int64)
+        self.values = np.asarray(values, dtype=float)
+        self.slot_order = list(slot_order)
+        self.position_masks = np.stack([self.codes == code for code in range(len(POSITIONS))])
+        self.known = self.codes >= 0
+        self.board_order = -np.arange(len(self.codes), dtype=float)
+        self.adp = np.asarray(adp, dtype=float) if adp is not None else np.arange(1, len(self.codes) + 1, dtype=float)
+        self.adp_std = np.asarray(adp_std, dtype=float) if adp_std is not None else \
+            np.maximum(DEFAULT_STD_SLOPE * self.adp, MIN_ADP_STD)
+        
+        # Positive value scale so position multipliers never flip the sign of a score
+        self.value_scale = self.values - (self.values.min() if len(self.values) else 0) + 1
+    
+    @abstractmethod
+    def score(self, available: np.ndarray, counts: np.ndarray, totals: np.ndarray, pick_index: int) -> np.ndarray:
+        """Score every player for every draft state (higher is better, -inf for excluded players)."""
+    
+    def pick(self, available: np.ndarray, counts: np.ndarray, totals: np.ndarray, pick_index: int,
+             rng: np.random.Generator, overall_pick: int = 1) -> np.ndarray:
+        """Choose one player per draft state (-1 when nothing is eligible)."""
+        return choose_top(self.score(available, counts, totals, pick_index), rng)
+
+class SlotScriptStrategy(DraftStrategy):
+    """The classic script: fill position_draft_order slot by slot, taking the top of the board at that slot."""
+    
+    name = 'Slot Script'
+    
+    def eligible(self, available: np.ndarray, counts: np.ndarray, totals: np.ndarray, pick_index: int) -> np.ndarray:
+        """Get the players the script would consider for this team's slot."""
+        slot = self.slot_order[pick_index] if pick_index < len(self.slot_order) else 'BENCH'
+        flex_mask = np.isin(self.codes, [POSITIONS.index(pos) for pos in FLEX_POSITIONS])
+        
+        if slot in ['QB', 'K', 'DEF']:
+            eligible = available & self.position_masks[POSITIONS.index(slot)]
+            fallback = available
+        elif slot in FLEX_POSITIONS:
+            eligible = available & self.position_masks[POSITIONS.index(slot)]
+            fallback = available & flex_mask
+        elif slot == 'FLEX':
+            # Prefer the FLEX position with the lowest VBD total on the roster
+            flex_codes = np.array([POSITIONS.index(pos) for pos in FLEX_POSITIONS])
+            weakest = flex_codes[np.argmin(totals[:, flex_codes], axis=1)]
+            eligible = available & (self.codes[None, :] == weakest[:, None])
+            fallback = available & flex_mask
+        else:
+            # Bench: deepen the position with the weakest average VBD
+            bench_codes = np.array([POSITIONS.index(pos) for pos in BENCH_POSITIONS])
+            averages = totals[:, bench_codes] / np.maximum(counts[:, bench_codes], 1)
+            weakest = bench_codes[np.argmin(averages, axis=1)]
+            eligible = available & (self.codes[None, :] == weakest[:, None])
+            fallback = available & np.isin(self.codes, [POSITIONS.index(pos) for pos in BENCH_FALLBACK])
+        
+        use_fallback = ~eligible.any(axis=1)
+        eligible[use_fallback] = fallback[use_fallback]
+        return eligible
+    
+    def score(self, available, counts, totals, pick_index):
+        return np.where(self.eligible(available, counts, totals, pick_index), self.board_order, -np.inf)
+    
+    def pick(self, available, counts, totals, pick_index, rng, overall_pick=1):
+        return choose_in_board_order(self.eligible(available, counts, totals, pick_index), rng)
+
+class NeedBasedStrategy(DraftStrategy):
+    """Best VBD, boosted at positions with open starter slots; K/DEF wait for the late rounds."""
+    
+    name = 'Need-Based'
+    
+    def multipliers(self, counts: np.ndarray, pick_index: int) -> np.ndarray:
+        """Get (rows, positions) score multipliers for the current roster."""
+        return 1 + 0.5 * (counts < STARTERS)
+    
+    def eligible(self, available: np.ndarray, counts: np.ndarray, totals: np.ndarray, pick_index: int) -> np.ndarray:
+        """Apply roster caps, K/DEF timing and must-fill needs in the final picks (best available if none pass)."""
+        open_positions = counts < MAX_COUNTS
+        if pick_index < KICKER_DEFENSE_FROM:
+            open_positions[:, [K, DEF]] = False
+        
+        # With only enough picks left for the unfilled starters, take nothing else
+        remaining = len(self.slot_order) - pick_index
+        unfilled = counts < STARTERS
+        must_fill = unfilled.any(axis=1) & (unfilled.sum(axis=1) >= remaining)
+        open_positions[must_fill] &= unfilled[must_fill]
+        
+        codes = np.where(self.known, self.codes, 0)
+        eligible = available & self.known & open_positions[:, codes]
+        
+        stuck = ~eligible.any(axis=1)
+        eligible[stuck] = available[stuck]
+        return eligible
+    
+    def score(self, available, counts, totals, pick_index):
+        eligible = self.eligible(available, counts, totals, pick_index)
+        codes = np.where(self.known, self.codes, 0)
+        scores = self.value_scale[None, :] * self.multipliers(counts, pick_index)[:, codes]
+        return np.where(eligible, scores, -np.inf)
+
+class ZeroRBStrategy(NeedBasedStrategy):
+    """Load up on WR/TE early and wait until the sixth pick to start on running backs."""
+    
+    name = 'Zero RB'
+    
+    def multipliers(self, counts, pick_index):
+        multipliers = super().multipliers(counts, pick_index)
+        multipliers[:, RB] = 0.1 if pick_index < 5 else 1.3 * multipliers[:, RB]
+        return multipliers
+
+class HeroRBStrategy(NeedBasedStrategy):
+    """One elite running back in the first two picks, then receivers before more backs."""
+    
+    name = 'Hero RB'
+    
+    def multipliers(self, counts, pick_index):
+        multipliers = super().multipliers(counts, pick_index)
+        if pick_index < 2:
+            multipliers[:, RB] = np.where(counts[:, RB] == 0, 2.0, 0.5)
+        elif pick_index < 6:
+            multipliers[:, RB] = 0.3
+            multipliers[:, WR] *= 1.3
+        return multipliers
+
+class RobustRBStrategy(NeedBasedStrategy):
+    """Secure two (or three) running backs with the first three picks."""
+    
+    name = 'Robust RB'
+    
+    def multipliers(self, counts, pick_index):
+        multipliers = super().multipliers(counts, pick_index)
+        if pick_index < 3:
+            multipliers[:, RB] = np.where(counts[:, RB] < 3, 2.0, 1.0)
+        return multipliers
+
+class LateQBStrategy(NeedBasedStrategy):
+    """Skip quarterbacks until the eighth pick."""
+    
+    name = 'Late-Round QB'
+    
+    def multipliers(self, counts, pick_index):
+        multipliers = super().multipliers(counts, pick_index)
+        if pick_index < 7:
+            multipliers[:, QB] = 0.1
+        else:
+            multipliers[:, QB] *= 1.5
+        return multipliers
+
+class ADPFollowerStrategy(NeedBasedStrategy):
+    """Take the best-ranked (ADP) player left, within roster caps."""
+    
+    name = 'ADP Follower'
+    
+    def score(self, available, counts, totals, pick_index):
+        return np.where(self.eligible(available, counts, totals, pick_index), -self.adp, -np.inf)
+
+class MarketADPStrategy(NeedBasedStrategy):
+    """Draft like the market: sample every player's draft slot from its truncated-normal ADP and take the earliest."""
+    
+    name = 'Market ADP'
+    
+    def score(self, available, counts, totals, pick_index):
+        return np.where(self.eligible(available, counts, totals, pick_index), -self.adp, -np.inf)
+    
+    def pick(self, available, counts, totals, pick_index, rng, overall_pick=1):
+        """Take the player with the earliest sampled slot, ties going to the earlier ADP."""
+        eligible = self.eligible(available, counts, totals, pick_index)
+        if not eligible.shape[1]:
+            return np.full(len(eligible), -1)
+        
+        # Nobody still on the board can go before the current pick, so slots truncate there
+        slots = sample_truncated_normal(self.adp, self.adp_std, overall_pick, np.inf, rng, size=available.shape)
+        slots = np.where(eligible, slots, np.inf)
+        
+        # Players who fell well past their ADP all draw exactly the current pick; rank those by ADP, not board order
+        earliest = slots == slots.min(axis=1, keepdims=True)
+        chosen = np.where(earliest, self.adp, np.inf).argmin(axis=1)
+        return np.where(eligible.any(axis=1), chosen, -1)
+
+STRATEGIES = {strategy.name: strategy for strategy in [
+    SlotScriptStrategy, ZeroRBStrategy, HeroRBStrategy, RobustRBStrategy, LateQBStrategy, ADPFollowerStrategy,
+    NeedBasedStrategy, MarketADPStrategy
+]}
+STRATEGY_MIXES = ['Classic (Slot Script)', 'Mixed Strategies'] + list(STRATEGIES)[1:]
+
+def assign_strategies(mix: str, n_teams: int, rng: Optional[np.random.Generator] = None) -> List[str]:
+    """Assign a strategy name to each AI team: all classic, one strategy for all, or a random mix."""
+    if mix == 'Mixed Strategies':
+        rng = rng if rng is not None else np.random.default_rng()
+        return [str(name) for name in rng.choice(list(STRATEGIES), size=n_teams)]
+    if mix in STRATEGIES:
+        return [mix] * n_teams
+    return [SlotScriptStrategy.name] * n_teams
+
+def build_strategies(names: Sequence[str], codes: np.ndarray, values: np.ndarray,
+                     slot_order: Sequence[str] = DEFAULT_SLOT_ORDER, adp: Optional[np.ndarray] = None,
+                     adp_std: Optional[np.ndarray] = None) -> Dict[str, DraftStrategy]:
+    """Instantiate each named strategy once over the same player arrays."""
+    return {name: STRATEGIES[name](codes, values, slot_order, adp, adp_std) for name in set(names)}
@@ -0,0 +1,149 @@
+import pandas as pd
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from utils.ai_strategies import FLEX_POSITIONS, POSITIONS, position_codes
+from utils.lineup import LineupScorer
+
+NUM_WEEKS = 18  # bye week 0 means unknown: the player is never treated as on bye
+
+def roster_arrays(roster: List[dict], value_key: str = 'VBD_Value') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get a roster's (position codes, values, bye weeks) arrays."""
+    codes = position_codes([p.get('Position') for p in roster])
+    values = np.array([float(p.get(value_key, 0) or 0) for p in roster])
+    byes = np.array([int(p.get('Bye_Week', 0) or 0) for p in roster])
+    return codes, values, byes
+
+def weekly_values(values: np.ndarray, byes: np.ndarray, weeks: int = NUM_WEEKS) -> np.ndarray:
+    """Spread player values over the season (weeks, players), -inf in each player's bye week."""
+    week_numbers = np.arange(1, weeks + 1)[:, None]
+    return np.where(byes[None, :] == week_numbers, -np.inf, values[None, :])
+
+class ByeWeekPlanner:
+    """Weekly starter strength per roster (cached) and bench pickups that cover bye-week holes."""
+    
+    def __init__(self, scorer: Optional[LineupScorer] = None, weeks: int = NUM_WEEKS, max_entries: int = 64):
+        self.scorer = scorer or LineupScorer()
+        self.weeks = weeks
+        self.max_entries = max_entries
+        self._profiles = OrderedDict()
+        
+        # Counts above starters (plus FLEX for WR/RB/TE) never fill another slot, so DP states cap there
+        self.count_caps = self.scorer.starter_counts + np.isin(POSITIONS, FLEX_POSITIONS) * self.scorer.flex_slots
+        self.flex_mask = np.isin(POSITIONS, FLEX_POSITIONS)
+    
+    @staticmethod
+    def _roster_key(roster: List[dict]) -> tuple:
+        """Key a roster on what its weekly lineups depend on."""
+        return tuple(sorted(
+            (str(p.get('Player_Name')), str(p.get('Position')), int(p.get('Bye_Week', 0) or 0), float(p.get('VBD_Value', 0) or 0))
+            for p in roster
+        ))
+    
+    def weekly_profile(self, roster: List[dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the roster's weekly starter strength and unfilled starting slots, one entry per week."""
+        key = self._roster_key(roster)
+        if key in self._profiles:
+            self._profiles.move_to_end(key)
+            return self._profiles[key]
+        
+        codes, values, byes = roster_arrays(roster)
+        strength, unfilled = self.scorer.score(weekly_values(values, byes, self.weeks), codes)
+        self._profiles[key] = (strength, unfilled)
+        while len(self._profiles) > self.max_entries:
+            self._profiles.popitem(last=False)
+        return strength, unfilled
+    
+    def _unfilled(self, counts: np.ndarray) -> np.ndarray:
+        """Count unfilled starting slots from available players per (week, position)."""
+        starters = self.scorer.starter_counts
+        fixed = np.maximum(starters - counts, 0).sum(axis=-1)
+        surplus = (np.maximum(counts - starters, 0) * self.flex_mask).sum(axis=-1)
+        return fixed + np.maximum(self.scorer.flex_slots - surplus, 0)
+    
+    def optimize(self, roster: List[dict], pool: pd.DataFrame, max_pickups: int = 3) -> Dict:
+        """Find up to max_pickups pool players minimizing weeks with unfilled starting slots (then slots, then max value)."""
+        codes, _, byes = roster_arrays(roster)
+        week_numbers = np.arange(1, self.weeks + 1)
+        counts = np.stack([
+            np.bincount(codes[(codes >= 0) & (byes != week)], minlength=len(POSITIONS)) for week in week_numbers
+        ])
+        unfilled_before = self._unfilled(counts)
+        problem_weeks = np.flatnonzero(unfilled_before > 0)
+        
+        result = {
+            'pickups': pool.iloc[0:0],
+            'unfilled_before': unfilled_before,
+            'unfilled_after': unfilled_before,
+            'problem_weeks': (problem_weeks + 1).tolist(),
+            'open_weeks': (problem_weeks + 1).tolist(),
+        }
+        if len(problem_weeks) == 0 or pool.empty or max_pickups <= 0:
+            return result
+        
+        # Pickups only matter through their position and whether their bye falls in a problem week,
+        # so the pool collapses to best-first player lists per (position, bye-in-problem-weeks) type
+        pool_codes = position_codes(pool['Position'])
+        pool_values = pd.to_numeric(pool['VBD_Value'], errors='coerce').fillna(0).to_numpy(dtype=float)
+        pool_byes = pd.to_numeric(pool['Bye_Week'], errors='coerce').fillna(0).to_numpy(dtype=int)
+        type_byes = np.where(np.isin(pool_byes - 1, problem_weeks), pool_byes, 0)
+        order = np.argsort(-pool_values, kind='stable')
+        types = {}
+        for row in order:
+            if pool_codes[row] >= 0:
+                players = types.setdefault((int(pool_codes[row]), int(type_byes[row])), [])
+                if len(players) < max_pickups:
+                    players.append(int(row))
+        
+        # Move effects restricted to the problem weeks
+        moves = []
+        for (code, bye), players in types.items():
+            effect = np.zeros((len(problem_weeks), len(POSITIONS)), dtype=np.int64)
+            effect[:, code] = problem_weeks + 1 != bye
+            moves.append((effect, players))
+        
+        # DP over pickup count; states are the capped (problem week, position) counts, keeping the most valuable pickup set per state
+        start = np.minimum(counts[problem_weeks], self.count_caps)
+        start_unfilled = self._unfilled(start)
+        layer = {start.tobytes(): (start, start_unfilled, 0.0, ())}
+        best = (int((start_unfilled > 0).sum()), int(start_unfilled.sum()), 0.0, ())
+        for _ in range(max_pickups):
+            next_layer = {}
+            for state, state_unfilled, value, chosen in layer.values():
+                for effect, players in moves:
+                    new_state = np.minimum(state + effect, self.count_caps)
+                    new_unfilled = self._unfilled(new_state)
+                    if new_unfilled.sum() >= state_unfilled.sum():
+                        continue
+                    row = next((r for r in players if r not in chosen), None)
+                    if row is None:
+                        continue
+                    new_value = value + pool_values[row]
+                    key = new_state.tobytes()
+                    if key not in next_layer or new_value > next_layer[key][2]:
+                        next_layer[key] = (new_state, new_unfilled, new_value, chosen + (row,))
+            
+            for state, state_unfilled, value, chosen in next_layer.values():
+                candidate = (int((state_unfilled > 0).sum()), int(state_unfilled.sum()), -value, chosen)
+                if candidate[:3] < best[:3]:
+                    best = candidate
+            layer = next_layer
+            if not layer:
+                break
+        
+        chosen = list(best[3])
+        unfilled_after = unfilled_before.copy()
+        if chosen:
+            extra = np.zeros_like(counts)
+            for row in chosen:
+                extra[:, pool_codes[row]] += week_numbers != pool_byes[row]
+            unfilled_after = self._unfilled(counts + extra)
+        
+        result.update({
+            'pickups': pool.iloc[chosen],
+            'unfilled_after': unfilled_after,
+            'open_weeks': (np.flatnonzero(unfilled_after > 0) + 1).tolist(),
+        })
+        return result
+
+bye_week_planner = ByeWeekPlanner()
@@ -0,0 +1,73 @@
+import pandas as pd
+import numpy as np
+import streamlit as st
+from typing import Tuple
+
+def correlation_matrix(values: np.ndarray, method: str = 'pearson', pairwise: bool = True) -> np.ndarray:
+    """Calculate a correlation matrix for a 2-D float array whose columns are variables."""
+    values = np.asarray(values, dtype=float)
+    
+    if not pairwise:
+        # Complete-case: keep only rows with every variable present, then a single corrcoef
+        values = values[~np.isnan(values).any(axis=1)]
+        if method == 'spearman':
+            values = _rank_columns(values)
+        if len(values) < 2:
+            return np.full((values.shape[1], values.shape[1]), np.nan)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.atleast_2d(np.corrcoef(values, rowvar=False))
+    
+    if method == 'spearman':
+        # Ranks are taken per column over its observed values
+        values = _rank_columns(values)
+    
+    return _pairwise_corrcoef(values)
+
+def _pairwise_corrcoef(values: np.ndarray) -> np.ndarray:
+    """Calculate pairwise-complete Pearson correlations with masked matrix products."""
+    mask = ~np.isnan(values)
+    filled = np.where(mask, values, 0.0)
+    weights = mask.astype(float)
+    
+    # For every pair (i, j) only rows where both are present contribute
+    counts = weights.T @ weights
+    sums = filled.T @ weights
+    sums_sq = (filled ** 2).T @ weights
+    cross = filled.T @ filled
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        covariance = cross - sums * sums.T / counts
+        var_i = sums_sq - sums ** 2 / counts
+        corr = covariance / np.sqrt(var_i * var_i.T)
+    
+    corr[counts < 2] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+def _rank_columns(values: np.ndarray) -> np.ndarray:
+    """Replace each column with its average ranks, leaving missing values missing."""
+    return pd.DataFrame(values).rank(method='average').to_numpy(dtype=float)
+
+def strong_pairs(corr: pd.DataFrame, threshold: float = 0.3, strong_threshold: float = 0.7) -> pd.DataFrame:
+    """Extract variable pairs from the upper triangle whose |r| exceeds the threshold."""
+    matrix = corr.to_numpy()
+    rows, cols = np.triu_indices(len(matrix), k=1)
+    pair_values = matrix[rows, cols]
+    
+    keep = np.abs(pair_values) > threshold
+    rows, cols, pair_values = rows[keep], cols[keep], pair_values[keep]
+    order = np.argsort(-np.abs(pair_values), kind='stable')
+    
+    columns = np.asarray(corr.columns)
+    return pd.DataFrame({
+        'Variable 1': columns[rows[order]],
+        'Variable 2': columns[cols[order]],
+        'Correlation': pair_values[order],
+        'Strength': np.where(np.abs(pair_values[order]) > strong_threshold, 'Strong', 'Moderate')
+    })
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_correlation(_data: pd.DataFrame, version: str, columns: Tuple[str, ...],
+                       method: str = 'pearson', pairwise: bool = True) -> pd.DataFrame:
+    """Calculate and cache the correlation matrix of the given columns for one data version."""
+    values = _data[list(columns)].to_numpy(dtype=float, na_value=np.nan)
+    return pd.DataFrame(correlation_matrix(values, method, pairwise), index=list(columns), columns=list(columns))
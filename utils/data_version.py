@@ -0,0 +1,15 @@
+import hashlib
+import pandas as pd
+
+def data_version(data: pd.DataFrame) -> str:
+    """Return a content fingerprint used to key caches on a loaded dataset."""
+    try:
+        row_hashes = pd.util.hash_pandas_object(data, index=True).values
+    except TypeError:
+        # Unhashable cells (lists, dicts) fall back to their string form
+        row_hashes = pd.util.hash_pandas_object(data.astype(str), index=True).values
+    
+    digest = hashlib.sha1(row_hashes.tobytes())
+    digest.update('|'.join(map(str, data.columns)).encode())
+    digest.update(str(data.shape).encode())
+    return digest.hexdigest()
@@ -0,0 +1,61 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+
+class DraftBoard:
+    """Board-ordered candidate lists per position with cursors that lazily skip drafted players."""
+    
+    def __init__(self, players: pd.DataFrame, name_col: str = 'Player_Name', position_col: str = 'Position'):
+        self.records = players.to_dict('records')
+        self.drafted = np.zeros(len(players), dtype=bool)
+        self.remaining = len(players)  # undrafted rows
+        
+        self.rows_by_name = {}
+        for row, name in enumerate(players[name_col]):
+            self.rows_by_name.setdefault(name, []).append(row)
+        
+        # Rows of each position in board order (None holds every row, for best-available fallbacks)
+        positions = players[position_col].to_numpy()
+        self.position_rows = {pos: np.flatnonzero(positions == pos) for pos in pd.unique(positions)}
+        self.position_rows[None] = np.arange(len(players))
+        self.cursors = {pos: 0 for pos in self.position_rows}
+    
+    def draft(self, name: str) -> bool:
+        """Mark every board row with this name as drafted."""
+        rows = self.rows_by_name.get(name)
+        if not rows or self.drafted[rows[0]]:
+            return False
+        self.drafted[rows] = True
+        self.remaining -= len(rows)
+        return True
+    
+    def _top_rows(self, position: Optional[str], n: int) -> List[int]:
+        """Get the first n undrafted rows of one position, advancing its cursor past drafted players."""
+        rows = self.position_rows.get(position)
+        if rows is None:
+            return []
+        
+        cursor = self.cursors[position]
+        while cursor < len(rows) and self.drafted[rows[cursor]]:
+            cursor += 1
+        self.cursors[position] = cursor
+        
+        top = []
+        for row in rows[cursor:]:
+            if not self.drafted[row]:
+                top.append(int(row))
+                if len(top) == n:
+                    break
+        return top
+    
+    def top(self, positions: Optional[Sequence[str]], n: int) -> List[int]:
+        """Get the first n undrafted rows in board order among the given positions (None for any position)."""
+        if positions is None:
+            return self._top_rows(None, n)
+        if len(positions) == 1:
+            return self._top_rows(positions[0], n)
+        return sorted(row for pos in positions for row in self._top_rows(pos, n))[:n]
+    
+    def record(self, row: int) -> Dict:
+        """Get a copy of a board row as a player dict."""
+        return dict(self.records[row])
@@ -0,0 +1,142 @@
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
+
+POSITIONS = ['QB', 'RB', 'WR', 'TE', 'K', 'DEF']
+UNKNOWN = len(POSITIONS)
+ROSTER_SIZE = 12
+STARTER_SLOTS = 9
+EARLY_SLOTS = 6
+FLEX_SLOT = 6
+
+# Minimum count per position for roster construction credit
+REQUIRED_COUNTS = np.array([1, 2, 2, 1, 1, 1])
+
+# Expected position(s) for each of the first nine picks and the penalty for missing it
+EXPECTED_ORDER = [['QB'], ['WR'], ['WR'], ['RB'], ['RB'], ['TE'], ['WR', 'RB', 'TE'], ['K'], ['DEF']]
+ORDER_PENALTIES = np.array([2 if len(expected) > 1 else 3 for expected in EXPECTED_ORDER])
+EARLY_KICKER_DEFENSE_SLOTS = 7
+
+GRADE_CUTOFFS = np.array([40, 45, 50, 55, 60, 65, 70, 75, 80, 85, 90])
+LETTER_GRADES = np.array(['F', 'D', 'D+', 'C-', 'C', 'C+', 'B-', 'B', 'B+', 'A-', 'A', 'A+'])
+
+def _expected_matrix() -> np.ndarray:
+    """Build the (slot, position code) table of acceptable picks, with a column for unknown positions."""
+    allowed = np.zeros((len(EXPECTED_ORDER), UNKNOWN + 1), dtype=bool)
+    for slot, expected in enumerate(EXPECTED_ORDER):
+        allowed[slot, [POSITIONS.index(pos) for pos in expected]] = True
+    return allowed
+
+EXPECTED_ALLOWED = _expected_matrix()
+
+def encode_rosters(rosters: Sequence[List[dict]], n_slots: int = ROSTER_SIZE) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Pack roster dicts into (position codes, VBD, value-pick flags, filled) arrays of shape (teams, slots)."""
+    n_slots = max([n_slots] + [len(roster) for roster in rosters])
+    codes = np.full((len(rosters), n_slots), UNKNOWN, dtype=np.int64)
+    vbd = np.zeros((len(rosters), n_slots))
+    value_picks = np.zeros((len(rosters), n_slots), dtype=bool)
+    filled = np.zeros((len(rosters), n_slots), dtype=bool)
+    position_codes = {pos: code for code, pos in enumerate(POSITIONS)}
+
+    for team, roster in enumerate(rosters):
+        for slot, player in enumerate(roster):
+            codes[team, slot] = position_codes.get(player.get('Position', 'UNKNOWN'), UNKNOWN)
+            vbd[team, slot] = float(player.get('VBD_Value', 0) or 0)
+            value_picks[team, slot] = bool(player.get('Value_Pick', False))
+            filled[team, slot] = True
+
+    return codes, vbd, value_picks, filled
+
+def grade_rosters(codes: np.ndarray, vbd: np.ndarray, value_picks: np.ndarray, filled: np.ndarray) -> Dict[str, np.ndarray]:
+    """Grade any number of rosters at once from (..., slots) arrays; every output has the leading shape."""
+    codes = np.where(filled, codes, UNKNOWN)
+    vbd = np.where(filled, vbd, 0.0)
+    value_picks = value_picks & filled
+    roster_sizes = filled.sum(axis=-1)
+
+    # 1. VBD score (30 max): starters are the first nine picks, the rest is bench
+    total_vbd = vbd.sum(axis=-1)
+    starter_vbd = vbd[..., :STARTER_SLOTS].sum(axis=-1)
+    bench_vbd = vbd[..., STARTER_SLOTS:].sum(axis=-1)
+    vbd_score = np.minimum(25, starter_vbd / 120 * 25) + np.minimum(5, bench_vbd / 30 * 5)
+
+    # 2. Roster construction (25 max, plus 2 for a WR/RB/TE in the FLEX slot)
+    counts = (codes[..., None] == np.arange(len(POSITIONS))).sum(axis=-2)
+    construction_score = np.minimum(counts / REQUIRED_COUNTS, 1).sum(axis=-1) * (25 / len(POSITIONS))
+    if codes.shape[-1] > FLEX_SLOT:
+        construction_score = construction_score + 2 * EXPECTED_ALLOWED[FLEX_SLOT, codes[..., FLEX_SLOT]]
+
+    # 3. Value and strategy (25 max)
+    value_count = value_picks.sum(axis=-1)
+    early_value_count = value_picks[..., :EARLY_SLOTS].sum(axis=-1)
+    strategy_score = np.minimum(15, value_count / ROSTER_SIZE * 30) + np.minimum(10, early_value_count / EARLY_SLOTS * 20)
+
+    # 4. Draft order execution (20 max): wrong positions in the first nine picks, early K/DEF
+    n_checked = min(len(EXPECTED_ORDER), codes.shape[-1])
+    slots = np.arange(n_checked)
+    wrong_position = filled[..., :n_checked] & ~EXPECTED_ALLOWED[slots, codes[..., :n_checked]]
+    early = codes[..., :EARLY_KICKER_DEFENSE_SLOTS]
+    early_kicker_defense = np.isin(early, [POSITIONS.index('K'), POSITIONS.index('DEF')]).sum(axis=-1)
+    execution_score = np.maximum(
+        0, 20 - (wrong_position * ORDER_PENALTIES[:n_checked]).sum(axis=-1) - 5 * early_kicker_defense
+    )
+
+    return {
+        'score': vbd_score + construction_score + strategy_score + execution_score,
+        'vbd_score': vbd_score,
+        'construction_score': construction_score,
+        'strategy_score': strategy_score,
+        'execution_score': execution_score,
+        'total_vbd': total_vbd,
+        'starter_vbd': starter_vbd,
+        'bench_vbd': bench_vbd,
+        'avg_vbd': np.divide(total_vbd, roster_sizes, out=np.zeros_like(total_vbd), where=roster_sizes > 0),
+        'value_picks': value_count,
+        'early_value_picks': early_value_count,
+        'roster_size': roster_sizes
+    }
+
+def letter_grades(scores: np.ndarray) -> np.ndarray:
+    """Map numeric draft scores to letter grades."""
+    return LETTER_GRADES[np.searchsorted(GRADE_CUTOFFS, scores, side='right')]
+
+def grade_summary(score: float) -> str:
+    """Describe a draft score in one sentence."""
+    if score >= 85:
+        return "🔥 Excellent draft! Outstanding value and team construction."
+    elif score >= 75:
+        return "⭐ Very good draft with solid players and good strategy."
+    elif score >= 65:
+        return "👍 Good draft with room for improvement in some areas."
+    elif score >= 55:
+        return "📊 Average draft, consider improving draft strategy."
+    return "⚠️ Below average draft, significant improvements needed."
+
+def grade_percentile(score: float, scores: np.ndarray) -> float:
+    """Calculate the share of graded rosters (in %) scoring strictly below the given score."""
+    scores = np.asarray(scores, dtype=float).ravel()
+    return float((scores < score).mean() * 100) if len(scores) else np.nan
+
+def grade_league(rosters: Sequence[List[dict]]) -> List[dict]:
+    """Grade every roster of a draft in one call and return one grade dict per roster."""
+    if not rosters:
+        return []
+
+    grades = grade_rosters(*encode_rosters(rosters))
+    letters = letter_grades(grades['score'])
+    results = []
+
+    for team, roster in enumerate(rosters):
+        score = float(grades['score'][team])
+        summary = grade_summary(score)
+        if len(roster) < ROSTER_SIZE:
+            summary = f"Incomplete roster ({len(roster)}/{ROSTER_SIZE} players). {summary}"
+
+        breakdown = {key: values[team].item() for key, values in grades.items() if key != 'score'}
+        results.append({
+            'score': score,
+            'letter_grade': str(letters[team]),
+            'summary': summary,
+            'breakdown': breakdown
+        })
+
+    return results
@@ -0,0 +1,69 @@
+import time
+import hashlib
+import streamlit as st
+import plotly.graph_objects as go
+from collections import OrderedDict
+from typing import Any, Callable
+
+class FigureCache:
+    """Session-scoped cache of built Plotly figures keyed on chart id, data version and parameters."""
+    
+    def __init__(self, state_key: str = 'figure_cache', max_entries: int = 128):
+        self.state_key = state_key
+        self.max_entries = max_entries
+    
+    @property
+    def _store(self) -> OrderedDict:
+        """Get the per-session figure store (least recently used first)."""
+        return st.session_state.setdefault(self.state_key, OrderedDict())
+    
+    @property
+    def _stats(self) -> dict:
+        """Get the per-session hit/miss counters."""
+        return st.session_state.setdefault(
+            f"{self.state_key}_stats",
+            {'hits': 0, 'misses': 0, 'build_seconds_saved': 0.0}
+        )
+    
+    def figure(self, chart_id: str, version: str, params: Any, build: Callable[[], go.Figure]) -> go.Figure:
+        """Return the cached figure object for this key, building and storing it on a miss (callers must not mutate it)."""
+        key = (chart_id, version, hashlib.sha1(repr(params).encode()).hexdigest())
+        store = self._store
+        stats = self._stats
+        
+        if key in store:
+            store.move_to_end(key)
+            fig, build_seconds = store[key]
+            stats['hits'] += 1
+            stats['build_seconds_saved'] += build_seconds
+            return fig
+        
+        start_time = time.perf_counter()
+        fig = build()
+        store[key] = (fig, time.perf_counter() - start_time)
+        stats['misses'] += 1
+        
+        # Evict least recently used figures
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
+        
+        return fig
+    
+    def metrics(self) -> dict:
+        """Get hit rate and reuse metrics for this session."""
+        stats = self._stats
+        lookups = stats['hits'] + stats['misses']
+        return {
+            **stats,
+            'entries': len(self._store),
+            'hit_rate': stats['hits'] / lookups if lookups else 0.0
+        }
+    
+    def render_metrics(self):
+        """Render cache metrics for the current session."""
+        metrics = self.metrics()
+        st.metric("Hit Rate", f"{metrics['hit_rate']:.0%}")
+        st.metric("Build Time Saved", f"{metrics['build_seconds_saved'] * 1000:.0f} ms")
+        st.caption(f"{metrics['hits']} hits / {metrics['misses']} builds · {metrics['entries']} figures cached")
+
+figure_cache = FigureCache()
@@ -0,0 +1,134 @@
+import pandas as pd
+import numpy as np
+import streamlit as st
+from typing import Dict, Optional, Sequence, Tuple
+
+class FilterEngine:
+    """Precomputed bitmap and sorted-range indexes for repeated filtering of one dataset."""
+    
+    def __init__(self, data: pd.DataFrame, categorical_columns: Tuple[str, ...] = (),
+                 range_columns: Tuple[str, ...] = (), order_by: Optional[str] = None, ascending: bool = True):
+        self.data = data
+        self.n_rows = len(data)
+        self.n_bytes = (self.n_rows + 7) // 8
+        
+        # One packed bitmap per distinct value of each categorical column, plus its codes for group aggregates
+        self.bitmaps = {}
+        self.group_codes = {}
+        self.group_values = {}
+        for column in categorical_columns:
+            if column in data.columns:
+                codes, uniques = pd.factorize(data[column])
+                self.bitmaps[column] = {
+                    value: np.packbits(codes == code) for code, value in enumerate(uniques)
+                }
+                self.group_codes[column] = codes
+                self.group_values[column] = uniques
+        
+        # Sorted values with their row positions for range queries (missing values excluded)
+        self.sorted_values = {}
+        self.sorted_rows = {}
+        self.numeric = {}
+        for column in range_columns:
+            if column in data.columns:
+                values = pd.to_numeric(data[column], errors='coerce').to_numpy(dtype=float)
+                self.numeric[column] = values
+                rows = np.flatnonzero(~np.isnan(values))
+                order = np.argsort(values[rows], kind='stable')
+                self.sorted_rows[column] = rows[order]
+                self.sorted_values[column] = values[rows][order]
+        
+        # Display order (missing sort keys last)
+        if order_by and order_by in data.columns:
+            keys = pd.to_numeric(data[order_by], errors='coerce').to_numpy(dtype=float)
+            keys = keys if ascending else -keys
+            self.order = np.argsort(np.where(np.isnan(keys), np.inf, keys), kind='stable')
+        else:
+            self.order = np.arange(self.n_rows)
+        
+        self._all = np.packbits(np.ones(self.n_rows, dtype=bool))
+        self._none = np.zeros(self.n_bytes, dtype=np.uint8)
+    
+    def match(self, equals: Optional[Dict[str, object]] = None, ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+              mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Combine equality, inclusive range and optional boolean-mask filters into one packed bitmap."""
+        bitmap = self._all.copy()
+        
+        for column, value in (equals or {}).items():
+            if value is None or column not in self.bitmaps:
+                continue
+            bitmap &= self.bitmaps[column].get(value, self._none)
+        
+        for column, (low, high) in (ranges or {}).items():
+            if column not in self.sorted_values:
+                continue
+            bitmap &= self._range_bitmap(column, low, high)
+        
+        if mask is not None:
+            bitmap &= np.packbits(np.asarray(mask, dtype=bool))
+        
+        return bitmap
+    
+    def _range_bitmap(self, column: str, low: float, high: float) -> np.ndarray:
+        """Build the bitmap of rows whose value lies in [low, high] with two binary searches."""
+        sorted_values = self.sorted_values[column]
+        start = np.searchsorted(sorted_values, low, side='left')
+        end = np.searchsorted(sorted_values, high, side='right')
+        
+        selected = np.zeros(self.n_rows, dtype=bool)
+        selected[self.sorted_rows[column][start:end]] = True
+        return np.packbits(selected)
+    
+    def positions(self, bitmap: np.ndarray) -> np.ndarray:
+        """Get the selected row positions in display order."""
+        selected = np.unpackbits(bitmap, count=self.n_rows).astype(bool)
+        return self.order[selected[self.order]]
+    
+    def rows(self, positions: np.ndarray, start: int = 0, size: Optional[int] = None,
+             columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Materialize only the requested page of rows (and only the given columns, when set)."""
+        end = len(positions) if size is None else start + size
+        if columns is None:
+            return self.data.iloc[positions[start:end]]
+        return self.data.iloc[positions[start:end], self.data.columns.get_indexer(list(columns))]
+    
+    def values(self, column: str, positions: np.ndarray) -> np.ndarray:
+        """Get a range column's numeric values at the given row positions."""
+        return self.numeric[column][positions]
+    
+    def group_stats(self, group_column: str, value_column: str, positions: np.ndarray) -> pd.DataFrame:
+        """Count, mean, std, max and min of a range column per categorical group over the given row positions."""
+        uniques = self.group_values[group_column]
+        codes = self.group_codes[group_column][positions]
+        values = self.numeric[value_column][positions]
+        grouped = codes >= 0
+        valid = grouped & ~np.isnan(values)
+        
+        n_groups = len(uniques)
+        counts = np.bincount(codes[valid], minlength=n_groups)
+        sums = np.bincount(codes[valid], weights=values[valid], minlength=n_groups)
+        squares = np.bincount(codes[valid], weights=values[valid] ** 2, minlength=n_groups)
+        maxima = np.full(n_groups, -np.inf)
+        minima = np.full(n_groups, np.inf)
+        np.maximum.at(maxima, codes[valid], values[valid])
+        np.minimum.at(minima, codes[valid], values[valid])
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+            variances = (squares - counts * means ** 2) / (counts - 1)
+            stds = np.where(counts > 1, np.sqrt(np.maximum(variances, 0)), np.nan)
+        
+        present = np.bincount(codes[grouped], minlength=n_groups) > 0
+        return pd.DataFrame({
+            'count': counts,
+            'mean': means,
+            'std': stds,
+            'max': np.where(counts > 0, maxima, np.nan),
+            'min': np.where(counts > 0, minima, np.nan)
+        }, index=pd.Index(uniques, name=group_column))[present]
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def filter_engine(_data: pd.DataFrame, version: str, categorical_columns: Tuple[str, ...] = (),
+                  range_columns: Tuple[str, ...] = (), order_by: Optional[str] = None, ascending: bool = True) -> FilterEngine:
+    """Build and cache a filter engine for one data version and index layout."""
+    return FilterEngine(_data, categorical_columns, range_columns, order_by, ascending)
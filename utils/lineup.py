@@ -0,0 +1,52 @@
+import numpy as np
+from typing import Dict, Optional, Tuple
+from utils.ai_strategies import FLEX_POSITIONS, POSITIONS
+
+STARTER_SLOTS = {'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'K': 1, 'DEF': 1}
+FLEX_SLOTS = 1
+
+class LineupScorer:
+    """Optimal QB/2RB/2WR/TE/FLEX/K/DEF lineups over player-value arrays with any leading axes (weeks, seasons, ...)."""
+    
+    def __init__(self, starters: Optional[Dict[str, int]] = None, flex_slots: int = FLEX_SLOTS):
+        starters = starters or STARTER_SLOTS
+        self.starter_counts = np.array([starters.get(pos, 0) for pos in POSITIONS])
+        self.flex_slots = flex_slots
+        self.flex_codes = [POSITIONS.index(pos) for pos in FLEX_POSITIONS]
+        self.depth = int(self.starter_counts.max()) + flex_slots
+        self.n_slots = int(self.starter_counts.sum()) + flex_slots
+    
+    def position_lists(self, values: np.ndarray, codes: np.ndarray, depth: Optional[int] = None) -> np.ndarray:
+        """Sort values (..., players) into best-first per-position lists (..., positions, depth), -inf where empty."""
+        values = np.asarray(values, dtype=float)
+        depth = depth or self.depth
+        lists = np.full(values.shape[:-1] + (len(POSITIONS), depth), -np.inf)
+        for code in range(len(POSITIONS)):
+            position_values = values[..., codes == code]
+            k = min(depth, position_values.shape[-1])
+            if k:
+                lists[..., code, :k] = -np.sort(-position_values, axis=-1)[..., :k]
+        return lists
+    
+    def starter_values(self, lists: np.ndarray) -> np.ndarray:
+        """Get the starting slot values (..., slots) chosen from best-first lists, -inf for unfilled slots."""
+        fixed = [lists[..., code, :count] for code, count in enumerate(self.starter_counts) if count]
+        
+        # FLEX takes the best players left over after the WR/RB/TE starters
+        spill = np.concatenate([
+            lists[..., code, self.starter_counts[code]:self.starter_counts[code] + self.flex_slots]
+            for code in self.flex_codes
+        ], axis=-1)
+        flex = -np.sort(-spill, axis=-1)[..., :self.flex_slots]
+        return np.concatenate(fixed + [flex], axis=-1)
+    
+    def lists_value(self, lists: np.ndarray) -> np.ndarray:
+        """Get the optimal lineup value of best-first lists (unfilled slots score 0)."""
+        slots = self.starter_values(lists)
+        return np.where(np.isfinite(slots), slots, 0).sum(axis=-1)
+    
+    def score(self, values: np.ndarray, codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the optimal lineup value and the number of unfilled starting slots (unavailable players are -inf)."""
+        slots = self.starter_values(self.position_lists(values, codes))
+        filled = np.isfinite(slots)
+        return np.where(filled, slots, 0).sum(axis=-1), (~filled).sum(axis=-1)
@@ -0,0 +1,215 @@
+import time
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Union
+from utils.adp import pick_distributions
+from utils.ai_strategies import FLEX_POSITIONS, POSITIONS, SlotScriptStrategy, build_strategies, position_codes
+from utils.simulation import CI_Z, ConvergenceMonitor, proportion_half_width
+
+class LookaheadRecommender:
+    """Expected starting-lineup value of each candidate pick from vectorized rollouts of the AI opponents."""
+    
+    def __init__(self, available: pd.DataFrame, starters: Dict[str, int], flex_slots: int = 1,
+                 slot_order: Sequence[str] = (), value_col: str = 'VBD_Value'):
+        self.available = available
+        self.names = available['Player_Name'].to_numpy()
+        self.values = pd.to_numeric(available[value_col], errors='coerce').fillna(0).to_numpy(dtype=float)
+        self.codes = position_codes(available['Position'])
+        self.position_masks = np.stack([self.codes == code for code in range(len(POSITIONS))])
+        self.slot_order = list(slot_order)
+        self.slot_script = SlotScriptStrategy(self.codes, self.values, self.slot_order)
+        self.adp, self.adp_std = pick_distributions(available)
+        
+        # Lineup layout: per-position top lists long enough for starters plus FLEX spill-over
+        self.starter_counts = np.array([starters.get(pos, 0) for pos in POSITIONS])
+        self.flex_slots = flex_slots
+        self.list_length = int(self.starter_counts.max()) + flex_slots
+        slots = np.arange(self.list_length)
+        self.starter_slots = slots[None, :] < self.starter_counts[:, None]
+        flex_rows = np.isin(POSITIONS, FLEX_POSITIONS)[:, None]
+        self.flex_spill = flex_rows & (slots[None, :] >= self.starter_counts[:, None]) & \
+            (slots[None, :] < self.starter_counts[:, None] + flex_slots)
+    
+    def _roster_lists(self, roster: List[dict]) -> np.ndarray:
+        """Build the (positions, list_length) best-first value lists of a roster (empty slots at replacement, 0)."""
+        lists = np.zeros((len(POSITIONS), self.list_length))
+        for code, pos in enumerate(POSITIONS):
+            values = sorted((float(p.get('VBD_Value', 0) or 0) for p in roster if p.get('Position') == pos), reverse=True)
+            values = [v for v in values if v > 0][:self.list_length]
+            lists[code, :len(values)] = values
+        return lists
+    
+    def _lineup_value(self, lists: np.ndarray) -> np.ndarray:
+        """Score best-first lists (..., positions, list_length) as starters plus the best FLEX spill-over."""
+        starters = (lists * self.starter_slots).sum(axis=(-2, -1))
+        spill = np.where(self.flex_spill, lists, -np.inf).reshape(*lists.shape[:-2], -1)
+        best_flex = -np.sort(-spill, axis=-1)[..., :self.flex_slots]
+        return starters + np.where(np.isfinite(best_flex), best_flex, 0).sum(axis=-1)
+    
+    def _add_player(self, lists: np.ndarray, codes: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Insert one player per row into that row's position list (rows are the leading axis)."""
+        lists = lists.copy()
+        rows = np.arange(len(codes))
+        valid = codes >= 0
+        merged = np.concatenate([lists[rows[valid], codes[valid]], np.maximum(values[valid], 0)[:, None]], axis=1)
+        lists[rows[valid], codes[valid]] = -np.sort(-merged, axis=1)[:, :self.list_length]
+        return lists
+    
+    def _team_strength(self, roster: List[dict]):
+        """Get a roster's per-position VBD totals and counts (as used by the AI's FLEX and bench logic)."""
+        totals = np.zeros(len(POSITIONS))
+        counts = np.zeros(len(POSITIONS))
+        for player in roster:
+            pos = player.get('Position')
+            if pos in POSITIONS:
+                totals[POSITIONS.index(pos)] += float(player.get('VBD_Value', 0) or 0)
+                counts[POSITIONS.index(pos)] += 1
+        return totals, counts
+    
+    def recommend(self, user_roster: List[dict], opponent_rosters: List[List[dict]], opponent_schedule: List[int],
+                  user_has_next_pick: bool = True, candidates: int = 10, candidate_col: Optional[str] = None,
+                  chunk_size: int = 64, max_rollouts: int = 512, time_budget: float = 2.0,
+                  seed: Union[int, np.random.SeedSequence, None] = None, tolerance: Optional[float] = None,
+                  availability_tolerance: Optional[float] = None,
+                  opponent_strategies: Optional[Dict[int, str]] = None, first_pick: int = 1) -> pd.DataFrame:
+        """Rank candidate picks by expected lineup value after the AI picks up to the user's next turn.
+        
+        opponent_schedule lists the AI teams picking in order, starting at overall pick first_pick.
+        """
+        start_time = time.perf_counter()
+        rng = np.random.default_rng(seed)
+        
+        # Each opponent follows its own strategy (the classic slot script unless told otherwise)
+        opponent_strategies = opponent_strategies or {}
+        strategies = build_strategies(opponent_strategies.values(), self.codes, self.values, self.slot_order,
+                                      self.adp, self.adp_std)
+        
+        # Adaptive mode: stop once every candidate's EV (and availability) interval is within tolerance
+        tolerances = {name: value for name, value in [('ev', tolerance), ('availability', availability_tolerance)] if value is not None}
+        monitor = ConvergenceMonitor(max_rollouts, tolerances, batch_size=chunk_size, min_runs=2 * chunk_size) if tolerances else None
+        
+        order_col = candidate_col if candidate_col in self.available.columns else None
+        ranking = self.available[order_col].to_numpy(dtype=float) if order_col else self.values
+        candidate_rows = np.argsort(-np.nan_to_num(ranking, nan=-np.inf), kind='stable')[:candidates]
+        n_candidates = len(candidate_rows)
+        if n_candidates == 0:
+            return pd.DataFrame()
+        
+        # Lineup after each candidate pick
+        base_lists = self._roster_lists(user_roster)
+        candidate_lists = self._add_player(
+            np.repeat(base_lists[None], n_candidates, axis=0), self.codes[candidate_rows], self.values[candidate_rows]
+        )
+        immediate_value = self._lineup_value(candidate_lists)
+        
+        # Opponent state for the AI policy
+        team_ids = sorted(set(opponent_schedule))
+        team_slot = {team: len(opponent_rosters[team]) for team in team_ids}
+        strengths = {team: self._team_strength(opponent_rosters[team]) for team in team_ids}
+        
+        sums = np.zeros(n_candidates)
+        squares = np.zeros(n_candidates)
+        still_available = np.zeros(n_candidates)
+        availability_trials = np.zeros(n_candidates)
+        rollouts = 0
+        stopped_early = False
+        
+        while user_has_next_pick and rollouts < max_rollouts:
+            # One batch row per (candidate, rollout); each candidate is off the board in its own rows
+            group = np.repeat(np.arange(n_candidates), chunk_size)
+            available = np.ones((len(group), len(self.values)), dtype=bool)
+            available[np.arange(len(group)), candidate_rows[group]] = False
+            
+            totals = {team: np.tile(strengths[team][0], (len(group), 1)) for team in team_ids}
+            counts = {team: np.tile(strengths[team][1], (len(group), 1)) for team in team_ids}
+            picks_made = {team: 0 for team in team_ids}
+            
+            for overall_pick, team in enumerate(opponent_schedule, start=first_pick):
+                strategy = strategies.get(opponent_strategies.get(team), self.slot_script)
+                chosen = strategy.pick(available, counts[team], totals[team], team_slot[team] + picks_made[team], rng,
+                                       overall_pick)
+                rows = np.flatnonzero(chosen >= 0)
+                available[rows, chosen[rows]] = False
+                
+                chosen_codes = self.codes[chosen[rows]]
+                known = chosen_codes >= 0
+                np.add.at(totals[team], (rows[known], chosen_codes[known]), self.values[chosen[rows][known]])
+                np.add.at(counts[team], (rows[known], chosen_codes[known]), 1)
+                picks_made[team] += 1
+            
+            # User's next pick: best lineup gain among each position's best remaining player
+            best_by_position = np.stack([
+                np.where(available & mask, self.values, -np.inf).max(axis=1) for mask in self.position_masks
+            ], axis=1)
+            row_lists = candidate_lists[group]
+            option_values = np.stack([
+                self._lineup_value(self._add_player(row_lists, np.full(len(group), code),
+                                                    np.where(np.isfinite(best_by_position[:, code]), best_by_position[:, code], 0)))
+                for code in range(len(POSITIONS))
+            ], axis=1)
+            outcome = option_values.max(axis=1)
+            
+            np.add.at(sums, group, outcome)
+            np.add.at(squares, group, outcome ** 2)
+            
+            # Availability of each candidate at the next pick, measured in the other candidates' rows
+            for c, row in enumerate(candidate_rows):
+                others = group != c
+                still_available[c] += available[others, row].sum()
+                availability_trials[c] += others.sum()
+            
+            rollouts += chunk_size
+            means = sums / rollouts
+            errors = np.sqrt(np.maximum(squares / rollouts - means ** 2, 0) / rollouts)
+            
+            if monitor:
+                availability = np.divide(still_available, availability_trials, out=np.zeros(n_candidates), where=availability_trials > 0)
+                if monitor.update(rollouts, {
+                    'ev': float((CI_Z * errors).max()),
+                    'availability': float(proportion_half_width(availability, availability_trials).max())
+                }):
+                    stopped_early = monitor.stopped_early
+                    break
+            
+            # Early stop: the leader is clear of every rival, or the pick-timer budget is spent
+            leader = int(np.argmax(means))
+            rivals_upper = np.delete(means + 2 * errors, leader)
+            if rollouts >= 2 * chunk_size and (len(rivals_upper) == 0 or means[leader] - 2 * errors[leader] >= rivals_upper.max()):
+                stopped_early = rollouts < max_rollouts
+                break
+            if time.perf_counter() - start_time > time_budget:
+                stopped_early = True
+                break
+        
+        if rollouts:
+            expected_value = sums / rollouts
+            std_error = np.sqrt(np.maximum(squares / rollouts - expected_value ** 2, 0) / rollouts)
+            availability = np.divide(still_available, availability_trials, out=np.zeros(n_candidates), where=availability_trials > 0)
+        else:
+            expected_value = immediate_value
+            std_error = np.zeros(n_candidates)
+            availability = np.zeros(n_candidates)
+        
+        result = pd.DataFrame({
+            'Player_Name': self.names[candidate_rows],
+            'Position': self.available['Position'].to_numpy()[candidate_rows],
+            'VBD_Value': self.values[candidate_rows],
+            'Lineup_Value_Now': immediate_value,
+            'Expected_Lineup_Value': expected_value,
+            'Std_Error': std_error,
+            'Available_Next_Pick': availability,
+            'board_row': candidate_rows
+        })
+        
+        # Ties go to the candidate least likely to survive to the next pick
+        result = result.sort_values(['Expected_Lineup_Value', 'Available_Next_Pick'], ascending=[False, True],
+                                    kind='stable').reset_index(drop=True)
+        
+        result.attrs.update({
+            'rollouts': rollouts,
+            'elapsed': time.perf_counter() - start_time,
+            'stopped_early': stopped_early,
+            'requested': max_rollouts,
+            'converged': bool(monitor and monitor.converged)
+        })
+        return result
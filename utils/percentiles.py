@@ -0,0 +1,117 @@
+import pandas as pd
+import numpy as np
+import streamlit as st
+from typing import Dict, List, Tuple
+
+PERCENTILES = [0.1, 0.25, 0.5, 0.75, 0.9]
+ALL_GROUP = 'All'
+
+class PercentileTable:
+    """Per-group percentile and summary statistics for every numeric metric."""
+    
+    def __init__(self, data: pd.DataFrame, group_col: str):
+        self.group_col = group_col
+        self.metrics = data.select_dtypes(include=[np.number]).columns.tolist()
+        
+        frame = data[self.metrics].copy()
+        frame[group_col] = data[group_col].astype(str) if group_col in data.columns else np.nan
+        
+        self.summary = self._build_summary(frame)
+        self.sorted_values = self._build_sorted_values(frame)
+        self.ranges = dict(zip(self.summary.index, self.summary[['min', 'max']].to_numpy()))
+    
+    def _build_summary(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Build one (group, metric) row of count/mean/std/min/percentiles/max per pair."""
+        grouped = frame.groupby(self.group_col)[self.metrics]
+        overall = frame[self.metrics]
+        
+        # Single grouped quantile pass plus the league-wide rows
+        quantiles = pd.concat([
+            grouped.quantile(PERCENTILES),
+            pd.concat({ALL_GROUP: overall.quantile(PERCENTILES)})
+        ])
+        quantiles.index.names = ['group', 'quantile']
+        quantiles = quantiles.stack(future_stack=True).unstack('quantile')
+        quantiles.index.names = ['group', 'metric']
+        quantiles.columns = [f"p{int(q * 100)}" for q in quantiles.columns]
+        
+        moment_stats = ['count', 'mean', 'std', 'min', 'max']
+        moments = pd.concat([
+            grouped.agg(moment_stats).stack(level=0, future_stack=True),
+            pd.concat({ALL_GROUP: overall.agg(moment_stats).T})
+        ])
+        moments.index.names = ['group', 'metric']
+        
+        summary = moments.join(quantiles).sort_index()
+        return summary[['count', 'mean', 'std', 'min', 'p10', 'p25', 'p50', 'p75', 'p90', 'max']]
+    
+    def _build_sorted_values(self, frame: pd.DataFrame) -> Dict[Tuple[str, str], np.ndarray]:
+        """Sort each metric once per group so percentile lookups are a binary search."""
+        sorted_values = {}
+        groups = frame[self.group_col].to_numpy()
+        
+        for metric in self.metrics:
+            values = frame[metric].to_numpy(dtype=float)
+            present = ~np.isnan(values)
+            order = np.lexsort((values[present], groups[present]))
+            metric_groups = groups[present][order]
+            metric_values = values[present][order]
+            
+            boundaries = np.flatnonzero(metric_groups[1:] != metric_groups[:-1]) + 1
+            for chunk_groups, chunk_values in zip(np.split(metric_groups, boundaries), np.split(metric_values, boundaries)):
+                if len(chunk_groups):
+                    sorted_values[(chunk_groups[0], metric)] = chunk_values
+            
+            sorted_values[(ALL_GROUP, metric)] = np.sort(values[present])
+        
+        return sorted_values
+    
+    def stats(self, metric: str, group: str = ALL_GROUP) -> pd.Series:
+        """Get the summary row for a metric within a group."""
+        return self.summary.loc[(str(group), metric)]
+    
+    def group_stats(self, metric: str) -> pd.DataFrame:
+        """Get summary rows for a metric across all groups (excluding the league-wide row)."""
+        rows = self.summary.xs(metric, level='metric')
+        return rows.drop(index=ALL_GROUP, errors='ignore')
+    
+    def percentile_table(self, metrics: List[str], group: str = ALL_GROUP) -> pd.DataFrame:
+        """Get the p10-p90 table for a list of metrics within a group."""
+        rows = self.summary.loc[[(str(group), metric) for metric in metrics], ['p10', 'p25', 'p50', 'p75', 'p90']]
+        rows.index = [metric.replace('_', ' ').title() for metric in metrics]
+        rows.columns = ['10th', '25th', '50th', '75th', '90th']
+        return rows
+    
+    def percentile_of(self, metric: str, value: float, group: str = ALL_GROUP) -> float:
+        """Calculate the share of the group (in %) with a value strictly below the given one."""
+        values = self.sorted_values.get((str(group), metric))
+        if values is None or len(values) == 0 or pd.isna(value):
+            return np.nan
+        return np.searchsorted(values, value, side='left') / len(values) * 100
+    
+    def normalize(self, metrics: List[str], values: np.ndarray, group: str = ALL_GROUP,
+                  method: str = 'minmax') -> np.ndarray:
+        """Scale a (players x metrics) value matrix to 0-1 against the group's full distribution."""
+        values = np.asarray(values, dtype=float)
+        group = str(group)
+        
+        if method == 'percentile':
+            scaled = np.full(values.shape, np.nan)
+            for j, metric in enumerate(metrics):
+                sorted_values = self.sorted_values.get((group, metric))
+                present = ~np.isnan(values[:, j])
+                if sorted_values is not None and len(sorted_values):
+                    scaled[present, j] = np.searchsorted(sorted_values, values[present, j], side='left') / len(sorted_values)
+            return scaled
+        
+        bounds = np.array([self.ranges.get((group, metric), (np.nan, np.nan)) for metric in metrics], dtype=float)
+        low, high = bounds[:, 0], bounds[:, 1]
+        span = high - low
+        with np.errstate(invalid='ignore'):
+            scaled = np.where(span > 0, (values - low) / np.where(span > 0, span, 1.0), 0.5)
+        return np.where(np.isnan(values), np.nan, np.clip(scaled, 0, 1))
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def percentile_table(_data: pd.DataFrame, version: str, group_col: str = 'position_group') -> PercentileTable:
+    """Build and cache the percentile table for one data version and grouping column."""
+    return PercentileTable(_data, group_col)
@@ -0,0 +1,160 @@
+import pandas as pd
+import numpy as np
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+from typing import Dict, Optional, Tuple
+from utils.figure_cache import figure_cache
+
+WEBGL_THRESHOLD = 2000
+MAX_SCATTER_POINTS = 4000
+DOWNSAMPLE_METHODS = ['Grid', 'LTTB', 'None']
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Select n_out point indices with Largest-Triangle-Three-Buckets over x order."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    order = np.argsort(x, kind='stable')
+    xs, ys = x[order], y[order]
+    
+    # First and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        avg_x = xs[end:next_end].mean()
+        avg_y = ys[end:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous pick and the next bucket mean
+        area = np.abs(
+            (xs[previous] - avg_x) * (ys[start:end] - ys[previous])
+            - (xs[previous] - xs[start:end]) * (avg_y - ys[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    
+    return np.sort(order[selected])
+
+def grid_indices(x: np.ndarray, y: np.ndarray, n_out: int, groups: Optional[np.ndarray] = None) -> np.ndarray:
+    """Keep one representative point per occupied 2-D grid cell (per group when given)."""
+    n_groups = 1
+    group_codes = np.zeros(len(x), dtype=np.int64)
+    if groups is not None:
+        group_codes, uniques = pd.factorize(groups)
+        n_groups = max(len(uniques), 1)
+    
+    cells = max(1, int(np.sqrt(n_out / n_groups)))
+    cell_ids = (
+        group_codes.astype(np.int64) * cells * cells
+        + _grid_bin(x, cells) * cells
+        + _grid_bin(y, cells)
+    )
+    
+    _, first_in_cell = np.unique(cell_ids, return_index=True)
+    return np.sort(first_in_cell)
+
+def _grid_bin(values: np.ndarray, cells: int) -> np.ndarray:
+    """Map values onto integer grid cells spanning their observed range."""
+    low, high = values.min(), values.max()
+    if high <= low:
+        return np.zeros(len(values), dtype=np.int64)
+    return np.minimum(((values - low) / (high - low) * cells).astype(np.int64), cells - 1)
+
+def downsample(data: pd.DataFrame, x: str, y: str, method: str = 'Grid',
+               max_points: int = MAX_SCATTER_POINTS, color: Optional[str] = None) -> pd.DataFrame:
+    """Reduce a frame to at most roughly max_points rows for an x/y scatter."""
+    plot_data = data.dropna(subset=[x, y])
+    if method == 'None' or len(plot_data) <= max_points:
+        return plot_data
+    
+    x_values = plot_data[x].to_numpy(dtype=float)
+    y_values = plot_data[y].to_numpy(dtype=float)
+    
+    if method == 'LTTB':
+        keep = lttb_indices(x_values, y_values, max_points)
+    else:
+        groups = plot_data[color].to_numpy() if color else None
+        keep = grid_indices(x_values, y_values, max_points, groups)
+    
+    return plot_data.iloc[keep]
+
+def scatter_figure(data: pd.DataFrame, x: str, y: str, method: str = 'Grid',
+                   max_points: int = MAX_SCATTER_POINTS, trendline: bool = False, **px_kwargs) -> Tuple[go.Figure, int]:
+    """Build a scatter that switches to WebGL and downsamples above the size thresholds."""
+    color = px_kwargs.get('color')
+    plot_data = downsample(data, x, y, method, max_points, color)
+    render_mode = 'webgl' if len(plot_data) > WEBGL_THRESHOLD or len(data) > max_points else 'svg'
+    
+    fig = px.scatter(plot_data, x=x, y=y, render_mode=render_mode, **px_kwargs)
+    
+    if trendline:
+        _add_trendlines(fig, data, x, y, color)
+    
+    return fig, len(plot_data)
+
+def _add_trendlines(fig: go.Figure, data: pd.DataFrame, x: str, y: str, color: Optional[str]):
+    """Add least-squares lines fitted on the full data, one per color group."""
+    fit_data = data.dropna(subset=[x, y])
+    trace_colors = {trace.name: trace.marker.color for trace in fig.data}
+    groups = fit_data.groupby(color, sort=False) if color else [(None, fit_data)]
+    
+    for group, group_data in groups:
+        if len(group_data) < 2 or group_data[x].nunique() < 2:
+            continue
+        slope, intercept = np.polyfit(group_data[x].to_numpy(dtype=float), group_data[y].to_numpy(dtype=float), 1)
+        x_range = np.array([group_data[x].min(), group_data[x].max()])
+        
+        fig.add_trace(go.Scattergl(
+            x=x_range,
+            y=slope * x_range + intercept,
+            mode='lines',
+            name=f"{group} trend" if group is not None else "Trend",
+            line=dict(color=trace_colors.get(str(group) if group is not None else None, 'white')),
+            showlegend=False
+        ))
+
+def render_scatter(data: pd.DataFrame, x: str, y: str, key: str, layout: Dict,
+                   method: str = 'Grid', trendline: bool = False, version: Optional[str] = None, **px_kwargs):
+    """Render a downsampled scatter and, on box selection, the selected region at full resolution."""
+    total = int(data[[x, y]].notna().all(axis=1).sum())
+    
+    def build_fig():
+        fig, shown = scatter_figure(data, x, y, method, trendline=trendline, **px_kwargs)
+        fig.update_layout(**layout)
+        if shown < total:
+            fig.update_layout(dragmode='select')
+        fig.layout.meta = {'shown': shown}
+        return fig
+    
+    # With a data version the overview figure is reused across reruns; selected regions are always rebuilt
+    if version is not None:
+        fig = figure_cache.figure(f"scatter_{key}", version, (x, y, method, trendline, layout, px_kwargs), build_fig)
+    else:
+        fig = build_fig()
+    shown = fig.layout.meta['shown']
+    
+    if shown >= total:
+        st.plotly_chart(fig, width='stretch')
+        return
+    
+    # Streamlit cannot observe zoom, so a box selection stands in for it
+    event = st.plotly_chart(fig, width='stretch', on_select='rerun', selection_mode='box', key=key)
+    st.caption(f"Showing {shown:,} of {total:,} points ({method} downsampling). "
+               "Box-select a region to load it at full resolution.")
+    
+    boxes = event.selection.get('box', []) if event else []
+    if boxes:
+        x_low, x_high = sorted(boxes[0]['x'])
+        y_low, y_high = sorted(boxes[0]['y'])
+        region = data[data[x].between(x_low, x_high) & data[y].between(y_low, y_high)]
+        
+        zoom_fig, _ = scatter_figure(region, x, y, 'None', trendline=trendline, **px_kwargs)
+        zoom_fig.update_layout(**layout)
+        zoom_fig.update_layout(title=f"Selected Region at Full Resolution ({len(region):,} points)")
+        st.plotly_chart(zoom_fig, width='stretch')
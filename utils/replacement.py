@@ -0,0 +1,124 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Iterable, Optional, Sequence
+
+DEFAULT_STARTERS = {'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'K': 1, 'DEF': 1}
+FLEX_POSITIONS = ('RB', 'WR', 'TE')
+
+class ReplacementEngine:
+    """Live value-over-replacement from league starter demand and the players still on the board."""
+    
+    def __init__(self, players: pd.DataFrame, n_teams: int = 10, starters: Optional[Dict[str, int]] = None,
+                 flex_slots: int = 1, flex_positions: Sequence[str] = FLEX_POSITIONS,
+                 value_col: str = 'VBD_Value', name_col: str = 'Player_Name'):
+        self.n_teams = n_teams
+        self.starters = dict(starters or DEFAULT_STARTERS)
+        self.positions = list(self.starters)
+        self.position_index = {pos: i for i, pos in enumerate(self.positions)}
+        self.starter_counts = np.array([self.starters[pos] for pos in self.positions])
+        self.flex_slots = flex_slots
+        self.flex_positions = [pos for pos in flex_positions if pos in self.position_index]
+        self.flex_mask = np.isin(self.positions, self.flex_positions)
+        
+        # VBD is value over a fixed baseline, so re-basing it on the live replacement player is equivalent to points
+        self.values = pd.to_numeric(players[value_col], errors='coerce').fillna(0).to_numpy(dtype=float)
+        self.player_positions = players['Position'].to_numpy()
+        self.row_of = {name: row for row, name in enumerate(players[name_col])}
+        
+        # Players per position best first; a drafted mask and per-position cursors skip taken players lazily
+        self.sorted_rows = {}
+        for pos in self.positions:
+            rows = np.flatnonzero(self.player_positions == pos)
+            self.sorted_rows[pos] = rows[np.argsort(-self.values[rows], kind='stable')]
+        self.drafted = np.zeros(len(self.values), dtype=bool)
+        self.cursors = {pos: 0 for pos in self.positions}
+        self.remaining = {pos: len(rows) for pos, rows in self.sorted_rows.items()}
+        
+        # Starters drafted so far per team (teams are registered on their first pick)
+        self.team_counts = {}
+        self._levels = None
+    
+    def draft(self, name: str, team: str) -> bool:
+        """Mark a drafted player off the board and charge the pick to the team's roster."""
+        row = self.row_of.get(name)
+        if row is None or self.drafted[row]:
+            return False
+        self.drafted[row] = True
+        
+        position = self.player_positions[row]
+        if position in self.sorted_rows:
+            self.remaining[position] -= 1
+            counts = self.team_counts.setdefault(team, np.zeros(len(self.positions), dtype=np.int64))
+            counts[self.position_index[position]] += 1
+        
+        self._levels = None
+        return True
+    
+    def _top_values(self, position: str, n: int) -> np.ndarray:
+        """Get the values of the best n undrafted players at a position, advancing its cursor past drafted players."""
+        rows = self.sorted_rows[position]
+        cursor = self.cursors[position]
+        while cursor < len(rows) and self.drafted[rows[cursor]]:
+            cursor += 1
+        self.cursors[position] = cursor
+        
+        top = []
+        for row in rows[cursor:]:
+            if not self.drafted[row]:
+                top.append(row)
+                if len(top) == n:
+                    break
+        return self.values[np.array(top, dtype=np.int64)]
+    
+    def remaining_demand(self) -> Dict[str, int]:
+        """Count unfilled dedicated starter slots per position, plus open FLEX slots under 'FLEX'."""
+        counts = np.array(list(self.team_counts.values()), dtype=np.int64).reshape(-1, len(self.positions))
+        unseen_teams = max(0, self.n_teams - len(counts))
+        
+        dedicated = np.maximum(0, self.starter_counts - counts).sum(axis=0) + self.starter_counts * unseen_teams
+        flex_used = np.maximum(0, counts - self.starter_counts)[:, self.flex_mask].sum(axis=1)
+        open_flex = int(np.maximum(0, self.flex_slots - flex_used).sum()) + self.flex_slots * unseen_teams
+        
+        demand = dict(zip(self.positions, dedicated.tolist()))
+        demand['FLEX'] = open_flex
+        return demand
+    
+    def replacement_levels(self) -> Dict[str, float]:
+        """Get each position's replacement value: the best available player who would not start."""
+        if self._levels is not None:
+            return self._levels
+        
+        demand = self.remaining_demand()
+        cutoffs = {pos: demand[pos] for pos in self.positions}
+        
+        # FLEX slots go to the best flex-eligible players left after the dedicated starters
+        open_flex = demand['FLEX']
+        if open_flex and self.flex_positions:
+            pools = [self._top_values(pos, cutoffs[pos] + open_flex)[cutoffs[pos]:] for pos in self.flex_positions]
+            labels = np.concatenate([np.full(len(pool), i) for i, pool in enumerate(pools)])
+            values = np.concatenate(pools)
+            taken = labels[np.argsort(-values, kind='stable')[:open_flex]]
+            for i, pos in enumerate(self.flex_positions):
+                cutoffs[pos] += int((taken == i).sum())
+        
+        levels = {}
+        for pos in self.positions:
+            if self.remaining[pos] == 0:
+                levels[pos] = 0.0
+            else:
+                depth = min(cutoffs[pos], self.remaining[pos] - 1)
+                levels[pos] = float(self._top_values(pos, depth + 1)[depth])
+        
+        self._levels = levels
+        return levels
+    
+    def vor(self, names: Iterable[str]) -> np.ndarray:
+        """Get live value over replacement for players by name (NaN for unknown names or positions)."""
+        rows = pd.Series(list(names), dtype=object).map(self.row_of)
+        known = rows.notna().to_numpy()
+        rows = rows[known].astype(int).to_numpy()
+        
+        levels = pd.Series(self.player_positions[rows]).map(self.replacement_levels()).to_numpy(dtype=float)
+        result = np.full(len(known), np.nan)
+        result[known] = self.values[rows] - levels
+        return result
@@ -0,0 +1,116 @@
+import os
+import shutil
+import hashlib
+import tempfile
+import threading
+import pandas as pd
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_DIR = os.environ.get('T3S_SIMULATION_CACHE', os.path.join(tempfile.gettempdir(), 't3s_simulation_cache'))
+STORE_VERSION = 1  # bump when stored frames change shape, so stale disk entries are never read back
+
+# Parquet I/O failures only cost the disk copy; pyarrow's own errors do not all subclass the builtins
+try:
+    from pyarrow import ArrowException
+    PARQUET_ERRORS = (OSError, ImportError, ValueError, TypeError, ArrowException)
+except ImportError:
+    PARQUET_ERRORS = (OSError, ImportError, ValueError, TypeError)
+
+def _canonical(value: Any) -> Any:
+    """Make dicts order-independent so equal configurations hash equally."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(v) for v in value)
+    if isinstance(value, float):
+        return round(value, 10)
+    return value
+
+class SimulationStore:
+    """Aggregated simulation outputs keyed on (data version, config, seed): in-memory LRU backed by Parquet files."""
+    
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR, max_entries: int = 32, max_disk_entries: int = 256):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()  # Streamlit serves sessions from threads sharing this store
+        self.stats = {'hits': 0, 'disk_hits': 0, 'misses': 0}
+    
+    @staticmethod
+    def key(version: str, config: Dict[str, Any], seed: Optional[int]) -> str:
+        """Hash the store version, a data version, simulation configuration and seed into a store key."""
+        return hashlib.sha1(repr((STORE_VERSION, version, _canonical(config), seed)).encode()).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        """Get the directory holding a key's Parquet files."""
+        return os.path.join(self.cache_dir, key)
+    
+    def _remember(self, key: str, frames: Dict[str, pd.DataFrame]):
+        """Insert into the in-memory LRU and evict the least recently used entries."""
+        with self._lock:
+            self._memory[key] = frames
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+    
+    def get(self, key: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """Get stored frames from memory, then disk; None on a miss."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats['hits'] += 1
+                return self._memory[key]
+        
+        path = self._path(key) if self.cache_dir else None
+        if path and os.path.isdir(path):
+            try:
+                frames = {
+                    name[:-len('.parquet')]: pd.read_parquet(os.path.join(path, name))
+                    for name in os.listdir(path) if name.endswith('.parquet')
+                }
+                os.utime(path)
+            except PARQUET_ERRORS:
+                frames = None
+            if frames:
+                self._remember(key, frames)
+                with self._lock:
+                    self.stats['disk_hits'] += 1
+                return frames
+        
+        with self._lock:
+            self.stats['misses'] += 1
+        return None
+    
+    def put(self, key: str, frames: Dict[str, pd.DataFrame]):
+        """Store frames in memory and, when possible, as Parquet on disk."""
+        self._remember(key, frames)
+        if not self.cache_dir:
+            return
+        
+        # Write to a scratch directory and swap it in, so readers never see partial results
+        scratch = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            scratch = tempfile.mkdtemp(dir=self.cache_dir, prefix='.tmp-')
+            for name, frame in frames.items():
+                frame.to_parquet(os.path.join(scratch, f"{name}.parquet"))
+            shutil.rmtree(self._path(key), ignore_errors=True)
+            os.replace(scratch, self._path(key))
+            self._evict_disk()
+        except PARQUET_ERRORS:
+            # The in-memory entry stays; only the disk copy is skipped
+            if scratch:
+                shutil.rmtree(scratch, ignore_errors=True)
+    
+    def _evict_disk(self):
+        """Remove the least recently used result directories beyond the disk limit."""
+        entries = [
+            os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if not name.startswith('.')
+        ]
+        entries.sort(key=os.path.getmtime)
+        for path in entries[:max(0, len(entries) - self.max_disk_entries)]:
+            shutil.rmtree(path, ignore_errors=True)
+
+simulation_store = SimulationStore()
@@ -0,0 +1,28 @@
+import numpy as np
+from typing import List, Union
+
+DEFAULT_SEED = 2024
+
+# Top-level stream keys; simulations, teams and picks are keyed beneath them
+NFL_DRAFT_STREAM = 0
+NFL_RESERVOIR_STREAM = 1
+FANTASY_DRAFT_STREAM = 2
+LOOKAHEAD_STREAM = 3
+BYE_WEEK_STREAM = 4  # unused since bye weeks are no longer invented; reserved so later keys keep their streams
+STRATEGY_STREAM = 5
+SEASON_STREAM = 6
+
+SeedLike = Union[int, np.random.SeedSequence, None]
+
+def seed_sequence(seed: SeedLike, *keys: int) -> np.random.SeedSequence:
+    """Get the SeedSequence at a key path below the root seed (same as repeated SeedSequence.spawn)."""
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return np.random.SeedSequence(root.entropy, spawn_key=tuple(root.spawn_key) + tuple(int(key) for key in keys))
+
+def generator(seed: SeedLike, *keys: int) -> np.random.Generator:
+    """Get an independent Generator for a key path, e.g. (NFL_DRAFT_STREAM, simulation)."""
+    return np.random.default_rng(seed_sequence(seed, *keys))
+
+def spawn_generators(seed: SeedLike, count: int, *keys: int) -> List[np.random.Generator]:
+    """Get one Generator per child index (simulation, team, ...) below a key path."""
+    return [generator(seed, *keys, index) for index in range(count)]
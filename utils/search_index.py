@@ -0,0 +1,92 @@
+import pandas as pd
+import numpy as np
+import streamlit as st
+from collections import defaultdict
+from typing import Sequence
+
+FUZZY_MIN_LENGTH = 5
+FUZZY_THRESHOLD = 0.5
+
+def _trigrams(text: str) -> set:
+    """Get the set of 3-character substrings of a string."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class SearchIndex:
+    """Lowercase trigram index plus sorted word/name prefixes for player name search."""
+    
+    def __init__(self, names: Sequence):
+        self.names = [str(name).lower() if pd.notna(name) else '' for name in names]
+        self.n_rows = len(self.names)
+        
+        # Trigram postings: trigram -> row ids containing it
+        postings = defaultdict(list)
+        for row, name in enumerate(self.names):
+            for trigram in _trigrams(name):
+                postings[trigram].append(row)
+        self.postings = {trigram: np.array(rows, dtype=np.int32) for trigram, rows in postings.items()}
+        
+        # Sorted prefix keys (full names and each word) for binary-search prefix lookups
+        keys, rows = [], []
+        for row, name in enumerate(self.names):
+            for key in {name, *name.split()}:
+                if key:
+                    keys.append(key)
+                    rows.append(row)
+        order = np.argsort(keys, kind='stable')
+        self.prefix_keys = np.array(keys, dtype=str)[order] if keys else np.array([], dtype=str)
+        self.prefix_rows = np.array(rows, dtype=np.int32)[order] if rows else np.array([], dtype=np.int32)
+    
+    def prefix(self, query: str) -> np.ndarray:
+        """Get rows whose full name or any word starts with the query."""
+        query = query.lower()
+        start = np.searchsorted(self.prefix_keys, query, side='left')
+        end = np.searchsorted(self.prefix_keys, query + '\uffff', side='right')
+        return np.unique(self.prefix_rows[start:end])
+    
+    def search(self, query: str, fuzzy: bool = True, threshold: float = FUZZY_THRESHOLD) -> np.ndarray:
+        """Get matching row ids: exact substring matches first, then typo-tolerant trigram matches."""
+        query = str(query).lower().strip()
+        if not query:
+            return np.arange(self.n_rows)
+        
+        # Too short for trigrams: word and name prefixes
+        if len(query) < 3:
+            return self.prefix(query)
+        
+        query_trigrams = list(_trigrams(query))
+        trigram_rows = [self.postings.get(trigram) for trigram in query_trigrams]
+        
+        # Exact substring matches must contain every query trigram
+        if all(rows is not None for rows in trigram_rows):
+            candidates = trigram_rows[0]
+            for rows in trigram_rows[1:]:
+                candidates = np.intersect1d(candidates, rows, assume_unique=True)
+            exact = np.array([row for row in candidates if query in self.names[row]], dtype=np.int32)
+        else:
+            exact = np.array([], dtype=np.int32)
+        
+        if not fuzzy or len(query) < FUZZY_MIN_LENGTH:
+            return exact
+        
+        # Fuzzy matches: share of query trigrams found in the name
+        present = [rows for rows in trigram_rows if rows is not None]
+        if not present:
+            return exact
+        hits = np.bincount(np.concatenate(present), minlength=self.n_rows)
+        scores = hits / len(query_trigrams)
+        scores[exact] = 0
+        
+        fuzzy_rows = np.flatnonzero(scores >= threshold)
+        fuzzy_rows = fuzzy_rows[np.argsort(-scores[fuzzy_rows], kind='stable')]
+        return np.concatenate([exact, fuzzy_rows]).astype(np.int32)
+    
+    def mask(self, query: str, fuzzy: bool = True) -> np.ndarray:
+        """Get a boolean row mask of search matches."""
+        selected = np.zeros(self.n_rows, dtype=bool)
+        selected[self.search(query, fuzzy)] = True
+        return selected
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def search_index(_data: pd.DataFrame, version: str, column: str) -> SearchIndex:
+    """Build and cache the search index over one name column for a data version."""
+    return SearchIndex(_data[column].tolist())
@@ -0,0 +1,133 @@
+import pandas as pd
+import numpy as np
+from typing import List, Optional, Sequence, Union
+from utils.ai_strategies import POSITIONS
+from utils.bye_weeks import roster_arrays
+from utils.lineup import LineupScorer
+
+REGULAR_SEASON_WEEKS = 14
+PLAYOFF_TEAMS = 4  # seeds 1v4 and 2v3 in the semifinal week, then the final
+PLAYOFF_BRACKETS = {0: 0, 2: 1, 4: 2}  # playoff teams -> playoff weeks
+GAMES_PER_SEASON = 17
+SEASON_CHUNK = 500
+
+# Week-to-week coefficient of variation of fantasy points by position
+WEEKLY_CV = {'QB': 0.35, 'RB': 0.55, 'WR': 0.6, 'TE': 0.65, 'K': 0.45, 'DEF': 0.7}
+
+def round_robin(n_teams: int, weeks: int) -> np.ndarray:
+    """Build a (weeks, teams) opponent table with the circle method, repeating rounds as needed (-1 for a bye)."""
+    slots = list(range(n_teams)) + ([-1] if n_teams % 2 else [])
+    rounds = []
+    for _ in range(len(slots) - 1):
+        opponents = np.full(n_teams, -1)
+        for i in range(len(slots) // 2):
+            home, away = slots[i], slots[-1 - i]
+            if home >= 0 and away >= 0:
+                opponents[home], opponents[away] = away, home
+        rounds.append(opponents)
+        slots = [slots[0], slots[-1]] + slots[1:-1]
+    return np.stack([rounds[week % len(rounds)] for week in range(weeks)])
+
+def weekly_means(roster: List[dict]) -> np.ndarray:
+    """Get each player's expected weekly points: projected Points per game, or VBD when the sheet has no points."""
+    points = np.array([float(p.get('Points', 0) or 0) for p in roster])
+    vbd = np.array([float(p.get('VBD_Value', 0) or 0) for p in roster])
+    return np.where(points > 0, points, np.maximum(vbd, 0)) / GAMES_PER_SEASON
+
+class SeasonSimulator:
+    """Monte Carlo seasons for drafted rosters: gamma-distributed weekly points, optimal lineups and a round-robin schedule."""
+    
+    def __init__(self, rosters: Sequence[List[dict]], team_names: Sequence[str], scorer: Optional[LineupScorer] = None,
+                 weeks: int = REGULAR_SEASON_WEEKS, playoff_teams: int = PLAYOFF_TEAMS):
+        self.team_names = list(team_names)
+        self.scorer = scorer or LineupScorer()
+        self.weeks = weeks
+        
+        # Use the largest bracket that fits both the requested size and the league (a 2-team final below four teams)
+        self.playoff_teams = max(size for size in PLAYOFF_BRACKETS if size <= min(playoff_teams, len(rosters)))
+        self.total_weeks = weeks + PLAYOFF_BRACKETS[self.playoff_teams]
+        self.schedule = round_robin(len(rosters), weeks)
+        
+        # Every rostered player in one array, tagged with the team that owns them
+        players = [player for roster in rosters for player in roster]
+        self.team_of = np.repeat(np.arange(len(rosters)), [len(roster) for roster in rosters])
+        self.codes, _, self.byes = roster_arrays(players)
+        self.means = weekly_means(players)
+        cv = np.array([WEEKLY_CV.get(POSITIONS[code], 0.6) if code >= 0 else 0.6 for code in self.codes])
+        
+        # Gamma with the projected mean and the position's CV: non-negative and right-skewed like real box scores
+        self.shape = 1.0 / cv ** 2
+        self.scale = np.maximum(self.means, 1e-9) * cv ** 2
+        self.on_bye = self.byes[None, :] == np.arange(1, self.total_weeks + 1)[:, None]
+    
+    def sample_points(self, seasons: int, rng: np.random.Generator) -> np.ndarray:
+        """Sample (seasons, weeks, players) fantasy points, -inf in bye weeks."""
+        points = rng.gamma(self.shape, self.scale, size=(seasons, self.total_weeks, len(self.means)))
+        points = np.where(self.means > 0, points, 0.0)
+        return np.where(self.on_bye, -np.inf, points)
+    
+    def team_scores(self, points: np.ndarray) -> np.ndarray:
+        """Score every team's optimal lineup each week: (seasons, weeks, teams)."""
+        return np.stack([
+            self.scorer.score(points[..., self.team_of == team], self.codes[self.team_of == team])[0]
+            for team in range(len(self.team_names))
+        ], axis=-1)
+    
+    def _play(self, scores: np.ndarray):
+        """Play the schedule and playoffs for a chunk of seasons; returns (wins, points for, playoff berths, titles)."""
+        seasons, _, n_teams = scores.shape
+        regular = scores[:, :self.weeks]
+        opponents = self.schedule[None, :, :]
+        has_game = opponents >= 0
+        opponent_scores = np.take_along_axis(regular, np.broadcast_to(np.maximum(opponents, 0), regular.shape), axis=2)
+        wins = (np.where(has_game, (regular > opponent_scores) + 0.5 * (regular == opponent_scores), 0)).sum(axis=1)
+        points_for = regular.sum(axis=1)
+        
+        berths = np.zeros((seasons, n_teams))
+        titles = np.zeros((seasons, n_teams))
+        if not self.playoff_teams:
+            return wins, points_for, berths, titles
+        
+        # Seed by wins, then points for
+        standings = np.lexsort((-points_for, -wins), axis=-1)
+        seeds = standings[:, :self.playoff_teams]
+        rows = np.arange(seasons)
+        berths[rows[:, None], seeds] = 1
+        
+        first, second = seeds[:, 0], seeds[:, 1]
+        if self.playoff_teams == 4:
+            semifinal = scores[:, self.weeks]
+            first = np.where(semifinal[rows, seeds[:, 0]] >= semifinal[rows, seeds[:, 3]], seeds[:, 0], seeds[:, 3])
+            second = np.where(semifinal[rows, seeds[:, 1]] >= semifinal[rows, seeds[:, 2]], seeds[:, 1], seeds[:, 2])
+        final = scores[:, -1]
+        champion = np.where(final[rows, first] >= final[rows, second], first, second)
+        titles[rows, champion] = 1
+        return wins, points_for, berths, titles
+    
+    def simulate(self, seasons: int = 2000, seed: Union[int, np.random.SeedSequence, None] = None,
+                 chunk_size: int = SEASON_CHUNK) -> pd.DataFrame:
+        """Simulate many seasons in chunks and summarize wins, points and playoff/title odds per team."""
+        rng = np.random.default_rng(seed)
+        n_teams = len(self.team_names)
+        totals = {name: np.zeros(n_teams) for name in ['wins', 'points_for', 'berths', 'titles', 'wins_sq']}
+        
+        done = 0
+        while done < seasons:
+            size = min(chunk_size, seasons - done)
+            wins, points_for, berths, titles = self._play(self.team_scores(self.sample_points(size, rng)))
+            totals['wins'] += wins.sum(axis=0)
+            totals['wins_sq'] += (wins ** 2).sum(axis=0)
+            totals['points_for'] += points_for.sum(axis=0)
+            totals['berths'] += berths.sum(axis=0)
+            totals['titles'] += titles.sum(axis=0)
+            done += size
+        
+        avg_wins = totals['wins'] / max(done, 1)
+        return pd.DataFrame({
+            'Team': self.team_names,
+            'Avg Wins': avg_wins,
+            'Wins Std': np.sqrt(np.maximum(totals['wins_sq'] / max(done, 1) - avg_wins ** 2, 0)),
+            'Avg Weekly Points': totals['points_for'] / max(done, 1) / self.weeks,
+            'Playoff %': 100 * totals['berths'] / max(done, 1),
+            'Title %': 100 * totals['titles'] / max(done, 1),
+        }).sort_values(['Playoff %', 'Avg Wins'], ascending=False).reset_index(drop=True)
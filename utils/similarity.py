@@ -0,0 +1,72 @@
+import pandas as pd
+import numpy as np
+import streamlit as st
+from sklearn.neighbors import BallTree, KDTree
+from typing import Optional, Sequence, Tuple
+
+KD_TREE_MAX_DIMS = 10
+
+class SimilarityIndex:
+    """Per-group standardized feature vectors with a nearest-neighbor tree for player comps."""
+    
+    def __init__(self, data: pd.DataFrame, features: Sequence[str], group_col: Optional[str] = None):
+        self.features = [feature for feature in features if feature in data.columns]
+        self.n_rows = len(data)
+        
+        values = data[self.features].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        if group_col and group_col in data.columns:
+            self.group_codes, self.groups = pd.factorize(data[group_col])
+        else:
+            self.group_codes, self.groups = np.zeros(self.n_rows, dtype=np.int64), pd.Index([None])
+        
+        # Row position within its group's tree (-1 when the row has no group)
+        self.local_rows = np.full(self.n_rows, -1, dtype=np.int64)
+        self.group_rows = {}
+        self.vectors = {}
+        self.trees = {}
+        
+        if not self.features:
+            return
+        
+        for code in range(len(self.groups)):
+            rows = np.flatnonzero(self.group_codes == code)
+            if len(rows) == 0:
+                continue
+            
+            # Z-scores within the group; missing values sit at the group mean
+            group_values = values[rows]
+            with np.errstate(invalid='ignore'):
+                mean = np.nanmean(group_values, axis=0)
+                std = np.nanstd(group_values, axis=0)
+            scale = np.where(std > 0, std, 1.0)
+            vectors = np.nan_to_num((group_values - np.nan_to_num(mean)) / scale)
+            
+            tree_class = KDTree if len(self.features) <= KD_TREE_MAX_DIMS else BallTree
+            self.local_rows[rows] = np.arange(len(rows))
+            self.group_rows[code] = rows
+            self.vectors[code] = vectors
+            self.trees[code] = tree_class(vectors)
+    
+    def neighbors(self, row: int, k: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the k nearest rows in the same group (excluding the row itself) and their distances."""
+        code = self.group_codes[row]
+        if code not in self.trees:
+            return np.array([], dtype=np.int64), np.array([], dtype=float)
+        
+        rows = self.group_rows[code]
+        n_query = min(k + 1, len(rows))
+        distances, local = self.trees[code].query(self.vectors[code][self.local_rows[row]][None, :], k=n_query)
+        
+        neighbor_rows = rows[local[0]]
+        keep = neighbor_rows != row
+        return neighbor_rows[keep][:k], distances[0][keep][:k]
+    
+    def similarity(self, distances: np.ndarray) -> np.ndarray:
+        """Convert feature-space distances to 0-100 similarity scores."""
+        return 100.0 / (1.0 + np.asarray(distances) / np.sqrt(max(len(self.features), 1)))
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def similarity_index(_data: pd.DataFrame, version: str, features: Tuple[str, ...],
+                     group_col: Optional[str] = None) -> SimilarityIndex:
+    """Build and cache the similarity index for one data version and feature set."""
+    return SimilarityIndex(_data, features, group_col)
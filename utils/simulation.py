@@ -0,0 +1,200 @@
+import pandas as pd
+import numpy as np
+from typing import Optional, Sequence
+
+ROUND_SAMPLE_SIZE = 2000
+CI_Z = 1.96
+BATCH_SIZE = 5
+MIN_RUNS = 10
+
+def mean_half_width(std: np.ndarray, n: np.ndarray, z: float = CI_Z) -> np.ndarray:
+    """Get the normal-approximation confidence interval half-width of sample means."""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(n > 1, z * np.asarray(std, dtype=float) / np.sqrt(n), np.inf)
+
+def proportion_half_width(p: np.ndarray, n: np.ndarray, z: float = CI_Z) -> np.ndarray:
+    """Get the normal-approximation confidence interval half-width of estimated probabilities."""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(n > 0, z * np.sqrt(np.asarray(p, dtype=float) * (1 - np.asarray(p, dtype=float)) / n), np.inf)
+
+class ConvergenceMonitor:
+    """Batch scheduler that stops a simulation run once every tracked confidence interval is tight enough."""
+    
+    def __init__(self, requested: int, tolerances: dict, batch_size: int = BATCH_SIZE, min_runs: int = MIN_RUNS):
+        self.requested = requested
+        self.tolerances = dict(tolerances)
+        self.batch_size = max(1, batch_size)
+        self.min_runs = min(min_runs, requested)
+        self.runs = 0
+        self.converged = False
+        self.history = []
+    
+    def next_batch(self) -> int:
+        """Get the size of the next batch (0 once converged or the requested runs are spent)."""
+        if self.converged:
+            return 0
+        return min(self.batch_size, self.requested - self.runs)
+    
+    def update(self, runs: int, half_widths: dict) -> bool:
+        """Record the largest half-width per tracked statistic after a batch and check for convergence."""
+        self.runs = runs
+        self.history.append({'runs': runs, **half_widths})
+        self.converged = runs >= self.min_runs and all(
+            half_widths.get(name, np.inf) <= tolerance for name, tolerance in self.tolerances.items()
+        )
+        return self.converged
+    
+    @property
+    def stopped_early(self) -> bool:
+        """Check whether convergence saved part of the requested runs."""
+        return self.converged and self.runs < self.requested
+    
+    def report(self) -> str:
+        """Describe runs used against runs requested."""
+        status = "converged" if self.converged else "tolerance not reached"
+        widths = ", ".join(f"{name} ±{value:.2f}" for name, value in self.history[-1].items() if name != 'runs') if self.history else ""
+        return (f"{self.runs:,} of {self.requested:,} simulations used ({self.runs / max(self.requested, 1):.0%}, {status})"
+                + (f"; largest CI half-width: {widths}" if widths else ""))
+
+class ADPAggregator:
+    """Streaming per-player draft position statistics (Welford mean/variance) over many simulations."""
+    
+    def __init__(self, players: Sequence[str], grades: Sequence[float], num_rounds: int,
+                 position_groups: Optional[Sequence[str]] = None, sample_size: int = ROUND_SAMPLE_SIZE,
+                 rng: Optional[np.random.Generator] = None):
+        self.players = pd.Index(players)
+        self.grades = np.asarray(grades, dtype=float)
+        self.num_rounds = num_rounds
+        self.sample_size = sample_size
+        self.rng = rng if rng is not None else np.random.default_rng()
+        
+        n_players = len(self.players)
+        self.counts = np.zeros(n_players, dtype=np.int64)
+        self.mean_pick = np.zeros(n_players)
+        self.m2_pick = np.zeros(n_players)
+        self.round_counts = np.zeros((n_players, num_rounds), dtype=np.int64)
+        
+        groups = pd.Series(position_groups if position_groups is not None else ['Unknown'] * n_players).fillna('Unknown')
+        self.group_codes, self.group_names = pd.factorize(groups)
+        self.group_counts = np.zeros(len(self.group_names), dtype=np.int64)
+        
+        self.simulations = 0
+        self.total_picks = 0
+        self.grade_sum = 0.0
+        
+        # Per-round average grade of each simulation, kept as a bounded reservoir sample
+        self.round_samples = [[] for _ in range(num_rounds)]
+        self.round_seen = np.zeros(num_rounds, dtype=np.int64)
+    
+    def add(self, results: pd.DataFrame):
+        """Fold one simulated draft (one row per pick) into the running statistics."""
+        self.simulations += 1
+        if results.empty:
+            return
+        
+        ids = self.players.get_indexer(results['player'])
+        known = ids >= 0
+        ids = ids[known]
+        picks = results['overall'].to_numpy(dtype=float)[known]
+        rounds = results['round'].to_numpy(dtype=np.int64)[known] - 1
+        
+        # Each player is drafted at most once per simulation, so a single vectorized Welford step suffices
+        self.counts[ids] += 1
+        delta = picks - self.mean_pick[ids]
+        self.mean_pick[ids] += delta / self.counts[ids]
+        self.m2_pick[ids] += delta * (picks - self.mean_pick[ids])
+        
+        np.add.at(self.round_counts, (ids, rounds), 1)
+        np.add.at(self.group_counts, self.group_codes[ids], 1)
+        self.total_picks += len(ids)
+        self.grade_sum += self.grades[ids].sum()
+        
+        round_totals = np.bincount(rounds, weights=self.grades[ids], minlength=self.num_rounds)
+        round_picks = np.bincount(rounds, minlength=self.num_rounds)
+        for round_index in np.flatnonzero(round_picks):
+            self._sample_round(round_index, round_totals[round_index] / round_picks[round_index])
+    
+    def _sample_round(self, round_index: int, value: float):
+        """Reservoir-sample one simulation's average grade for a round."""
+        seen = self.round_seen[round_index]
+        sample = self.round_samples[round_index]
+        if seen < self.sample_size:
+            sample.append(value)
+        else:
+            slot = self.rng.integers(0, seen + 1)
+            if slot < self.sample_size:
+                sample[slot] = value
+        self.round_seen[round_index] += 1
+    
+    @property
+    def avg_grade(self) -> float:
+        """Get the average grade over every simulated pick."""
+        return self.grade_sum / self.total_picks if self.total_picks else np.nan
+    
+    @property
+    def unique_players(self) -> int:
+        """Get the number of distinct players drafted in any simulation."""
+        return int((self.counts > 0).sum())
+    
+    def std_pick(self) -> np.ndarray:
+        """Get each player's sample standard deviation of draft position (NaN below two drafts)."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.counts > 1, np.sqrt(self.m2_pick / (self.counts - 1)), np.nan)
+    
+    def adp_half_width(self, min_share: float = 0.2) -> float:
+        """Get the largest ADP confidence half-width (in picks) among players shown in the ADP table."""
+        tracked = (self.counts >= max(2, self.simulations * min_share))
+        if not tracked.any():
+            return np.inf
+        return float(mean_half_width(self.std_pick()[tracked], self.counts[tracked]).max())
+    
+    def availability_half_width(self) -> float:
+        """Get the largest confidence half-width of any player's probability of being drafted."""
+        if self.simulations == 0:
+            return np.inf
+        share = self.counts / self.simulations
+        return float(proportion_half_width(share, self.simulations).max())
+    
+    def adp_table(self, min_share: float = 0.2, top: int = 30) -> pd.DataFrame:
+        """Build the ADP table for players drafted in at least min_share of simulations."""
+        keep = (self.counts >= max(1, self.simulations * min_share)) & (self.counts > 0)
+        table = pd.DataFrame({
+            'Avg Pick': self.mean_pick[keep],
+            'Std Dev': self.std_pick()[keep],
+            'Times Drafted': self.counts[keep],
+            'Grade': self.grades[keep]
+        }, index=pd.Index(self.players[keep], name='player')).round(2)
+        return table.sort_values('Avg Pick').head(top)
+    
+    def frequency(self, top: int = 20) -> pd.Series:
+        """Get the most frequently drafted players and their draft counts."""
+        order = np.argsort(-self.counts, kind='stable')[:top]
+        order = order[self.counts[order] > 0]
+        return pd.Series(self.counts[order], index=self.players[order])
+    
+    def position_mix(self) -> pd.Series:
+        """Get draft counts per position group."""
+        mix = pd.Series(self.group_counts, index=self.group_names)
+        return mix[mix > 0].sort_values(ascending=False)
+    
+    def summary(self, min_share: float = 0.2, top_adp: int = 30, top_frequency: int = 20) -> dict:
+        """Collect every displayed output as DataFrames (storable as Parquet)."""
+        return {
+            'metrics': pd.DataFrame([{
+                'simulations': self.simulations,
+                'total_picks': self.total_picks,
+                'avg_grade': self.avg_grade,
+                'unique_players': self.unique_players
+            }]),
+            'adp': self.adp_table(min_share, top_adp),
+            'frequency': self.frequency(top_frequency).rename('Times Drafted').rename_axis('player').to_frame(),
+            'position_mix': self.position_mix().rename('count').rename_axis('position_group').to_frame(),
+            'round_grades': self.round_grades()
+        }
+    
+    def round_grades(self) -> pd.DataFrame:
+        """Get the sampled per-simulation average grade of each round in long format."""
+        return pd.DataFrame({
+            'round': np.concatenate([np.full(len(sample), i + 1) for i, sample in enumerate(self.round_samples)]),
+            'grade': np.concatenate([np.asarray(sample, dtype=float) for sample in self.round_samples])
+        })
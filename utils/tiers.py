@@ -0,0 +1,135 @@
+import pandas as pd
+import numpy as np
+import streamlit as st
+from typing import Optional
+
+# Tier names from lowest to highest, with the grade badge class for each
+TIER_NAMES = ['Late Round/UDFA', 'Developmental Prospects', 'Solid Prospects', 'High-Quality Prospects', 'Elite Prospects']
+BADGE_CLASSES = np.array(['low', 'low', 'medium', 'high', 'elite'])
+FIXED_BREAKS = np.array([5.5, 6.5, 7.5, 8.5])
+TIER_METHODS = ['Fixed Thresholds', 'Natural Breaks', 'K-Means']
+JENKS_MAX_VALUES = 512
+
+def jenks_breaks(values: np.ndarray, n_classes: int) -> np.ndarray:
+    """Find Jenks natural-break boundaries (minimum within-class squared error) for 1-D values."""
+    values = np.sort(values[~np.isnan(values)])
+    if len(values) > JENKS_MAX_VALUES:
+        values = np.quantile(values, np.linspace(0, 1, JENKS_MAX_VALUES))
+    n = len(values)
+    
+    # Prefix sums give the squared error of any run values[i:j] in O(1)
+    sums = np.concatenate([[0.0], np.cumsum(values)])
+    squares = np.concatenate([[0.0], np.cumsum(values ** 2)])
+    
+    def run_cost(starts: np.ndarray, end: int) -> np.ndarray:
+        counts = end - starts
+        total = sums[end] - sums[starts]
+        return squares[end] - squares[starts] - total ** 2 / counts
+    
+    cost = np.full((n_classes, n + 1), np.inf)
+    split = np.zeros((n_classes, n + 1), dtype=np.int64)
+    cost[0, 1:] = run_cost(np.zeros(n, dtype=np.int64), np.arange(1, n + 1))
+    
+    for c in range(1, n_classes):
+        for end in range(c + 1, n + 1):
+            starts = np.arange(c, end)
+            candidates = cost[c - 1, starts] + run_cost(starts, end)
+            best = int(np.argmin(candidates))
+            cost[c, end] = candidates[best]
+            split[c, end] = starts[best]
+    
+    # Walk the split points back from the last class
+    starts, end = [], n
+    for c in range(n_classes - 1, 0, -1):
+        end = split[c, end]
+        starts.append(end)
+    starts = np.array(starts[::-1])
+    return (values[starts - 1] + values[starts]) / 2
+
+def kmeans_breaks(values: np.ndarray, n_classes: int, max_iter: int = 100) -> np.ndarray:
+    """Find boundaries between 1-D k-means clusters (midpoints between sorted centers)."""
+    values = np.sort(values[~np.isnan(values)])
+    centers = np.quantile(values, (np.arange(n_classes) + 0.5) / n_classes)
+    
+    for _ in range(max_iter):
+        breaks = (centers[1:] + centers[:-1]) / 2
+        labels = np.searchsorted(breaks, values, side='right')
+        counts = np.bincount(labels, minlength=n_classes)
+        totals = np.bincount(labels, weights=values, minlength=n_classes)
+        new_centers = np.where(counts > 0, totals / np.maximum(counts, 1), centers)
+        if np.allclose(new_centers, centers):
+            break
+        centers = np.sort(new_centers)
+    
+    return (centers[1:] + centers[:-1]) / 2
+
+def tier_labels(breaks: np.ndarray) -> list:
+    """Build tier display labels (lowest tier first) with their grade ranges."""
+    labels = [f"{TIER_NAMES[0]} (<{breaks[0]:.1f})"]
+    for name, low, high in zip(TIER_NAMES[1:-1], breaks[:-1], breaks[1:]):
+        labels.append(f"{name} ({low:.1f}-{high - 0.1:.1f})")
+    labels.append(f"{TIER_NAMES[-1]} ({breaks[-1]:.1f}+)")
+    return labels
+
+class ProspectTiers:
+    """Grade tier boundaries, a per-row tier column and tier summaries for one prospect class."""
+    
+    def __init__(self, data: pd.DataFrame, method: str = 'Fixed Thresholds'):
+        self.data = data
+        self.grades = pd.to_numeric(data['grade'], errors='coerce').to_numpy(dtype=float)
+        self.breaks = self._find_breaks(method)
+        self.labels = tier_labels(self.breaks)
+        
+        # Tier code per row (-1 for missing grades)
+        self.codes = np.where(np.isnan(self.grades), -1, np.searchsorted(self.breaks, self.grades, side='right'))
+        self.tier = pd.Categorical.from_codes(self.codes, categories=self.labels, ordered=True)
+        self.summary = self.summarize()
+    
+    def _find_breaks(self, method: str) -> np.ndarray:
+        """Compute tier boundaries, falling back to fixed thresholds for degenerate grade sets."""
+        present = self.grades[~np.isnan(self.grades)]
+        if method == 'Fixed Thresholds' or np.unique(present).size < len(TIER_NAMES):
+            return FIXED_BREAKS
+        breaks = jenks_breaks(present, len(TIER_NAMES)) if method == 'Natural Breaks' else kmeans_breaks(present, len(TIER_NAMES))
+        
+        # Grades are on a 0.1 scale, so round the fitted breaks to keep tier labels exact
+        breaks = np.unique(np.round(breaks, 1))
+        return breaks if len(breaks) == len(FIXED_BREAKS) else FIXED_BREAKS
+    
+    def badge_classes(self, grades) -> np.ndarray:
+        """Look up the badge class for each grade (missing grades get the lowest class)."""
+        grades = np.asarray(grades, dtype=float)
+        codes = np.searchsorted(self.breaks, grades, side='right')
+        return np.where(np.isnan(grades), BADGE_CLASSES[0], BADGE_CLASSES[np.minimum(codes, len(BADGE_CLASSES) - 1)])
+    
+    def summarize(self, positions: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """Summarize each non-empty tier (best tier first) for all rows or a subset of row positions."""
+        positions = np.arange(len(self.data)) if positions is None else positions
+        frame = pd.DataFrame({
+            'tier': self.codes[positions],
+            'grade': self.grades[positions]
+        })
+        frame = frame[frame['tier'] >= 0]
+        
+        summary = frame.groupby('tier')['grade'].agg(['count', 'mean', 'min', 'max'])
+        for column, label in [('position_group', 'top_position'), ('college', 'top_college')]:
+            if column in self.data.columns:
+                values = self.data[column].to_numpy()[positions][frame.index]
+                counts = pd.Series(values).groupby(frame['tier'].to_numpy()).value_counts()
+                summary[label] = counts.groupby(level=0).idxmax().str[1]
+        
+        summary = summary.sort_index(ascending=False)
+        summary.index = [self.labels[code] for code in summary.index]
+        return summary
+    
+    def top_players(self, positions: np.ndarray, n: int = 10) -> dict:
+        """Get the n best-graded players of each tier (keyed by label) among the given row positions."""
+        order = positions[np.argsort(-self.grades[positions], kind='stable')]
+        codes = self.codes[order]
+        keep = (pd.Series(codes).groupby(codes).cumcount().to_numpy() < n) & (codes >= 0)
+        return {self.labels[code]: self.data.iloc[order[keep & (codes == code)]] for code in np.unique(codes[keep])}
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def prospect_tiers(_data: pd.DataFrame, version: str, method: str = 'Fixed Thresholds') -> ProspectTiers:
+    """Build and cache prospect tiers for one data version and boundary method."""
+    return ProspectTiers(_data, method)
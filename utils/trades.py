@@ -0,0 +1,149 @@
+import pandas as pd
+import numpy as np
+from collections import OrderedDict
+from itertools import combinations
+from typing import Dict, List, Optional, Sequence
+from utils.ai_strategies import POSITIONS, position_codes
+from utils.lineup import LineupScorer
+
+TRADE_SHAPES = [(1, 1), (2, 1), (1, 2)]  # (players the user gives, players the user gets)
+MAX_GIVE = max(max(shape) for shape in TRADE_SHAPES)  # most players either side gives up
+
+class RosterValuation:
+    """A roster's cached best-first position lists, player ranks within them and optimal lineup value."""
+    
+    def __init__(self, roster: List[dict], scorer: LineupScorer, value_key: str = 'VBD_Value'):
+        self.roster = roster
+        self.names = [p.get('Player_Name', '') for p in roster]
+        self.codes = position_codes([p.get('Position') for p in roster])
+        
+        # Below-replacement players count as replacement (0), as empty slots do
+        self.values = np.maximum(np.array([float(p.get(value_key, 0) or 0) for p in roster], dtype=float), 0)
+        
+        # Lists run MAX_GIVE deeper than a lineup needs, so players promoted by a trade are already in them
+        self.depth = scorer.depth + MAX_GIVE
+        self.lists = scorer.position_lists(self.values, self.codes, self.depth)
+        self.value = float(scorer.lists_value(self.lists))
+        
+        self.ranks = np.zeros(len(roster), dtype=np.int64)
+        for code in range(len(POSITIONS)):
+            rows = np.flatnonzero(self.codes == code)
+            self.ranks[rows[np.argsort(-self.values[rows], kind='stable')]] = np.arange(len(rows))
+    
+    def without(self, combos: np.ndarray) -> np.ndarray:
+        """Get the lists after removing each combo of roster rows (combos, players per combo), touching only their positions."""
+        lists = np.repeat(self.lists[None], len(combos), axis=0)
+        
+        # Remove deeper ranks first, so a second removal at the same position still finds its rank
+        order = np.argsort(-self.ranks[combos], axis=1, kind='stable')
+        combos = np.take_along_axis(combos, order, axis=1)
+        columns = np.arange(self.depth)[None, :]
+        for step in range(combos.shape[1]):
+            rows = np.flatnonzero(self.codes[combos[:, step]] >= 0)
+            codes = self.codes[combos[rows, step]]
+            source = columns + (columns >= self.ranks[combos[rows, step]][:, None])
+            shifted = np.take_along_axis(lists[rows, codes], np.minimum(source, self.depth - 1), axis=1)
+            lists[rows, codes] = np.where(source < self.depth, shifted, -np.inf)
+        return lists
+
+def insert_players(lists: np.ndarray, codes: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Insert one player per row into that row's position list (rows are the leading axis)."""
+    rows = np.flatnonzero(codes >= 0)
+    merged = np.concatenate([lists[rows, codes[rows]], values[rows, None]], axis=1)
+    lists[rows, codes[rows]] = -np.sort(-merged, axis=1)[:, :lists.shape[-1]]
+    return lists
+
+class TradeEvaluator:
+    """Scores 1-for-1 and 2-for-1 trades by the change in both teams' optimal lineup value."""
+    
+    def __init__(self, scorer: Optional[LineupScorer] = None, max_entries: int = 64):
+        self.scorer = scorer or LineupScorer()
+        self.max_entries = max_entries
+        self._valuations = OrderedDict()
+    
+    def valuation(self, roster: List[dict]) -> RosterValuation:
+        """Get the cached valuation of a roster."""
+        key = tuple((p.get('Player_Name'), p.get('Position'), p.get('VBD_Value')) for p in roster)
+        if key in self._valuations:
+            self._valuations.move_to_end(key)
+            return self._valuations[key]
+        
+        valuation = RosterValuation(roster, self.scorer)
+        self._valuations[key] = valuation
+        while len(self._valuations) > self.max_entries:
+            self._valuations.popitem(last=False)
+        return valuation
+    
+    def _after_trade(self, side: RosterValuation, gives: np.ndarray, other: RosterValuation, gets: np.ndarray,
+                     trade_gives: np.ndarray, trade_gets: np.ndarray) -> np.ndarray:
+        """Lineup values of one side after each trade: removal lists once per give combo, then incremental inserts."""
+        lists = side.without(gives)[trade_gives]
+        for slot in range(gets.shape[1]):
+            received = gets[trade_gets, slot]
+            lists = insert_players(lists, other.codes[received], other.values[received])
+        return self.scorer.lists_value(lists)
+    
+    def evaluate(self, user_roster: List[dict], partner_roster: List[dict],
+                 shapes: Sequence = TRADE_SHAPES) -> pd.DataFrame:
+        """Score every trade of the given shapes between two rosters."""
+        user = self.valuation(user_roster)
+        partner = self.valuation(partner_roster)
+        frames = []
+        for give_count, get_count in shapes:
+            gives = np.array(list(combinations(range(len(user.roster)), give_count)), dtype=np.int64)
+            gets = np.array(list(combinations(range(len(partner.roster)), get_count)), dtype=np.int64)
+            if len(gives) == 0 or len(gets) == 0:
+                continue
+            
+            trade_gives = np.repeat(np.arange(len(gives)), len(gets))
+            trade_gets = np.tile(np.arange(len(gets)), len(gives))
+            user_after = self._after_trade(user, gives, partner, gets, trade_gives, trade_gets)
+            partner_after = self._after_trade(partner, gets, user, gives, trade_gets, trade_gives)
+            frames.append(pd.DataFrame({
+                'You Give': [' + '.join(user.names[i] for i in gives[g]) for g in trade_gives],
+                'You Get': [' + '.join(partner.names[i] for i in gets[g]) for g in trade_gets],
+                'Your Gain': user_after - user.value,
+                'Their Gain': partner_after - partner.value,
+            }))
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(
+            columns=['You Give', 'You Get', 'Your Gain', 'Their Gain']
+        )
+    
+    def mutual_trades(self, user_roster: List[dict], partners: Dict[str, List[dict]], min_gain: float = 0.5,
+                      top: int = 10) -> pd.DataFrame:
+        """Rank trades that raise both lineups by at least min_gain, most balanced (largest smaller gain) first."""
+        frames = []
+        for partner_name, partner_roster in partners.items():
+            trades = self.evaluate(user_roster, partner_roster)
+            trades = trades[(trades['Your Gain'] >= min_gain) & (trades['Their Gain'] >= min_gain)]
+            if not trades.empty:
+                frames.append(trades.assign(Partner=partner_name))
+        if not frames:
+            return pd.DataFrame(columns=['Partner', 'You Give', 'You Get', 'Your Gain', 'Their Gain'])
+        
+        trades = pd.concat(frames, ignore_index=True)
+        trades['Balance'] = trades[['Your Gain', 'Their Gain']].min(axis=1)
+        trades['Players'] = trades['You Give'].str.count(r' \+ ') + trades['You Get'].str.count(r' \+ ')
+        trades = trades.sort_values(['Balance', 'Your Gain', 'Players'], ascending=[False, False, True])
+        
+        # A throw-in that changes neither lineup only repeats a smaller deal with the same partner and gains,
+        # so drop supersets of such deals; distinct deals that happen to tie on gains all stay
+        gains = trades[['Your Gain', 'Their Gain']].round(6)
+        sides = [
+            (frozenset(give.split(' + ')), frozenset(get.split(' + ')))
+            for give, get in zip(trades['You Give'], trades['You Get'])
+        ]
+        groups = {}
+        for row, key in enumerate(zip(trades['Partner'], gains['Your Gain'], gains['Their Gain'])):
+            groups.setdefault(key, []).append(row)
+        repeats = np.zeros(len(trades), dtype=bool)
+        for rows in groups.values():
+            for row in rows:
+                give, get = sides[row]
+                repeats[row] = any(
+                    sides[other] != sides[row] and sides[other][0] <= give and sides[other][1] <= get for other in rows
+                )
+        trades = trades[~repeats].head(top)
+        return trades[['Partner', 'You Give', 'You Get', 'Your Gain', 'Their Gain']].reset_index(drop=True)
+
+trade_evaluator = TradeEvaluator()
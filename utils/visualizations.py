@@ -6,14 +6,21 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import seaborn as sns
 from scipy import stats
+from typing import Optional
+from utils.correlation import cached_correlation, strong_pairs
+from utils.data_version import data_version
+from utils.figure_cache import figure_cache
+from utils.percentiles import percentile_table
+from utils.plot_sampling import DOWNSAMPLE_METHODS, MAX_SCATTER_POINTS, render_scatter
 import warnings
 warnings.filterwarnings('ignore')
 
 class Visualizations:
     """Advanced visualizations for NFL Draft analysis."""
     
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, version: Optional[str] = None):
         self.data = data
+        self.data_version = version or data_version(data)
         self.colors = {
             'primary': '#FF6B35',
             'secondary': '#4ECDC4',
@@ -61,42 +68,48 @@ class Visualizations:
         with row1_col1:
             # Grade distribution
             if 'grade' in self.data.columns:
-                fig_hist = px.histogram(
-                    self.data,
-                    x='grade',
-                    nbins=20,
-                    title="Grade Distribution",
-                    color_discrete_sequence=[self.colors['primary']]
-                )
-                
-                fig_hist.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white'),
-                    xaxis_title="Grade",
-                    yaxis_title="Frequency"
-                )
+                def build_fig_hist():
+                    fig_hist = px.histogram(
+                        self.data,
+                        x='grade',
+                        nbins=20,
+                        title="Grade Distribution",
+                        color_discrete_sequence=[self.colors['primary']]
+                    )
+                    
+                    fig_hist.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white'),
+                        xaxis_title="Grade",
+                        yaxis_title="Frequency"
+                    )
+                    return fig_hist
                 
+                fig_hist = figure_cache.figure('overview_grade_histogram', self.data_version, None, build_fig_hist)
                 st.plotly_chart(fig_hist, width='stretch')
         
         with row1_col2:
             # Position distribution
             if 'position_group' in self.data.columns:
-                pos_counts = self.data['position_group'].value_counts()
-                
-                fig_pie = px.pie(
-                    values=pos_counts.values,
-                    names=pos_counts.index,
-                    title="Position Group Distribution",
-                    color_discrete_sequence=px.colors.qualitative.Set3
-                )
-                
-                fig_pie.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white')
-                )
+                def build_fig_pie():
+                    pos_counts = self.data['position_group'].value_counts()
+                    
+                    fig_pie = px.pie(
+                        values=pos_counts.values,
+                        names=pos_counts.index,
+                        title="Position Group Distribution",
+                        color_discrete_sequence=px.colors.qualitative.Set3
+                    )
+                    
+                    fig_pie.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white')
+                    )
+                    return fig_pie
                 
+                fig_pie = figure_cache.figure('overview_position_groups', self.data_version, None, build_fig_pie)
                 st.plotly_chart(fig_pie, width='stretch')
         
         # Second row
@@ -105,48 +118,55 @@ class Visualizations:
         with row2_col1:
             # Top colleges
             if 'college' in self.data.columns:
-                top_colleges = self.data['college'].value_counts().head(10)
-                
-                fig_college = px.bar(
-                    x=top_colleges.values,
-                    y=top_colleges.index,
-                    orientation='h',
-                    title="Top 10 Colleges by Player Count",
-                    color=top_colleges.values,
-                    color_continuous_scale='Viridis'
-                )
-                
-                fig_college.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white'),
-                    xaxis_title="Number of Players",
-                    yaxis_title="College"
-                )
+                def build_fig_college():
+                    top_colleges = self.data['college'].value_counts().head(10)
+                    
+                    fig_college = px.bar(
+                        x=top_colleges.values,
+                        y=top_colleges.index,
+                        orientation='h',
+                        title="Top 10 Colleges by Player Count",
+                        color=top_colleges.values,
+                        color_continuous_scale='Viridis'
+                    )
+                    
+                    fig_college.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white'),
+                        xaxis_title="Number of Players",
+                        yaxis_title="College"
+                    )
+                    return fig_college
                 
+                fig_college = figure_cache.figure('overview_top_colleges', self.data_version, None, build_fig_college)
                 st.plotly_chart(fig_college, width='stretch')
         
         with row2_col2:
             # Physical attributes scatter
             if 'height_inches' in self.data.columns and 'weight' in self.data.columns:
-                fig_physical = px.scatter(
+                downsample_method = 'Grid'
+                if len(self.data) > MAX_SCATTER_POINTS:
+                    downsample_method = st.selectbox("Downsampling", DOWNSAMPLE_METHODS, key="overview_downsampling")
+                
+                render_scatter(
                     self.data,
                     x='height_inches',
                     y='weight',
+                    key="overview_physical_scatter",
+                    layout=dict(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white'),
+                        xaxis_title="Height (inches)",
+                        yaxis_title="Weight (lbs)"
+                    ),
+                    method=downsample_method,
+                    version=self.data_version,
                     color='position_group' if 'position_group' in self.data.columns else None,
                     title="Physical Attributes: Height vs Weight",
                     hover_data=['name'] if 'name' in self.data.columns else None
                 )
-                
-                fig_physical.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white'),
-                    xaxis_title="Height (inches)",
-                    yaxis_title="Weight (lbs)"
-                )
-                
-                st.plotly_chart(fig_physical, width='stretch')
     
     def render_position_analysis(self):
         """Render position-specific analysis."""
@@ -195,52 +215,58 @@ class Visualizations:
         with row1_col1:
             # Grade distribution for position
             if 'grade' in position_data.columns:
-                fig_grade = px.histogram(
-                    position_data,
-                    x='grade',
-                    nbins=15,
-                    title=f"Grade Distribution - {selected_position}",
-                    color_discrete_sequence=[self.colors['secondary']]
-                )
-                
-                # Add vertical line for position average
-                avg_grade = position_data['grade'].mean()
-                fig_grade.add_vline(
-                    x=avg_grade,
-                    line_dash="dash",
-                    line_color="white",
-                    annotation_text=f"Avg: {avg_grade:.1f}"
-                )
-                
-                fig_grade.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white')
-                )
+                def build_fig_grade():
+                    fig_grade = px.histogram(
+                        position_data,
+                        x='grade',
+                        nbins=15,
+                        title=f"Grade Distribution - {selected_position}",
+                        color_discrete_sequence=[self.colors['secondary']]
+                    )
+                    
+                    # Add vertical line for position average
+                    avg_grade = position_data['grade'].mean()
+                    fig_grade.add_vline(
+                        x=avg_grade,
+                        line_dash="dash",
+                        line_color="white",
+                        annotation_text=f"Avg: {avg_grade:.1f}"
+                    )
+                    
+                    fig_grade.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white')
+                    )
+                    return fig_grade
                 
+                fig_grade = figure_cache.figure('position_grade_histogram', self.data_version, selected_position, build_fig_grade)
                 st.plotly_chart(fig_grade, width='stretch')
         
         with row1_col2:
             # Top colleges for this position
             if 'college' in position_data.columns:
-                top_colleges = position_data['college'].value_counts().head(8)
-                
-                fig_college = px.bar(
-                    x=top_colleges.index,
-                    y=top_colleges.values,
-                    title=f"Top Colleges - {selected_position}",
-                    color=top_colleges.values,
-                    color_continuous_scale='Plasma'
-                )
-                
-                fig_college.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white'),
-                    xaxis_title="College",
-                    yaxis_title="Number of Players"
-                )
+                def build_fig_college():
+                    top_colleges = position_data['college'].value_counts().head(8)
+                    
+                    fig_college = px.bar(
+                        x=top_colleges.index,
+                        y=top_colleges.values,
+                        title=f"Top Colleges - {selected_position}",
+                        color=top_colleges.values,
+                        color_continuous_scale='Plasma'
+                    )
+                    
+                    fig_college.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white'),
+                        xaxis_title="College",
+                        yaxis_title="Number of Players"
+                    )
+                    return fig_college
                 
+                fig_college = figure_cache.figure('position_top_colleges', self.data_version, selected_position, build_fig_college)
                 st.plotly_chart(fig_college, width='stretch')
         
         # Combine metrics analysis
@@ -251,34 +277,37 @@ class Visualizations:
             st.markdown("#### 🏃‍♂️ Combine Performance Analysis")
             
             # Box plots for combine metrics
-            fig_combine = make_subplots(
-                rows=2, cols=3,
-                subplot_titles=[col.replace('_', ' ').title() for col in available_combine[:6]]
-            )
-            
-            for i, col in enumerate(available_combine[:6]):
-                row = (i // 3) + 1
-                col_pos = (i % 3) + 1
+            def build_fig_combine():
+                fig_combine = make_subplots(
+                    rows=2, cols=3,
+                    subplot_titles=[col.replace('_', ' ').title() for col in available_combine[:6]]
+                )
                 
-                fig_combine.add_trace(
-                    go.Box(
-                        y=position_data[col].dropna(),
-                        name=col.replace('_', ' ').title(),
-                        boxpoints='outliers',
-                        marker_color=self.colors['accent']
-                    ),
-                    row=row, col=col_pos
+                for i, col in enumerate(available_combine[:6]):
+                    row = (i // 3) + 1
+                    col_pos = (i % 3) + 1
+                
+                    fig_combine.add_trace(
+                        go.Box(
+                            y=position_data[col].dropna(),
+                            name=col.replace('_', ' ').title(),
+                            boxpoints='outliers',
+                            marker_color=self.colors['accent']
+                        ),
+                        row=row, col=col_pos
+                    )
+                
+                fig_combine.update_layout(
+                    title=f"Combine Metrics Distribution - {selected_position}",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white'),
+                    showlegend=False,
+                    height=600
                 )
+                return fig_combine
             
-            fig_combine.update_layout(
-                title=f"Combine Metrics Distribution - {selected_position}",
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white'),
-                showlegend=False,
-                height=600
-            )
-            
+            fig_combine = figure_cache.figure('position_combine_boxes', self.data_version, selected_position, build_fig_combine)
             st.plotly_chart(fig_combine, width='stretch')
         
         # Top performers table
@@ -320,10 +349,13 @@ class Visualizations:
             st.warning("Please select at least one combine metric.")
             return
         
+        # Percentile and summary table, built once per data version
+        table = percentile_table(self.data, self.data_version, 'position_group')
+        
         # Summary statistics
         st.markdown("#### 📊 Summary Statistics")
         
-        summary_stats = self.data[selected_metrics].describe().round(3)
+        summary_stats = pd.DataFrame({metric: table.stats(metric) for metric in selected_metrics}).round(3)
         st.dataframe(summary_stats, width='stretch')
         
         # Distribution plots
@@ -342,30 +374,33 @@ class Visualizations:
                     metric = selected_metrics[metric_idx]
                     
                     with columns[col_idx]:
-                        fig_dist = px.histogram(
-                            self.data,
-                            x=metric,
-                            nbins=20,
-                            title=f"{metric.replace('_', ' ').title()} Distribution",
-                            color_discrete_sequence=[self.colors['accent']]
-                        )
-                        
-                        # Add mean line
-                        mean_val = self.data[metric].mean()
-                        fig_dist.add_vline(
-                            x=mean_val,
-                            line_dash="dash",
-                            line_color="white",
-                            annotation_text=f"Mean: {mean_val:.2f}"
-                        )
-                        
-                        fig_dist.update_layout(
-                            plot_bgcolor='rgba(0,0,0,0)',
-                            paper_bgcolor='rgba(0,0,0,0)',
-                            font=dict(color='white'),
-                            height=400
-                        )
+                        def build_fig_dist():
+                            fig_dist = px.histogram(
+                                self.data,
+                                x=metric,
+                                nbins=20,
+                                title=f"{metric.replace('_', ' ').title()} Distribution",
+                                color_discrete_sequence=[self.colors['accent']]
+                            )
+                            
+                            # Add mean line
+                            mean_val = table.stats(metric)['mean']
+                            fig_dist.add_vline(
+                                x=mean_val,
+                                line_dash="dash",
+                                line_color="white",
+                                annotation_text=f"Mean: {mean_val:.2f}"
+                            )
+                            
+                            fig_dist.update_layout(
+                                plot_bgcolor='rgba(0,0,0,0)',
+                                paper_bgcolor='rgba(0,0,0,0)',
+                                font=dict(color='white'),
+                                height=400
+                            )
+                            return fig_dist
                         
+                        fig_dist = figure_cache.figure('combine_metric_distribution', self.data_version, metric, build_fig_dist)
                         st.plotly_chart(fig_dist, width='stretch')
         
         # Position comparison
@@ -377,43 +412,29 @@ class Visualizations:
                 selected_metrics
             )
             
-            # Box plot by position
-            fig_box = px.box(
-                self.data,
-                x='position_group',
-                y=selected_metric,
-                title=f"{selected_metric.replace('_', ' ').title()} by Position Group",
-                color='position_group',
-                color_discrete_sequence=px.colors.qualitative.Set3
-            )
-            
-            fig_box.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white'),
-                xaxis_title="Position Group",
-                yaxis_title=selected_metric.replace('_', ' ').title()
-            )
+            # Box plot by position from precomputed quartiles
+            def build_fig_box():
+                fig_box = self._box_from_stats(
+                    table.group_stats(selected_metric),
+                    f"{selected_metric.replace('_', ' ').title()} by Position Group"
+                )
+                
+                fig_box.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white'),
+                    xaxis_title="Position Group",
+                    yaxis_title=selected_metric.replace('_', ' ').title()
+                )
+                return fig_box
             
+            fig_box = figure_cache.figure('combine_position_boxes', self.data_version, selected_metric, build_fig_box)
             st.plotly_chart(fig_box, width='stretch')
         
         # Performance percentiles
         st.markdown("#### 🎯 Performance Percentiles")
         
-        percentiles = [10, 25, 50, 75, 90]
-        percentile_data = []
-        
-        for metric in selected_metrics:
-            metric_percentiles = self.data[metric].quantile([p/100 for p in percentiles])
-            for i, p in enumerate(percentiles):
-                percentile_data.append({
-                    'Metric': metric.replace('_', ' ').title(),
-                    'Percentile': f"{p}th",
-                    'Value': metric_percentiles.iloc[i]
-                })
-        
-        percentile_df = pd.DataFrame(percentile_data)
-        percentile_pivot = percentile_df.pivot(index='Metric', columns='Percentile', values='Value')
+        percentile_pivot = table.percentile_table(selected_metrics)
         
         st.dataframe(percentile_pivot.round(3), width='stretch')
     
@@ -428,53 +449,58 @@ class Visualizations:
             st.error("Need at least 2 numeric columns for correlation analysis.")
             return
         
-        # Correlation matrix
-        correlation_data = self.data[numeric_cols].corr()
-        
-        # Heatmap
-        fig_heatmap = px.imshow(
-            correlation_data.values,
-            x=correlation_data.columns,
-            y=correlation_data.index,
-            color_continuous_scale='RdBu',
-            aspect='auto',
-            title="Correlation Matrix Heatmap",
-            zmin=-1,
-            zmax=1
+        # Correlation options
+        col_method, col_missing = st.columns(2)
+        with col_method:
+            method = st.selectbox("Correlation Method", ["Pearson", "Spearman"], key="corr_method")
+        with col_missing:
+            missing = st.selectbox("Missing Values", ["Pairwise Complete", "Complete Rows Only"], key="corr_missing")
+        
+        # Correlation matrix (single vectorized kernel, cached per data version)
+        correlation_data = cached_correlation(
+            self.data,
+            data_version(self.data[numeric_cols]),
+            tuple(numeric_cols),
+            method.lower(),
+            missing == "Pairwise Complete"
         )
         
-        fig_heatmap.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
-            height=600
-        )
+        # Heatmap
+        def build_fig_heatmap():
+            fig_heatmap = px.imshow(
+                correlation_data.values,
+                x=correlation_data.columns,
+                y=correlation_data.index,
+                color_continuous_scale='RdBu',
+                aspect='auto',
+                title="Correlation Matrix Heatmap",
+                zmin=-1,
+                zmax=1
+            )
+            
+            fig_heatmap.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='white'),
+                height=600
+            )
+            return fig_heatmap
         
+        fig_heatmap = figure_cache.figure('correlation_heatmap', self.data_version, (tuple(numeric_cols), method, missing), build_fig_heatmap)
         st.plotly_chart(fig_heatmap, width='stretch')
         
         # Strong correlations
         st.markdown("#### 🔍 Strong Correlations")
         
-        strong_corr = []
-        for i in range(len(correlation_data.columns)):
-            for j in range(i+1, len(correlation_data.columns)):
-                corr_val = correlation_data.iloc[i, j]
-                if abs(corr_val) > 0.3:  # Threshold for "strong" correlation
-                    strong_corr.append({
-                        'Variable 1': correlation_data.columns[i],
-                        'Variable 2': correlation_data.columns[j],
-                        'Correlation': corr_val,
-                        'Strength': 'Strong' if abs(corr_val) > 0.7 else 'Moderate'
-                    })
-        
-        if strong_corr:
-            strong_corr_df = pd.DataFrame(strong_corr).sort_values('Correlation', key=abs, ascending=False)
-            st.dataframe(strong_corr_df.round(3), width='stretch')
+        strong_corr = strong_pairs(correlation_data, threshold=0.3)
+        
+        if not strong_corr.empty:
+            st.dataframe(strong_corr.round(3), width='stretch')
         else:
             st.info("No strong correlations found (threshold: |r| > 0.3)")
         
         # Scatter plot for selected correlation
-        if strong_corr:
+        if not strong_corr.empty:
             st.markdown("#### 📊 Correlation Visualization")
             
             col1, col2 = st.columns([3, 1])
@@ -485,28 +511,26 @@ class Visualizations:
                 var2 = st.selectbox("Select Y Variable", [col for col in numeric_cols if col != var1])
             
             with col1:
-                # Create scatter plot
-                fig_scatter = px.scatter(
+                # Look up correlation from the cached matrix
+                corr_val = correlation_data.loc[var1, var2]
+                
+                # Create scatter plot (WebGL and downsampled on large datasets, trendline fit on all rows)
+                render_scatter(
                     self.data,
                     x=var1,
                     y=var2,
+                    key="correlation_scatter",
+                    layout=dict(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white'),
+                        title=f"Correlation: {var1.title()} vs {var2.title()} (r = {corr_val:.3f})"
+                    ),
+                    trendline=True,
+                    version=self.data_version,
                     color='position_group' if 'position_group' in self.data.columns else None,
-                    title=f"Correlation: {var1.title()} vs {var2.title()}",
-                    hover_data=['name'] if 'name' in self.data.columns else None,
-                    trendline="ols"
-                )
-                
-                # Calculate correlation
-                corr_val = self.data[var1].corr(self.data[var2])
-                
-                fig_scatter.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white'),
-                    title=f"Correlation: {var1.title()} vs {var2.title()} (r = {corr_val:.3f})"
+                    hover_data=['name'] if 'name' in self.data.columns else None
                 )
-                
-                st.plotly_chart(fig_scatter, width='stretch')
     
     def render_performance_trends(self):
         """Render performance trends analysis."""
@@ -527,24 +551,22 @@ class Visualizations:
             position_stats.columns = ['Count', 'Mean Grade', 'Std Dev', 'Min Grade', 'Max Grade']
             st.dataframe(position_stats, width='stretch')
             
-            # Position performance chart
-            fig_pos = px.box(
-                self.data,
-                x='position_group',
-                y='grade',
-                title="Grade Distribution by Position Group",
-                color='position_group',
-                color_discrete_sequence=px.colors.qualitative.Set3
-            )
+            # Position performance chart from the cached percentile table
+            table = percentile_table(self.data, self.data_version, 'position_group')
             
-            fig_pos.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white'),
-                xaxis_title="Position Group",
-                yaxis_title="Grade"
-            )
+            def build_fig_pos():
+                fig_pos = self._box_from_stats(table.group_stats('grade'), "Grade Distribution by Position Group")
+                
+                fig_pos.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white'),
+                    xaxis_title="Position Group",
+                    yaxis_title="Grade"
+                )
+                return fig_pos
             
+            fig_pos = figure_cache.figure('trends_position_boxes', self.data_version, None, build_fig_pos)
             st.plotly_chart(fig_pos, width='stretch')
         
         # College performance analysis
@@ -562,22 +584,25 @@ class Visualizations:
             top_colleges = college_stats[college_stats['Player Count'] >= 3].sort_values('Avg Grade', ascending=False).head(15)
             
             if not top_colleges.empty:
-                fig_college = px.bar(
-                    x=top_colleges.index,
-                    y=top_colleges['Avg Grade'],
-                    title="Top Colleges by Average Grade (Min 3 Players)",
-                    color=top_colleges['Avg Grade'],
-                    color_continuous_scale='Viridis'
-                )
-                
-                fig_college.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white'),
-                    xaxis_title="College",
-                    yaxis_title="Average Grade"
-                )
+                def build_fig_college():
+                    fig_college = px.bar(
+                        x=top_colleges.index,
+                        y=top_colleges['Avg Grade'],
+                        title="Top Colleges by Average Grade (Min 3 Players)",
+                        color=top_colleges['Avg Grade'],
+                        color_continuous_scale='Viridis'
+                    )
+                    
+                    fig_college.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white'),
+                        xaxis_title="College",
+                        yaxis_title="Average Grade"
+                    )
+                    return fig_college
                 
+                fig_college = figure_cache.figure('trends_top_colleges', self.data_version, None, build_fig_college)
                 st.plotly_chart(fig_college, width='stretch')
                 
                 st.dataframe(top_colleges, width='stretch')
@@ -609,20 +634,50 @@ class Visualizations:
             
             physical_performance.columns = ['Count', 'Mean Grade', 'Std Dev']
             
-            fig_physical = px.bar(
-                x=physical_performance.index,
-                y=physical_performance['Mean Grade'],
-                title=f"Performance by {selected_physical.replace('_', ' ').title()} Range",
-                color=physical_performance['Mean Grade'],
-                color_continuous_scale='Plasma'
-            )
-            
-            fig_physical.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white'),
-                xaxis_title=f"{selected_physical.replace('_', ' ').title()} Range",
-                yaxis_title="Average Grade"
-            )
+            def build_fig_physical():
+                fig_physical = px.bar(
+                    x=physical_performance.index,
+                    y=physical_performance['Mean Grade'],
+                    title=f"Performance by {selected_physical.replace('_', ' ').title()} Range",
+                    color=physical_performance['Mean Grade'],
+                    color_continuous_scale='Plasma'
+                )
+                
+                fig_physical.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white'),
+                    xaxis_title=f"{selected_physical.replace('_', ' ').title()} Range",
+                    yaxis_title="Average Grade"
+                )
+                return fig_physical
             
+            fig_physical = figure_cache.figure('trends_physical_bins', self.data_version, selected_physical, build_fig_physical)
             st.plotly_chart(fig_physical, width='stretch')
+    
+    def _box_from_stats(self, group_stats: pd.DataFrame, title: str) -> go.Figure:
+        """Build a grouped box plot from precomputed percentile rows instead of raw points."""
+        group_stats = group_stats[group_stats['count'] > 0]
+        iqr = group_stats['p75'] - group_stats['p25']
+        group_stats = group_stats.assign(
+            lowerfence=np.maximum(group_stats['min'], group_stats['p25'] - 1.5 * iqr),
+            upperfence=np.minimum(group_stats['max'], group_stats['p75'] + 1.5 * iqr)
+        )
+        
+        fig_box = go.Figure()
+        colors = px.colors.qualitative.Set3
+        for i, (group, stats_row) in enumerate(group_stats.iterrows()):
+            fig_box.add_trace(go.Box(
+                name=group,
+                x=[group],
+                q1=[stats_row['p25']],
+                median=[stats_row['p50']],
+                q3=[stats_row['p75']],
+                lowerfence=[stats_row['lowerfence']],
+                upperfence=[stats_row['upperfence']],
+                mean=[stats_row['mean']],
+                marker_color=colors[i % len(colors)]
+            ))
+        
+        fig_box.update_layout(title=title)
+        return fig_box